@@ -0,0 +1,43 @@
+"""
+Cold start: a fresh interpreter from launch until the tray is visible and
+the first session list has been published, with the simulated backend.
+
+    python -m benchmarks.bench_coldstart
+"""
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.common import summarize
+
+ROUNDS = 5
+
+CHILD = """
+import asyncio
+import np.main
+from np import core
+
+async def amain(app):
+    await core.setupQLoop()
+    tray = np.main.AppTray(app)
+    tray.media.onUpdateMediaSessions.connect(lambda _: app.quit())
+
+np.main.amain = amain
+np.main.main()
+"""
+
+
+def run() -> dict:
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", MEDIA_BACKEND="simulated")
+    samples = []
+    for _ in range(ROUNDS):
+        t = time.perf_counter()
+        subprocess.run([sys.executable, "-c", CHILD], env=env, check=True, capture_output=True)
+        samples.append(time.perf_counter() - t)
+    return summarize(samples)
+
+
+if __name__ == "__main__":
+    r = run()
+    print(f"cold start p50={r['p50_us'] / 1000:.1f}ms max={r['max_us'] / 1000:.1f}ms")
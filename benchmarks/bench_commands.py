@@ -0,0 +1,64 @@
+"""
+Click bursts against a slow player: backend calls made per burst and
+time until the last command has run.
+
+    python -m benchmarks.bench_commands
+"""
+import asyncio
+import random
+import time
+
+from benchmarks.common import summarize
+
+from np.backends.simulated import SimulatedBackend
+from np.media import Media
+from np.tracing import tracer
+
+BURSTS = 20
+CLICKS = 10
+LATENCY = 0.02
+# clicks come in faster than the player answers
+CLICK_INTERVAL = 0.005
+
+
+async def bench(kinds: str) -> dict:
+    backend = SimulatedBackend(sessions=1, thumbnailSize=0, latency=LATENCY)
+    media = Media(backend)
+    await media.start()
+    appId = next(iter(media.mediaSessions))
+    clicks = {"p": media.prev, "t": media.pausePlay, "n": media.next}
+    rng = random.Random(0)
+    tracer.reset()
+
+    samples = []
+    for _ in range(BURSTS):
+        t = time.perf_counter()
+        for _ in range(CLICKS):
+            clicks[rng.choice(kinds)](appId)
+            await asyncio.sleep(CLICK_INTERVAL)
+        await media.commands.drain()
+        samples.append(time.perf_counter() - t)
+
+    stats = media.commands.stats
+    media.releaseAll()
+    return {
+        "issued": stats.issued,
+        "calls": stats.calls,
+        "max_depth": stats.maxDepth,
+        "burst": summarize(samples),
+        "wait": tracer.histograms["command.wait"].toDict() if "command.wait" in tracer.histograms else {},
+    }
+
+
+def run() -> dict:
+    async def main():
+        return {name: await bench(kinds) for name, kinds in (("toggle", "t"), ("skip", "pn"), ("mixed", "tpn"))}
+    return asyncio.run(main())
+
+
+if __name__ == "__main__":
+    for name, r in run().items():
+        print(
+            f"{name:<8} {r['issued']:>4} clicks -> {r['calls']:>4} calls, max depth {r['max_depth']},"
+            f" burst p50={r['burst']['p50_us'] / 1000:.1f}ms wait p95={r['wait'].get('p95_us', 0) / 1000:.1f}ms"
+        )
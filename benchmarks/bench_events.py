@@ -0,0 +1,214 @@
+"""
+Event to pixel: time from a backend playback-changed callback until the
+list item has been updated and the window has repainted. And an event
+storm, counting how often the list repaints. And the Python allocations a playback event costs on its
+way into the store.
+
+    python -m benchmarks.bench_events
+"""
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QWidget
+
+from benchmarks.common import SIZES, qapp, summarize
+
+from np.backends.simulated import SimulatedBackend
+from np.media import Media
+from np.widgets.NowPlayingList import NowPlayingList
+from np.widgets.NowPlayingListView import NowPlayingListView
+
+ROUNDS = 300
+STORM_RATE = 2000
+STORM_DURATION = 1.0
+ALLOC_ROUNDS = 1000
+
+
+async def bench(cls, n: int) -> dict[str, float]:
+    app = qapp()
+    backend = SimulatedBackend(sessions=n, thumbnailSize=0)
+    media = Media(backend)
+    lst = cls(media.store)
+    lst.resize(600, 260)
+    media.store.changed.connect(lambda d: lst.refresh(d.key, d.fields))
+    await media.start()
+    for app_id in media.mediaSessions:
+        lst.addApp(app_id)
+    lst.show()
+    app.processEvents()
+
+    session = backend.simSessions[next(iter(backend.simSessions))]
+    samples = []
+    for _ in range(ROUNDS):
+        session.flipStatus()
+        t = time.perf_counter()
+        session.emitPlayback()
+        # Media hands the event to the loop
+        await asyncio.sleep(0)
+        lst.flush()
+        lst.repaint()
+        samples.append(time.perf_counter() - t)
+
+    lst.hide()
+    media.releaseAll()
+    lst.deleteLater()
+    app.processEvents()
+    return summarize(samples)
+
+
+class PaintCounter(QObject):
+    """paint events of a widget and its children, and the event loop passes that had any"""
+
+    def __init__(self, root: QWidget):
+        super().__init__()
+        self.root = root
+        self.paints = 0
+        self.passes = 0
+        self.painted = False
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and isinstance(obj, QWidget) and (obj is self.root or self.root.isAncestorOf(obj)):
+            self.paints += 1
+            self.painted = True
+        return False
+
+    def endPass(self):
+        self.passes += self.painted
+        self.painted = False
+
+
+async def benchStorm(cls, n: int) -> dict:
+    app = qapp()
+    backend = SimulatedBackend(sessions=n, thumbnailSize=0, eventsPerTrackChange=1)
+    media = Media(backend)
+    lst = cls(media.store)
+    lst.resize(600, 260)
+    media.store.changed.connect(lambda d: lst.refresh(d.key, d.fields))
+    await media.start()
+    for app_id in media.mediaSessions:
+        lst.addApp(app_id)
+    lst.show()
+    app.processEvents()
+
+    events = 0
+    emit = backend.randomEvent
+
+    def counted():
+        nonlocal events
+        events += 1
+        emit()
+
+    backend.randomEvent = counted
+    counter = PaintCounter(lst)
+    app.installEventFilter(counter)
+    t = time.perf_counter()
+    storm = backend.storm(rate=STORM_RATE, duration=STORM_DURATION)
+    # asyncio.run does not run Qt's event loop, pump it for timers and paints
+    while not storm.done():
+        app.processEvents()
+        counter.endPass()
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - t
+    app.removeEventFilter(counter)
+
+    lst.hide()
+    media.releaseAll()
+    lst.deleteLater()
+    app.processEvents()
+    return {
+        "events": events,
+        "paints": counter.paints,
+        "repaints": counter.passes,
+        "repaints_per_second": counter.passes / elapsed,
+    }
+
+
+def recordSize(record) -> int:
+    """bytes of a record including its instance __dict__, if it has one"""
+    size = sys.getsizeof(record)
+    if hasattr(record, "__dict__"):
+        size += sys.getsizeof(record.__dict__)
+    return size
+
+
+class InlineLoop:
+    """stands in for the event loop, runs what Media hands over to it right away"""
+
+    def call_soon_threadsafe(self, callback, *args):
+        callback(*args)
+
+
+async def benchAllocations() -> dict:
+    """
+    Playback events from the backend callback into the store, "repeat" events
+    report the state the session already has, "toggle" events a new one.
+    Media hands events to the loop, which runs them inline here so the
+    loop's own bookkeeping is left out. tracemalloc sees Python allocations
+    only: the peak above the live heap during one event, and the net bytes
+    still held after all rounds.
+    Every changed event also writes a fresh timeline, one more store write.
+    """
+    backend = SimulatedBackend(sessions=1, thumbnailSize=0)
+    media = Media(backend)
+    await media.start()
+    media.loop = InlineLoop()
+    session = next(iter(backend.simSessions.values()))
+    result = {"record_bytes": recordSize(media.store.get(session.key).playback)}
+    for name, toggle in (("repeat", False), ("toggle", True)):
+        version = media.store.version
+        peak = 0
+        tracemalloc.start()
+        start, _ = tracemalloc.get_traced_memory()
+        for _ in range(ALLOC_ROUNDS):
+            if toggle:
+                session.flipStatus()
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            session.emitPlayback()
+            _, top = tracemalloc.get_traced_memory()
+            peak += top - before
+        end, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result[name] = {
+            "peak_bytes": peak / ALLOC_ROUNDS,
+            "net_bytes": (end - start) / ALLOC_ROUNDS,
+            "store_writes": (media.store.version - version) / ALLOC_ROUNDS,
+        }
+    media.loop = asyncio.get_running_loop()
+    media.releaseAll()
+    return result
+
+
+def run() -> dict:
+    async def main():
+        return {
+            cls.__name__: {str(n): await bench(cls, n) for n in SIZES}
+            for cls in (NowPlayingList, NowPlayingListView)
+        } | {
+            f"storm.{cls.__name__}": {str(n): await benchStorm(cls, n) for n in SIZES}
+            for cls in (NowPlayingList, NowPlayingListView)
+        } | {
+            "allocations": await benchAllocations(),
+        }
+    return asyncio.run(main())
+
+
+if __name__ == "__main__":
+    results = run()
+    a = results.pop("allocations")
+    for name, sizes in results.items():
+        for n, r in sizes.items():
+            if name.startswith("storm."):
+                print(
+                    f"{name:<26} n={n:>5} {r['events']} events -> {r['repaints']} repaints"
+                    f" ({r['repaints_per_second']:.0f}/s), {r['paints']} widget paints"
+                )
+            else:
+                print(f"{name:<26} n={n:>5} p50={r['p50_us']:.1f}us p95={r['p95_us']:.1f}us")
+    print(f"playback record {a['record_bytes']}B")
+    for name in ("repeat", "toggle"):
+        r = a[name]
+        print(f"{name:<8} event peak={r['peak_bytes']:.0f}B net={r['net_bytes']:.1f}B store writes={r['store_writes']:.2f}")
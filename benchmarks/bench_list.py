@@ -0,0 +1,74 @@
+"""
+NowPlayingList lookups, updates and add/remove churn.
+
+    python -m benchmarks.bench_list
+"""
+import time
+from dataclasses import replace
+
+from benchmarks.common import SIZES, qapp, timed
+
+from np.media import Controls, MediaData, PlaybackData, PlaybackStatus
+from np.store import Store
+from np.widgets.NowPlayingList import NowPlayingList
+from np.widgets.NowPlayingListView import NowPlayingListView
+
+ROUNDS = 2000
+
+
+def bench(cls, n: int) -> dict[str, float]:
+    app = qapp()
+    store = Store()
+    lst = cls(store)
+    store.changed.connect(lambda d: lst.refresh(d.key, d.fields))
+    apps = [f"app{i}.exe" for i in range(n)]
+    for a in apps:
+        store.add(a)
+    results = {}
+
+    t = time.perf_counter()
+    for a in apps:
+        lst.addApp(a)
+    results["addApp_us"] = (time.perf_counter() - t) / n * 1e6
+
+    # the last item is the worst case for a linear scan
+    target = apps[-1]
+    playing = PlaybackData(app=target, playback_status=PlaybackStatus.PLAYING, controls=Controls.PLAY_PAUSE | Controls.NEXT | Controls.PREVIOUS)
+    records = [playing, replace(playing, playback_status=PlaybackStatus.PAUSED)]
+
+    def writePlayback():
+        # the store skips writing the record it already holds, alternate between two
+        records.reverse()
+        store.setPlayback(target, records[0])
+
+    m = MediaData(app=target, title="title", artist="artist", thumbnail=b"")
+    results["setPlayback_us"] = timed(writePlayback, ROUNDS)["mean_us"]
+    results["setMedia_us"] = timed(lambda: store.setMedia(target, m), ROUNDS)["mean_us"]
+    # updates are applied once per frame, this is the cost of applying one
+    results["flush_us"] = timed(lambda: (writePlayback(), lst.flush()), ROUNDS)["mean_us"]
+
+    t = time.perf_counter()
+    for a in apps:
+        lst.removeApp(a)
+    results["removeApp_us"] = (time.perf_counter() - t) / n * 1e6
+
+    lst.deleteLater()
+    app.processEvents()
+    return results
+
+
+def run() -> dict:
+    return {
+        cls.__name__: {str(n): bench(cls, n) for n in SIZES}
+        for cls in (NowPlayingList, NowPlayingListView)
+    }
+
+
+def main():
+    for name, sizes in run().items():
+        for n, r in sizes.items():
+            print(f"{name:<20} n={n:>5} " + " ".join(f"{k}={v:.2f}" for k, v in r.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+grabMediaProperties with and without a warm thumbnail cache, artwork
+decode + scale cost, and peak Python allocation per artwork change,
+by artwork size.
+
+    python -m benchmarks.bench_media
+"""
+import asyncio
+import time
+import tracemalloc
+
+from benchmarks.common import qapp, summarize, timed
+
+from np.artwork import scaleImage
+from np.backends.simulated import SimulatedBackend, SimulatedThumbnail, makePng
+from np.cache import ThumbnailCache
+from np.media import Media, MediaData
+
+IMAGE_SIZES = [128, 512, 1024, 2048]
+ROUNDS = 20
+
+
+async def benchGrab(size: int) -> dict:
+    backend = SimulatedBackend(sessions=1, thumbnailSize=size, distinctThumbnails=1)
+    media = Media(backend)
+    await media.start()
+    appId = next(iter(media.mediaSessions))
+    # artwork is generated once and cached by the simulator, keep that out of the numbers
+    makePng(size, 0)
+
+    cold = []
+    for _ in range(ROUNDS):
+        media.thumbnailCache = ThumbnailCache()
+        t = time.perf_counter()
+        await media.grabMediaProperties(appId)
+        cold.append(time.perf_counter() - t)
+    warm = []
+    for _ in range(ROUNDS):
+        t = time.perf_counter()
+        m = await media.grabMediaProperties(appId)
+        warm.append(time.perf_counter() - t)
+    media.releaseAll()
+    return {
+        "bytes": len(makePng(size, 0)),
+        "kept_bytes": len(m.thumbnail),
+        "downscaled": media.artworkStats.downscaled,
+        "cold": summarize(cold),
+        "warm": summarize(warm),
+    }
+
+
+def benchDecode(size: int) -> dict:
+    qapp()
+    data = makePng(size, 0)
+    return timed(lambda: scaleImage(data, 1.0), ROUNDS)
+
+
+def benchPeak(size: int) -> dict:
+    """
+    Read, cache and decode one new artwork, as a track change does.
+    "copy" converts the read buffer to bytes first, the way the thumbnail
+    used to be read, "inplace" hands the buffer on as it is.
+    tracemalloc only sees Python allocations, Qt's own decode buffers are not included.
+    """
+    qapp()
+    source = SimulatedThumbnail(SimulatedBackend(), makePng(size, 0))
+
+    async def change(copy: bool) -> int:
+        cache = ThumbnailCache(budget=64 * 1024 * 1024)
+        tracemalloc.start()
+        data = await source.read(len(source.data))
+        if copy:
+            data = bytes(data)
+        h, data = cache.put("app", "title", "artist", data)
+        m = MediaData(app="app", title="title", artist="artist", thumbnail=data, thumbnail_hash=h)
+        scaleImage(m.thumbnail, 1.0)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    return {
+        "copy_peak_bytes": asyncio.run(change(True)),
+        "inplace_peak_bytes": asyncio.run(change(False)),
+    }
+
+
+def run() -> dict:
+    async def grab():
+        return {str(s): await benchGrab(s) for s in IMAGE_SIZES}
+    return {
+        "grabMediaProperties": asyncio.run(grab()),
+        "decode": {str(s): benchDecode(s) for s in IMAGE_SIZES},
+        "peak": {str(s): benchPeak(s) for s in IMAGE_SIZES},
+    }
+
+
+if __name__ == "__main__":
+    r = run()
+    for s in IMAGE_SIZES:
+        g = r["grabMediaProperties"][str(s)]
+        d = r["decode"][str(s)]
+        p = r["peak"][str(s)]
+        print(
+            f"{s:>5}px {g['bytes']:>9}B kept={g['kept_bytes']:>7}B grab cold={g['cold']['p50_us']:.0f}us warm={g['warm']['p50_us']:.0f}us decode={d['p50_us']:.0f}us"
+            f" peak copy={p['copy_peak_bytes']}B inplace={p['inplace_peak_bytes']}B"
+        )
@@ -0,0 +1,35 @@
+import os
+import statistics
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("MEDIA_BACKEND", "simulated")
+
+from PySide6.QtWidgets import QApplication
+
+SIZES = [10, 100, 1000]
+
+
+def qapp() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """microsecond statistics for a list of durations in seconds"""
+    us = sorted(s * 1e6 for s in samples)
+    return {
+        "n": len(us),
+        "mean_us": statistics.fmean(us),
+        "p50_us": us[len(us) // 2],
+        "p95_us": us[min(len(us) - 1, int(len(us) * 0.95))],
+        "max_us": us[-1],
+    }
+
+
+def timed(fn, rounds: int) -> dict[str, float]:
+    samples = []
+    for _ in range(rounds):
+        t = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t)
+    return summarize(samples)
@@ -0,0 +1,95 @@
+"""
+Run every benchmark under the offscreen Qt platform against the simulated
+backend and write the results as JSON.
+
+    python -m benchmarks.run --out bench.json
+    python -m benchmarks.run --out new.json --compare old.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from benchmarks import bench_coldstart, bench_commands, bench_events, bench_list, bench_media
+from benchmarks.common import qapp
+
+SUITES = {
+    "list": bench_list.run,
+    "events": bench_events.run,
+    "media": bench_media.run,
+    "commands": bench_commands.run,
+    "coldstart": bench_coldstart.run,
+}
+
+
+def flatten(d: dict, prefix: str = "") -> dict[str, float]:
+    out = {}
+    for k, v in d.items():
+        key = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict):
+            out.update(flatten(v, key))
+        elif isinstance(v, (int, float)):
+            out[key] = v
+    return out
+
+
+def compare(new: dict, old: dict, threshold: float) -> int:
+    """print timings that got slower than threshold, returns how many did"""
+    a, b = flatten(old["results"]), flatten(new["results"])
+    regressions = 0
+    for key in sorted(a.keys() & b.keys()):
+        # tail latencies are too noisy to gate on
+        if not key.endswith("_us") or key.endswith(("max_us", "p95_us")) or a[key] <= 0:
+            continue
+        ratio = b[key] / a[key]
+        if ratio > threshold:
+            regressions += 1
+            print(f"REGRESSION {key}: {a[key]:.1f} -> {b[key]:.1f} ({ratio:.2f}x)")
+    return regressions
+
+
+def gitRevision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default="bench.json")
+    parser.add_argument("--only", nargs="*", choices=sorted(SUITES))
+    parser.add_argument("--compare", help="earlier results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    from PySide6 import __version__ as pyside_version
+    qapp()
+    results = {}
+    for name in args.only or SUITES:
+        t = time.perf_counter()
+        results[name] = SUITES[name]()
+        print(f"{name}: {time.perf_counter() - t:.1f}s", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "revision": gitRevision(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pyside": pyside_version,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            sys.exit(1 if compare(report, json.load(f), args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
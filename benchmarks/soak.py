@@ -0,0 +1,326 @@
+"""
+Soak test: the whole app against hours of simulated sessions coming and
+going, track changes, clicks and the window being shown and hidden.
+
+    python -m benchmarks.soak --duration 14400 --out soak.json
+    python -m benchmarks.soak --duration 120 --interval 10
+
+Churn runs for `interval` seconds, then the app is brought to the same
+resting state (`sessions` sessions, window shown, events settled) and
+sampled: the Python heap by allocation site (tracemalloc), live widgets
+and QObjects, registered backend event handlers and the size of every
+per-session table. At rest these do not depend on uptime, so once the
+warm-up samples have filled the caches nothing may keep growing. A metric
+whose second half of samples is above its first half by more than its
+allowance fails the run with exit status 1, and so does any unhandled
+exception in a task or a Qt slot.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from benchmarks.common import qapp
+
+import PySide6.QtAsyncio as QtAsyncio
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QApplication
+
+from np import core
+from np.artwork import artworkCache
+from np.main import AppTray
+from np.tracing import tracer
+
+# heap growth allowed between the two halves, whichever is larger
+HEAP_SLACK_BYTES = 512 * 1024
+HEAP_SLACK_RATIO = 0.02
+# seconds for coalesced refreshes, fetches and deleteLater to finish before sampling
+SETTLE = 2.0
+# seconds between churn actions
+STEP = 0.05
+# apps sessions are drawn from besides fresh ones, so keys get reused
+APP_POOL = 8
+TOP_SITES = 15
+
+
+def perSession(tray) -> dict[str, int]:
+    """every table keyed by session, at rest they only hold the live sessions"""
+    media, window = tray.media, tray.mainWindow
+    live = media.mediaSessions.keys() | {"*"}
+    tables = {
+        "media.sessions": media.mediaSessions,
+        "media.propsGeneration": media.propsGeneration,
+        "media.pendingRefresh": media._pendingPropsRefresh,
+        "media.burstStart": media._propsBurstStart,
+        "media.propsInFlight": media._propsInFlight,
+        "media.thumbnailsInFlight": media._thumbnailsInFlight,
+        "media.thumbnailRefs": media._thumbnailRefs,
+        "media.optimistic": media._optimistic,
+        "commands.queues": media.commands._queues,
+        "commands.workers": media.commands._workers,
+        "store": media.store,
+        "thumbnailCache": media.thumbnailCache._tracks,
+        "artwork.waiting": artworkCache._waiting,
+        "artwork.pixmaps": artworkCache._pixmaps,
+        # traces of live sessions stay open until their next event, those of gone ones must not
+        "tracer.orphaned": [t for t in tracer._open if t[1] not in live],
+        "thumbnailCache.orphaned": [t for t in media.thumbnailCache._tracks if t[0] not in live],
+        "window.hiddenDirty": window.hiddenDirty,
+        "window.hiddenProps": window.hiddenProps,
+    }
+    return {name: len(t) for name, t in tables.items()}
+
+
+def measure(tray) -> dict:
+    roots = (tray, tray.media, tray.mainWindow, artworkCache)
+    heap, _ = tracemalloc.get_traced_memory()
+    return {
+        "heap_bytes": heap,
+        "widgets": len(QApplication.allWidgets()),
+        "qobjects": sum(1 + len(r.findChildren(QObject)) for r in roots),
+        "event_handlers": tray.media.backend.subscriptions(),
+        "tasks": len(asyncio.all_tasks()),
+        **perSession(tray),
+    }
+
+
+def takeSnapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        tracemalloc.Filter(False, "<unknown>"),
+        # the samples kept by the soak itself
+        tracemalloc.Filter(False, __file__),
+    ))
+
+
+def growth(values: list[float]) -> float:
+    """median of the second half of the samples minus median of the first half"""
+    half = len(values) // 2
+    first, second = sorted(values[:half]), sorted(values[half:])
+    return second[len(second) // 2] - first[len(first) // 2]
+
+
+def allowance(name: str, values: list[float], limits: dict[str, int]) -> float:
+    if name == "heap_bytes":
+        return max(HEAP_SLACK_BYTES, HEAP_SLACK_RATIO * min(values))
+    if name in limits:
+        # a bounded cache may fill up to its limit
+        return limits[name] - min(values)
+    # counts at rest are exact
+    return 0
+
+
+class Errors:
+    """unhandled exceptions of tasks and Qt slots, counted and then printed as before"""
+
+    def __init__(self):
+        self.count = 0
+        # exception type -> count
+        self.kinds: dict[str, int] = {}
+
+    def install(self, loop: asyncio.AbstractEventLoop):
+        previous = loop.get_exception_handler()
+        hook = sys.excepthook
+
+        # asyncio passes (loop, context), QtAsyncio only the context
+        def onLoopError(*args):
+            context = args[-1]
+            exc = context.get("exception")
+            if context.get("message") and not isinstance(exc, asyncio.CancelledError):
+                self.add(exc)
+            if previous is not None:
+                previous(*args)
+            else:
+                loop.default_exception_handler(context)
+
+        def onSlotError(kind, exc, tb):
+            self.add(exc)
+            hook(kind, exc, tb)
+
+        loop.set_exception_handler(onLoopError)
+        sys.excepthook = onSlotError
+
+    def add(self, exc: BaseException | None):
+        self.count += 1
+        name = type(exc).__name__ if exc is not None else "unknown"
+        self.kinds[name] = self.kinds.get(name, 0) + 1
+
+
+class Soak:
+    def __init__(self, tray, args, errors: Errors):
+        self.tray = tray
+        self.args = args
+        self.errors = errors
+        self.backend = tray.media.backend
+        self.rng = random.Random(args.seed)
+        self.actions = 0
+
+    async def churn(self, seconds: float):
+        media, backend, rng = self.tray.media, self.backend, self.rng
+        storm = backend.storm(rate=self.args.rate)
+        end = time.monotonic() + seconds
+        try:
+            while time.monotonic() < end:
+                self.actions += 1
+                keys = list(backend.simSessions)
+                action = rng.random()
+                if action < 0.2 or not keys:
+                    # a fresh app, or one more session of a known app
+                    backend.spawn(1, None if rng.random() < 0.5 else f"soak{rng.randrange(APP_POOL)}.exe")
+                elif action < 0.4 and len(keys) > 1:
+                    backend.close(rng.choice(keys))
+                elif action < 0.7:
+                    rng.choice((media.prev, media.pausePlay, media.next))(rng.choice(keys))
+                elif action < 0.75:
+                    window = self.tray.mainWindow
+                    if window.isVisible():
+                        window.hide()
+                    else:
+                        window.show()
+                await asyncio.sleep(STEP)
+        finally:
+            storm.cancel()
+
+    async def rest(self):
+        """the same state before every sample, whatever the churn left behind"""
+        backend, rng = self.backend, self.rng
+        while len(backend.simSessions) > self.args.sessions:
+            backend.close(rng.choice(list(backend.simSessions)))
+        missing = self.args.sessions - len(backend.simSessions)
+        if missing > 0:
+            backend.spawn(missing)
+        self.tray.mainWindow.show()
+        await self.tray.media.commands.drain()
+        await asyncio.sleep(SETTLE)
+        gc.collect()
+
+    async def run(self) -> dict:
+        args = self.args
+        await self.tray.prewarm()
+        await self.rest()
+        tracemalloc.start(args.frames)
+        samples, baseline = [], None
+        start = time.monotonic()
+        while not samples or time.monotonic() - start < args.duration:
+            await self.churn(args.interval)
+            await self.rest()
+            sample = {
+                "uptime": round(time.monotonic() - start, 1),
+                "actions": self.actions,
+                "errors": self.errors.count,
+                **measure(self.tray),
+            }
+            samples.append(sample)
+            if len(samples) == args.warmup:
+                baseline = takeSnapshot()
+            print(
+                f"{sample['uptime']:>8.0f}s heap={sample['heap_bytes'] / 1024:.0f}KiB widgets={sample['widgets']}"
+                f" qobjects={sample['qobjects']} handlers={sample['event_handlers']} tasks={sample['tasks']}"
+                f" errors={sample['errors']}",
+                file=sys.stderr,
+            )
+        final = takeSnapshot()
+        tracemalloc.stop()
+        return report(samples, args.warmup, baseline, final, self.limits(), self.errors)
+
+    def limits(self) -> dict[str, int]:
+        return {"thumbnailCache": self.tray.media.thumbnailCache.maxTracks, "artwork.pixmaps": artworkCache.maxEntries}
+
+
+def report(
+    samples: list[dict],
+    warmup: int,
+    baseline: tracemalloc.Snapshot | None,
+    final: tracemalloc.Snapshot,
+    limits: dict[str, int],
+    errors: Errors,
+) -> dict:
+    steady = samples[warmup:]
+    metrics, failed = {}, []
+    if len(steady) >= 2:
+        for name in steady[0]:
+            if name in ("uptime", "actions", "errors"):
+                continue
+            values = [s[name] for s in steady]
+            grew, allowed = growth(values), allowance(name, values, limits)
+            metrics[name] = {"first": values[0], "last": values[-1], "growth": grew, "allowed": allowed}
+            if grew > allowed:
+                failed.append(name)
+    sites = []
+    if baseline is not None:
+        for stat in final.compare_to(baseline, "traceback")[:TOP_SITES]:
+            frame = stat.traceback[0]
+            sites.append({
+                "site": f"{frame.filename}:{frame.lineno}",
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+                "traceback": stat.traceback.format(),
+            })
+    if errors.count:
+        # during warm-up too, an exception is a failure whenever it happens
+        failed.append("errors")
+    return {
+        "samples": samples,
+        "metrics": metrics,
+        "sites": sites,
+        "errors": {"count": errors.count, "kinds": errors.kinds},
+        "failed": failed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=3600, help="seconds of churn in total")
+    parser.add_argument("--interval", type=float, default=60, help="seconds of churn between samples")
+    parser.add_argument("--sessions", type=int, default=10, help="sessions left at every sample")
+    parser.add_argument("--rate", type=float, default=200, help="session events per second during churn")
+    parser.add_argument("--warmup", type=int, default=2, help="samples taken before growth is counted")
+    parser.add_argument("--frames", type=int, default=4, help="traceback depth of allocation sites")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="soak.json")
+    args = parser.parse_args()
+
+    app = qapp()
+    app.setQuitOnLastWindowClosed(False)
+
+    result = {}
+
+    async def soak():
+        await core.setupQLoop()
+        errors = Errors()
+        errors.install(asyncio.get_running_loop())
+        # benchmarks.common selects the simulated backend the tray builds
+        tray = AppTray(app)
+        tray.media.backend.rng.seed(args.seed)
+        # wait for startMedia
+        while tray.media.backend.onSessionsChanged is None:
+            await asyncio.sleep(0.01)
+        try:
+            result.update(await Soak(tray, args, errors).run())
+        finally:
+            # the same way out as the tray's Quit, aboutToQuit releases everything
+            app.quit()
+
+    QtAsyncio.run(soak(), handle_sigint=True)
+    with open(args.out, "w") as f:
+        json.dump(result, f, indent=2)
+
+    for name, m in result["metrics"].items():
+        flag = "GROWING" if name in result["failed"] else "ok"
+        print(f"{name:<28}{m['first']:>12}{m['last']:>12}  growth={m['growth']:<10g} {flag}")
+    errors = result["errors"]
+    print(f"{'errors':<28}{errors['count']:>24}  {errors['kinds'] or ''} {'FAILED' if errors['count'] else 'ok'}")
+    if set(result["failed"]) - {"errors"}:
+        print("\nallocation sites that grew the most since the warm-up:")
+        for s in result["sites"]:
+            print(f"  {s['size_diff']:>+10}B {s['count_diff']:>+7} blocks  {s['site']}")
+    sys.exit(1 if result["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,27 @@
 import os
 import pathlib
+import sys
 
-import np.icons  # noqa: F401
+from np import profiling
+
+PROFILE_STARTUP = bool(os.getenv("PROFILE_STARTUP", False)) or "--profile-startup" in sys.argv
+if PROFILE_STARTUP:
+    profiling.enable()
 
 CONFIG_DIR = pathlib.Path.home() / ".raffleberry" / "now-playing"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 ROOT_DIR = pathlib.Path.cwd()
 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+profiling.mark("np.config_dir")
 DEV = bool(os.getenv("DEV", False))
+# where sessions come from, "windows" or "simulated"
+MEDIA_BACKEND = os.getenv("MEDIA_BACKEND", "windows")
+# paint sessions with a model/view list instead of one widget per session
+VIRTUAL_LIST = bool(os.getenv("VIRTUAL_LIST", False))
+STARTUP_PROFILE_FILE = CONFIG_DIR / "startup-profile.json"
+LATENCY_FILE = CONFIG_DIR / "latency.json"
+# artwork streams larger than this are not read at all
+ARTWORK_MAX_BYTES = int(os.getenv("ARTWORK_MAX_BYTES", 8 * 1024 * 1024))
+# build the main window in the background once the tray is up
+PREWARM = bool(os.getenv("PREWARM", False))
 
@@ -0,0 +1,178 @@
+from collections import OrderedDict
+from typing import Callable
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage, QPixmap, Qt
+
+from np.cache import contentHash
+
+ARTWORK_SIZE = 120
+# highest device pixel ratio artwork is kept sharp for after downscaleArtwork
+ARTWORK_MAX_DPR = 2.0
+DECODE_THREADS = 2
+
+
+def scaleImage(data: bytes | bytearray, dpr: float) -> QImage:
+    """decode and downscale to the artwork slot, safe to call off the GUI thread"""
+    side = round(ARTWORK_SIZE * dpr)
+    image = QImage()
+    if data:
+        image.loadFromData(data)
+    if image.isNull():
+        return image
+    if image.width() > side or image.height() > side:
+        image = image.scaled(side, side, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    # the format QPixmap uses anyway, so fromImage does not convert a second time
+    fmt = QImage.Format.Format_ARGB32_Premultiplied if image.hasAlphaChannel() else QImage.Format.Format_RGB32
+    return image.convertToFormat(fmt)
+
+
+def downscaleArtwork(data: bytes | bytearray) -> bytes | None:
+    """
+    Large artwork shrunk to what the slot can show at ARTWORK_MAX_DPR and
+    encoded as PNG again, None if it cannot be decoded. Safe off the GUI thread.
+    """
+    image = scaleImage(data, ARTWORK_MAX_DPR)
+    if image.isNull():
+        return None
+    encoded = QByteArray()
+    buffer = QBuffer(encoded)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    buffer.close()
+    return encoded.data()
+
+
+class _DecodeJob(QRunnable):
+    def __init__(self, cache: "ArtworkCache", key: tuple[str, float], data: bytes | bytearray):
+        super().__init__()
+        self.cache = cache
+        self.key = key
+        self.data = data
+
+    def run(self):
+        if not self.cache.isWanted(self.key):
+            # superseded while queued
+            self.cache._finished.emit(self.key[0], self.key[1], QImage(), False)
+            return
+        image = scaleImage(self.data, self.key[1])
+        self.cache._finished.emit(self.key[0], self.key[1], image, True)
+
+
+class ArtworkCache(QObject):
+    """
+    Decoded artwork, already scaled to the artwork slot.
+
+    Keyed by thumbnail hash and device pixel ratio, so every item showing
+    the same image shares one pixmap and nothing is decoded or scaled twice.
+    Decoding runs on a small thread pool, only the scaled QImage comes back
+    to the GUI thread to become a pixmap.
+    """
+
+    _finished = Signal(str, float, QImage, bool)
+
+    def __init__(self, maxEntries: int = 64):
+        super().__init__()
+        self.maxEntries = maxEntries
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+        self._pixmaps: OrderedDict[tuple[str, float], QPixmap] = OrderedDict()
+        # target -> (key, data, callback) of the artwork it is waiting for, the data to decode again
+        # if the job for the key gave up before the target asked
+        self._waiting: dict[str, tuple[tuple[str, float], bytes | bytearray, Callable[[QPixmap], None]]] = {}
+        self._decoding: set[tuple[str, float]] = set()
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(DECODE_THREADS)
+        self._finished.connect(self._onFinished)
+
+    def cached(self, thumbnail_hash: str, dpr: float) -> QPixmap | None:
+        key = (thumbnail_hash, dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def pixmap(self, data: bytes | bytearray, thumbnail_hash: str = "", dpr: float = 1.0) -> QPixmap:
+        """decode on the calling thread, for callers that cannot wait"""
+        if data and not thumbnail_hash:
+            thumbnail_hash = contentHash(data)
+        pixmap = self.cached(thumbnail_hash, dpr)
+        if pixmap is not None:
+            self.hits += 1
+            return pixmap
+        self.misses += 1
+        return self._store((thumbnail_hash, dpr), scaleImage(data, dpr))
+
+    def request(
+        self, target: str, data: bytes | bytearray, thumbnail_hash: str, dpr: float, callback: Callable[[QPixmap], None]
+    ) -> QPixmap | None:
+        """
+        The pixmap if it is ready, otherwise None and callback(pixmap) once decoded.
+        A newer request from the same target replaces the older one.
+        """
+        if not data:
+            self._waiting.pop(target, None)
+            return self.pixmap(b"", "", dpr)
+        if not thumbnail_hash:
+            thumbnail_hash = contentHash(data)
+        key = (thumbnail_hash, dpr)
+        pixmap = self.cached(thumbnail_hash, dpr)
+        if pixmap is not None:
+            self.hits += 1
+            self._waiting.pop(target, None)
+            return pixmap
+        self.misses += 1
+        self._waiting[target] = (key, data, callback)
+        if key not in self._decoding:
+            self._decode(key, data)
+        return None
+
+    def cancel(self, target: str):
+        self._waiting.pop(target, None)
+
+    def shutdown(self):
+        """drop queued decodes and wait for running ones"""
+        self._waiting.clear()
+        self.pool.clear()
+        self.pool.waitForDone()
+
+    def isWanted(self, key: tuple[str, float]) -> bool:
+        return any(k == key for k, _, _ in list(self._waiting.values()))
+
+    def _decode(self, key: tuple[str, float], data: bytes | bytearray):
+        self._decoding.add(key)
+        self.pool.start(_DecodeJob(self, key, data))
+
+    def _onFinished(self, thumbnail_hash: str, dpr: float, image: QImage, decoded: bool):
+        key = (thumbnail_hash, dpr)
+        self._decoding.discard(key)
+        waiters = [t for t, (k, _, _) in self._waiting.items() if k == key]
+        if not waiters:
+            self.dropped += 1
+            return
+        if not decoded:
+            # given up while queued, then requested again before this arrived
+            self._decode(key, self._waiting[waiters[0]][1])
+            return
+        pixmap = self._store(key, image)
+        for t in waiters:
+            _, _, callback = self._waiting.pop(t)
+            callback(pixmap)
+
+    def _store(self, key: tuple[str, float], image: QImage) -> QPixmap:
+        side = round(ARTWORK_SIZE * key[1])
+        if image.isNull():
+            pixmap = QPixmap(side, side)
+            pixmap.fill(Qt.GlobalColor.darkGray)
+        else:
+            pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(key[1])
+        self._pixmaps[key] = pixmap
+        if len(self._pixmaps) > self.maxEntries:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+
+artworkCache = ArtworkCache()
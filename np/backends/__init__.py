@@ -0,0 +1,153 @@
+"""
+Media backends: where sessions, their events and their artwork come from.
+
+`Media` only talks to these interfaces, `windows` wraps the
+GlobalSystemMediaTransportControls API and `simulated` is a scripted
+stand-in for running and load-testing everything else without Windows.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from np.media import PlaybackData, TimelineData
+
+# artwork is read in pieces of this size, a cancelled fetch stops between them
+READ_CHUNK = 64 * 1024
+
+
+class ArtworkTooLarge(OSError):
+    def __init__(self, size: int, maxBytes: int):
+        super().__init__(f"artwork is {size} bytes, the limit is {maxBytes}")
+        self.size = size
+        self.maxBytes = maxBytes
+
+
+class ThumbnailSource(ABC):
+    @abstractmethod
+    async def read(self, maxBytes: int) -> bytes | bytearray:
+        """
+        Encoded artwork, never modified after it is returned.
+        Raises ArtworkTooLarge instead of reading more than maxBytes.
+        """
+        ...
+
+
+@dataclass
+class SessionProperties:
+    title: str
+    artist: str
+    thumbnail: ThumbnailSource | None
+
+
+def appOf(key: str) -> str:
+    """the app id part of a session key"""
+    app, sep, n = key.rpartition("#")
+    return app if sep and n.isdigit() else key
+
+
+class SessionKeys:
+    """
+    Stable session keys. An app's first session is keyed by the app id
+    itself, sessions it opens alongside that one get app#2, app#3, ...
+    A key is never handed out twice while its session is alive.
+    """
+
+    def __init__(self):
+        self.taken: set[str] = set()
+        self._counters: dict[str, int] = {}
+
+    def new(self, app: str) -> str:
+        key = app
+        while key in self.taken:
+            n = self._counters[app] = self._counters.get(app, 1) + 1
+            key = f"{app}#{n}"
+        self.taken.add(key)
+        return key
+
+    def release(self, key: str):
+        self.taken.discard(key)
+
+
+class BackendSession(ABC):
+    """
+    One media session. Event callbacks receive the session and may be
+    called from any thread.
+
+    `key` identifies the session for as long as it exists, even when its
+    app has several sessions open. Records it produces carry the key as `app`.
+    """
+
+    app: str
+    key: str
+
+    @abstractmethod
+    async def mediaProperties(self) -> SessionProperties | None:
+        ...
+
+    @abstractmethod
+    def playbackInfo(self) -> "PlaybackData":
+        """the record returned last time for as long as nothing in it changed"""
+        ...
+
+    @abstractmethod
+    def timeline(self) -> "TimelineData":
+        ...
+
+    @abstractmethod
+    def subscribe(
+        self,
+        onMediaProps: Callable[["BackendSession"], None],
+        onPlayback: Callable[["BackendSession"], None],
+        onTimeline: Callable[["BackendSession"], None],
+    ):
+        ...
+
+    @abstractmethod
+    def unsubscribe(self):
+        ...
+
+    @abstractmethod
+    async def skipPrevious(self):
+        ...
+
+    @abstractmethod
+    async def togglePlayPause(self):
+        ...
+
+    @abstractmethod
+    async def skipNext(self):
+        ...
+
+
+class MediaBackend(ABC):
+    @abstractmethod
+    async def start(self, onSessionsChanged: Callable[[], None]):
+        ...
+
+    @abstractmethod
+    def sessions(self) -> list[BackendSession]:
+        """current sessions, the same object for a session on every call"""
+        ...
+
+    @abstractmethod
+    def stop(self):
+        ...
+
+    @abstractmethod
+    def subscriptions(self) -> int:
+        """
+        Event handlers currently registered, sessions that are gone included,
+        so handlers nobody unsubscribed show up here.
+        """
+        ...
+
+
+def createBackend(name: str) -> MediaBackend:
+    if name == "windows":
+        from np.backends.windows import WindowsBackend
+        return WindowsBackend()
+    if name == "simulated":
+        from np.backends.simulated import SimulatedBackend
+        return SimulatedBackend()
+    raise ValueError(f"Unknown media backend {name!r}")
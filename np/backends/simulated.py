@@ -0,0 +1,264 @@
+"""
+Deterministic, scripted media sessions for running the app and its
+benchmarks without Windows.
+
+    backend = SimulatedBackend(seed=1, latency=0.02, failureRate=0.05)
+    media = Media(backend)
+    await media.start()
+    backend.spawn(100)
+    storm = backend.storm(rate=500, duration=10)
+
+Everything runs on the asyncio loop that called start(), the same
+random seed always produces the same sequence of sessions and events.
+"""
+import asyncio
+import random
+import struct
+import zlib
+from functools import lru_cache
+from typing import Callable
+
+from np.backends import (
+    READ_CHUNK,
+    ArtworkTooLarge,
+    BackendSession,
+    MediaBackend,
+    SessionKeys,
+    SessionProperties,
+    ThumbnailSource,
+)
+from np.media import Controls, PlaybackData, PlaybackStatus, TimelineData
+
+
+@lru_cache(maxsize=16)
+def makePng(size: int, seed: int = 0) -> bytes:
+    """size x size RGB noise, which does not compress, so byte size grows like real artwork"""
+    rng = random.Random(seed)
+    raw = b"".join(b"\x00" + rng.randbytes(size * 3) for _ in range(size))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw, 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+class SimulatedThumbnail(ThumbnailSource):
+    def __init__(self, backend: "SimulatedBackend", data: bytes):
+        self.backend = backend
+        self.data = data
+
+    async def read(self, maxBytes: int) -> bytearray:
+        await self.backend.delay()
+        if len(self.data) > maxBytes:
+            raise ArtworkTooLarge(len(self.data), maxBytes)
+        # a fresh buffer per read, filled chunk by chunk like the WinRT stream
+        data = bytearray(len(self.data))
+        source, target = memoryview(self.data), memoryview(data)
+        for offset in range(0, len(self.data), READ_CHUNK):
+            target[offset:offset + READ_CHUNK] = source[offset:offset + READ_CHUNK]
+            await asyncio.sleep(0)
+        target.release()
+        return data
+
+
+class SimulatedSession(BackendSession):
+    def __init__(self, backend: "SimulatedBackend", app: str, key: str):
+        self.backend = backend
+        self.app = app
+        self.key = key
+        self.track = 0
+        self.title = ""
+        self.artist = ""
+        self.thumbnailSeed = 0
+        self.status = PlaybackStatus.PLAYING
+        self.playback: PlaybackData | None = None
+        self.duration = 180.0
+        self.position = 0.0
+        self.callbacks: tuple[Callable, Callable, Callable] | None = None
+        self.setTrack(0)
+
+    def setTrack(self, track: int):
+        rng = self.backend.rng
+        self.track = track
+        self.title = f"{self.key} track {track}"
+        self.artist = f"Artist {rng.randrange(100)}"
+        self.thumbnailSeed = rng.randrange(self.backend.distinctThumbnails)
+        self.duration = float(rng.randrange(90, 420))
+        self.position = 0.0
+
+    async def mediaProperties(self) -> SessionProperties | None:
+        await self.backend.delay()
+        thumbnail = None
+        if self.backend.thumbnailSize:
+            thumbnail = SimulatedThumbnail(self.backend, makePng(self.backend.thumbnailSize, self.thumbnailSeed))
+        return SessionProperties(title=self.title, artist=self.artist, thumbnail=thumbnail)
+
+    def playbackInfo(self) -> PlaybackData:
+        controls = Controls.PLAY_PAUSE | Controls.NEXT
+        if self.track > 0:
+            controls |= Controls.PREVIOUS
+        self.playback = PlaybackData.reuse(self.playback, self.key, self.status, controls)
+        return self.playback
+
+    def timeline(self) -> TimelineData:
+        return TimelineData.sampled(app=self.key, position=self.position, duration=self.duration)
+
+    def subscribe(self, onMediaProps: Callable, onPlayback: Callable, onTimeline: Callable):
+        self.unsubscribe()
+        self.callbacks = (onMediaProps, onPlayback, onTimeline)
+        self.backend.registered += len(self.callbacks)
+
+    def unsubscribe(self):
+        if self.callbacks is not None:
+            self.backend.registered -= len(self.callbacks)
+        self.callbacks = None
+
+    def emitMediaProps(self):
+        if self.callbacks:
+            self.callbacks[0](self)
+
+    def emitPlayback(self):
+        if self.callbacks:
+            self.callbacks[1](self)
+
+    def emitTimeline(self):
+        if self.callbacks:
+            self.callbacks[2](self)
+
+    def flipStatus(self):
+        self.status = PlaybackStatus.PAUSED if self.status == PlaybackStatus.PLAYING else PlaybackStatus.PLAYING
+
+    def changeTrack(self, track: int):
+        """players publish a track change as several property events"""
+        self.setTrack(track)
+        for _ in range(self.backend.eventsPerTrackChange):
+            self.emitMediaProps()
+        self.emitTimeline()
+
+    async def skipPrevious(self):
+        await self.backend.delay()
+        self.changeTrack(max(0, self.track - 1))
+        self.emitPlayback()
+
+    async def togglePlayPause(self):
+        await self.backend.delay()
+        self.flipStatus()
+        self.emitPlayback()
+
+    async def skipNext(self):
+        await self.backend.delay()
+        self.changeTrack(self.track + 1)
+        self.emitPlayback()
+
+
+class SimulatedBackend(MediaBackend):
+    def __init__(
+        self,
+        sessions: int = 3,
+        seed: int = 0,
+        latency: float = 0.0,
+        failureRate: float = 0.0,
+        thumbnailSize: int = 256,
+        distinctThumbnails: int = 8,
+        eventsPerTrackChange: int = 3,
+    ):
+        self.rng = random.Random(seed)
+        # seconds added to every fetch and command
+        self.latency = latency
+        # probability that a fetch or command raises OSError
+        self.failureRate = failureRate
+        # artwork edge in pixels, 0 for sessions without artwork
+        self.thumbnailSize = thumbnailSize
+        self.distinctThumbnails = distinctThumbnails
+        self.eventsPerTrackChange = eventsPerTrackChange
+        self.initialSessions = sessions
+        # session key -> session
+        self.simSessions: dict[str, SimulatedSession] = {}
+        self.keys = SessionKeys()
+        self.onSessionsChanged: Callable[[], None] | None = None
+        # session event handlers registered and not yet removed
+        self.registered = 0
+        self._nextId = 0
+
+    async def start(self, onSessionsChanged: Callable[[], None]):
+        self.loop = asyncio.get_event_loop()
+        self.onSessionsChanged = onSessionsChanged
+        await self.delay(fail=False)
+        for _ in range(self.initialSessions):
+            self._add()
+
+    def sessions(self) -> list[BackendSession]:
+        return list(self.simSessions.values())
+
+    def stop(self):
+        self.onSessionsChanged = None
+
+    async def delay(self, fail: bool = True):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if fail and self.failureRate and self.rng.random() < self.failureRate:
+            raise OSError("simulated failure")
+
+    def subscriptions(self) -> int:
+        return self.registered + (self.onSessionsChanged is not None)
+
+    def _add(self, app: str | None = None) -> SimulatedSession:
+        if app is None:
+            app = f"sim{self._nextId}.exe"
+            self._nextId += 1
+        s = SimulatedSession(self, app, self.keys.new(app))
+        self.simSessions[s.key] = s
+        return s
+
+    def spawn(self, n: int = 1, app: str | None = None) -> list[SimulatedSession]:
+        """n new sessions, each from a new app, or all from `app`"""
+        added = [self._add(app) for _ in range(n)]
+        self._sessionsChanged()
+        return added
+
+    def close(self, key: str):
+        s = self.simSessions.pop(key, None)
+        if s is not None:
+            self.keys.release(key)
+            self._sessionsChanged()
+
+    def _sessionsChanged(self):
+        if self.onSessionsChanged:
+            self.onSessionsChanged()
+
+    def randomEvent(self):
+        """one event of a random kind on a random session"""
+        if not self.simSessions:
+            return
+        s = self.rng.choice(list(self.simSessions.values()))
+        kind = self.rng.random()
+        if kind < 0.4:
+            s.position = min(s.duration, s.position + self.rng.random() * 10)
+            s.emitTimeline()
+        elif kind < 0.7:
+            s.flipStatus()
+            s.emitPlayback()
+        elif kind < 0.95:
+            s.changeTrack(s.track + 1)
+        else:
+            s.emitMediaProps()
+
+    def storm(self, rate: float, duration: float | None = None) -> asyncio.Future:
+        """random events at `rate` per second, for `duration` seconds or until cancelled"""
+        return asyncio.ensure_future(self._storm(rate, duration))
+
+    async def _storm(self, rate: float, duration: float | None):
+        interval = 1 / rate
+        end = None if duration is None else self.loop.time() + duration
+        due = self.loop.time()
+        while end is None or due < end:
+            # catch up in batches when the loop is slower than the rate
+            while due <= self.loop.time():
+                self.randomEvent()
+                due += interval
+            await asyncio.sleep(max(0.0, due - self.loop.time()))
@@ -0,0 +1,203 @@
+from datetime import datetime, timezone
+from typing import Callable
+
+from winrt.windows.foundation import EventRegistrationToken
+from winrt.windows.media.control import (
+    GlobalSystemMediaTransportControlsSession as MediaSession,
+)
+from winrt.windows.media.control import (
+    GlobalSystemMediaTransportControlsSessionManager as MediaSessionManager,
+)
+from winrt.windows.storage.streams import DataReader, IRandomAccessStreamReference
+
+from np.backends import (
+    READ_CHUNK,
+    ArtworkTooLarge,
+    BackendSession,
+    MediaBackend,
+    SessionKeys,
+    SessionProperties,
+    ThumbnailSource,
+)
+from np.media import Controls, PlaybackData, PlaybackStatus, TimelineData
+
+
+class WindowsThumbnail(ThumbnailSource):
+    def __init__(self, stream_ref: IRandomAccessStreamReference):
+        self.stream_ref = stream_ref
+
+    async def read(self, maxBytes: int) -> bytearray:
+        stream = await self.stream_ref.open_read_async()
+
+        reader = DataReader(stream)
+        try:
+            size = stream.size
+            if size > maxBytes:
+                raise ArtworkTooLarge(size, maxBytes)
+
+            # read_bytes fills a writable buffer in place, so the artwork is
+            # copied out of WinRT once instead of into an IBuffer and then bytes
+            data = bytearray(size)
+            view = memoryview(data)
+            offset = 0
+            while offset < size:
+                loaded = await reader.load_async(min(READ_CHUNK, size - offset))
+                if not loaded:
+                    break
+                reader.read_bytes(view[offset:offset + loaded])
+                offset += loaded
+            view.release()
+            del data[offset:]
+            return data
+        finally:
+            reader.close()
+            stream.close()
+
+
+class WindowsSession(BackendSession):
+    def __init__(self, backend: "WindowsBackend", session: MediaSession, key: str):
+        self.backend = backend
+        self.session = session
+        self.app = session.source_app_user_model_id
+        self.key = key
+        self.playback: PlaybackData | None = None
+        self.callbacks: tuple[Callable, Callable, Callable] | None = None
+        self.tokens: tuple[EventRegistrationToken, EventRegistrationToken, EventRegistrationToken] | None = None
+
+    def rebind(self, session: MediaSession):
+        """move the key and the event handlers to another session of the same app"""
+        callbacks = self.callbacks
+        self.unsubscribe()
+        self.session = session
+        # the last record came from the old session, the new one reports its own
+        self.playback = None
+        if callbacks is not None:
+            self.subscribe(*callbacks)
+            # the key stays the same, so Media would keep the old player's track until the next event
+            onMediaProps, onPlayback, _ = callbacks
+            onMediaProps(self)
+            onPlayback(self)
+
+    async def mediaProperties(self) -> SessionProperties | None:
+        props = await self.session.try_get_media_properties_async()
+        if props:
+            return SessionProperties(
+                title=props.title,
+                artist=props.artist,
+                thumbnail=WindowsThumbnail(props.thumbnail) if props.thumbnail else None,
+            )
+
+    def playbackInfo(self) -> PlaybackData:
+        info = self.session.get_playback_info()
+        c = info.controls
+        controls = Controls(
+            (Controls.PLAY_PAUSE if c.is_play_pause_toggle_enabled else 0)
+            | (Controls.NEXT if c.is_next_enabled else 0)
+            | (Controls.PREVIOUS if c.is_previous_enabled else 0)
+        )
+        # WinRT enums are IntEnums with the same values
+        status = PlaybackStatus(info.playback_status)
+        self.playback = PlaybackData.reuse(self.playback, self.key, status, controls, info.playback_rate or 1.0)
+        return self.playback
+
+    def timeline(self) -> TimelineData:
+        tl = self.session.get_timeline_properties()
+        duration = (tl.end_time - tl.start_time).total_seconds()
+        # players report the wall clock time the position was sampled at
+        age = (datetime.now(timezone.utc) - tl.last_updated_time).total_seconds()
+        if age < 0 or age > duration:
+            age = 0.0
+        return TimelineData.sampled(
+            app=self.key,
+            position=(tl.position - tl.start_time).total_seconds(),
+            duration=duration,
+            age=age,
+        )
+
+    def subscribe(self, onMediaProps: Callable, onPlayback: Callable, onTimeline: Callable):
+        # subscribing twice would leave the first tokens registered for good
+        self.unsubscribe()
+        self.callbacks = (onMediaProps, onPlayback, onTimeline)
+        s = self.session
+        self.tokens = (
+            s.add_media_properties_changed(lambda _s, _args: onMediaProps(self)),
+            s.add_playback_info_changed(lambda _s, _args: onPlayback(self)),
+            s.add_timeline_properties_changed(lambda _s, _args: onTimeline(self)),
+        )
+        self.backend.registered += len(self.tokens)
+
+    def unsubscribe(self):
+        self.callbacks = None
+        if self.tokens is None:
+            return
+        media, playback, timeline = self.tokens
+        self.session.remove_media_properties_changed(media)
+        self.session.remove_playback_info_changed(playback)
+        self.session.remove_timeline_properties_changed(timeline)
+        self.backend.registered -= len(self.tokens)
+        self.tokens = None
+
+    async def skipPrevious(self):
+        await self.session.try_skip_previous_async()
+
+    async def togglePlayPause(self):
+        await self.session.try_toggle_play_pause_async()
+
+    async def skipNext(self):
+        await self.session.try_skip_next_async()
+
+
+class WindowsBackend(MediaBackend):
+    def __init__(self):
+        self.sessionManager: MediaSessionManager | None = None
+        self.token: EventRegistrationToken | None = None
+        self.keys = SessionKeys()
+        # app id -> wrappers handed out by the last sessions() call
+        self.known: dict[str, list[WindowsSession]] = {}
+        # session event tokens registered and not yet removed
+        self.registered = 0
+
+    async def start(self, onSessionsChanged: Callable[[], None]):
+        self.sessionManager = await MediaSessionManager.request_async()
+        self.token = self.sessionManager.add_sessions_changed(lambda _sm, _args: onSessionsChanged())
+
+    def sessions(self) -> list[BackendSession]:
+        byApp: dict[str, list[MediaSession]] = {}
+        for s in self.sessionManager.get_sessions():
+            byApp.setdefault(s.source_app_user_model_id, []).append(s)
+
+        known: dict[str, list[WindowsSession]] = {}
+        for app, group in byApp.items():
+            previous = self.known.pop(app, [])
+            if len(group) == 1 and len(previous) == 1:
+                # one session per app is the common case, it keeps its key
+                w = previous[0]
+                if w.session != group[0]:
+                    w.rebind(group[0])
+                known[app] = previous
+                continue
+            matched = []
+            for s in group:
+                w = next((p for p in previous if p.session == s), None)
+                if w is None:
+                    w = WindowsSession(self, s, self.keys.new(app))
+                else:
+                    previous.remove(w)
+                matched.append(w)
+            for w in previous:
+                self.keys.release(w.key)
+            known[app] = matched
+        # apps without any session left
+        for previous in self.known.values():
+            for w in previous:
+                self.keys.release(w.key)
+        self.known = known
+        return [w for group in known.values() for w in group]
+
+    def stop(self):
+        if self.sessionManager is not None and self.token is not None:
+            self.sessionManager.remove_sessions_changed(self.token)
+            self.token = None
+
+    def subscriptions(self) -> int:
+        return self.registered + (self.token is not None)
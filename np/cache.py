@@ -0,0 +1,75 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size: int = 0
+    budget: int = 0
+
+
+def contentHash(data: bytes | bytearray) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ThumbnailCache:
+    """
+    LRU cache for artwork bytes, bounded by total byte size.
+
+    Artwork is stored once per content hash, tracks point at a hash,
+    so the same image published by several sessions is only kept once.
+    """
+
+    def __init__(self, budget: int = 16 * 1024 * 1024, maxTracks: int = 1024):
+        self.budget = budget
+        self.maxTracks = maxTracks
+        self.stats = CacheStats(budget=budget)
+        # (session, title, artist) -> content hash
+        self._tracks: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+        # content hash -> artwork bytes, shared with every MediaData showing it
+        self._blobs: OrderedDict[str, bytes | bytearray] = OrderedDict()
+
+    def get(self, session: str, title: str, artist: str) -> tuple[str, bytes | bytearray] | None:
+        key = (session, title, artist)
+        h = self._tracks.get(key)
+        if h is None or h not in self._blobs:
+            self.stats.misses += 1
+            return None
+        self._tracks.move_to_end(key)
+        self._blobs.move_to_end(h)
+        self.stats.hits += 1
+        return h, self._blobs[h]
+
+    def put(self, session: str, title: str, artist: str, data: bytes | bytearray) -> tuple[str, bytes | bytearray]:
+        h = contentHash(data)
+        key = (session, title, artist)
+        self._tracks[key] = h
+        self._tracks.move_to_end(key)
+        if len(self._tracks) > self.maxTracks:
+            self._tracks.popitem(last=False)
+        if h in self._blobs:
+            self._blobs.move_to_end(h)
+            data = self._blobs[h]
+        elif len(data) <= self.budget:
+            self._blobs[h] = data
+            self.stats.size += len(data)
+            self._evict()
+        self.stats.entries = len(self._blobs)
+        return h, data
+
+    def forget(self, session: str):
+        for key in [k for k in self._tracks if k[0] == session]:
+            self._tracks.pop(key)
+
+    def _evict(self):
+        while self.stats.size > self.budget and self._blobs:
+            h, data = self._blobs.popitem(last=False)
+            self.stats.size -= len(data)
+            self.stats.evictions += 1
+            for key in [k for k, v in self._tracks.items() if v == h]:
+                self._tracks.pop(key)
@@ -0,0 +1,132 @@
+"""
+Per-session command queues.
+
+Commands for one session run one at a time, in the order they were
+issued, each with a timeout. Commands still waiting to run are collapsed:
+a toggle cancels out a waiting toggle and skips add up into one signed
+count, so a burst of clicks turns into as few backend calls as possible.
+"""
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from np.tracing import tracer
+from np.utils import log
+
+# seconds a single backend call may take before the rest of its command is dropped
+COMMAND_TIMEOUT = 5.0
+
+TOGGLE = "toggle"
+SKIP = "skip"
+
+
+@dataclass
+class CommandStats:
+    issued: int = 0
+    # backend calls made, lower than issued when commands collapsed
+    calls: int = 0
+    timeouts: int = 0
+    failures: int = 0
+    # commands waiting across all sessions
+    depth: int = 0
+    maxDepth: int = 0
+
+
+@dataclass
+class _Pending:
+    kind: str
+    # skips: calls to make, positive for next, negative for previous
+    count: int
+    issued: float
+
+
+class CommandQueue:
+    def __init__(self, run: Callable[[str, str, int], Awaitable[None]], timeout: float = COMMAND_TIMEOUT):
+        """run(key, kind, direction) makes one backend call"""
+        self.run = run
+        self.timeout = timeout
+        self.stats = CommandStats()
+        self._queues: dict[str, deque[_Pending]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+
+    def toggle(self, key: str):
+        self._push(key, TOGGLE, 1)
+
+    def skip(self, key: str, count: int):
+        self._push(key, SKIP, count)
+
+    def pending(self, key: str) -> int:
+        return len(self._queues.get(key, ()))
+
+    def _push(self, key: str, kind: str, count: int):
+        self.stats.issued += 1
+        queue = self._queues.setdefault(key, deque())
+        tail = queue[-1] if queue else None
+        if tail is not None and tail.kind == kind == TOGGLE:
+            queue.pop()
+        elif tail is not None and tail.kind == kind == SKIP:
+            tail.count += count
+            if not tail.count:
+                queue.pop()
+        else:
+            queue.append(_Pending(kind, count, time.perf_counter()))
+        self._depthChanged()
+        if queue and key not in self._workers:
+            self._workers[key] = asyncio.ensure_future(self._work(key, queue))
+
+    def _depthChanged(self):
+        self.stats.depth = sum(len(q) for q in self._queues.values())
+        self.stats.maxDepth = max(self.stats.maxDepth, self.stats.depth)
+
+    async def _work(self, key: str, queue: deque[_Pending]):
+        try:
+            while queue:
+                c = queue.popleft()
+                self._depthChanged()
+                tracer.record("command.wait", (time.perf_counter() - c.issued) * 1e6)
+                await self._execute(key, c)
+        finally:
+            # after forget() the key may already have a new worker and queue, leave those alone
+            if self._workers.get(key) is asyncio.current_task():
+                self._workers.pop(key)
+            if not queue and self._queues.get(key) is queue:
+                self._queues.pop(key)
+
+    async def _execute(self, key: str, c: _Pending):
+        direction = 1 if c.count > 0 else -1
+        for _ in range(abs(c.count)):
+            t = time.perf_counter()
+            try:
+                await asyncio.wait_for(self.run(key, c.kind, direction), self.timeout)
+            except TimeoutError:
+                self.stats.timeouts += 1
+                log.debug(f"{c.kind} timed out for {key}")
+                return
+            except OSError as e:
+                self.stats.failures += 1
+                log.debug(f"{c.kind} failed for {key}: {e}")
+                return
+            self.stats.calls += 1
+            tracer.record(f"command.{c.kind}", (time.perf_counter() - t) * 1e6)
+
+    def forget(self, key: str):
+        """drop waiting commands of a session and stop the one running"""
+        self._queues.pop(key, None)
+        worker = self._workers.pop(key, None)
+        if worker is not None:
+            worker.cancel()
+        self._depthChanged()
+
+    async def drain(self):
+        """wait until every queue is empty"""
+        while self._workers:
+            await asyncio.gather(*self._workers.values(), return_exceptions=True)
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"commands: {s.issued} issued, {s.calls} calls, {s.timeouts} timed out, {s.failures} failed,"
+            f" {s.depth} waiting (max {s.maxDepth})"
+        )
@@ -1,1621 +1,32 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.10.0
-# WARNING! All changes made in this file will be lost!
+import pathlib
 
-from PySide6 import QtCore
+from PySide6.QtCore import QResource
+from PySide6.QtGui import QIcon
 
-qt_resource_data = b"\
-\x00\x00b\xd3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6$\xc8\
-\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x03\
-\x00PLTE\x00\x00\x00t\xcb\xfdu\xcc\xfev\xcf\
-\xffn\xbe\xfcm\xbe\xfcu\xcd\xffl\xba\xf9p\xc3\xfd\
-\x08\x0c\x15h\xb2\xfbv\xcf\xfee\xa8\xf4v\xcd\xfei\
-\xb3\xfbh\xac\xf8W\x94\xde9\x80\xddj\xad\xf7w\xc9\
-\xfeS\x85\xe2V\x8e\xe6P}\xdf>i\xd2d\xac\xf1\
-Fk\xd5Jt\xdb\x5c\x9f\xebCm\xd5@|\xdcA\
-t\xd9\xfc\xf2\xff[\xb4\xfd[\xb4\xfeQ\x96\xeeZ\xb1\
-\xfdQ\x94\xedb\xbd\xffS\x9b\xf0`\xbb\xff\xfb\xf2\xff\
-X\xaa\xf8Z\xb0\xfbY\xae\xfaZ\xb2\xfcQ\x93\xecR\
-\x98\xee[\xb5\xfeR\x99\xf0Y\xad\xfaR\x99\xef\xfb\xf1\
-\xfeP\x93\xebT\x9f\xf3^\xb8\xffP\x90\xebS\x9a\xf0\
-d\xbf\xffN\x8d\xe9\x5c\xb6\xff\xfa\xf1\xfeX\xac\xf9O\
-\x91\xeb\xfa\xf0\xfeW\xa8\xf7T\x9e\xf3_\xb9\xffBj\
-\xd4X\xac\xfbg\xc2\xffR\x96\xedBd\xd1]\xb7\xfe\
-U\xa0\xf3Ae\xd2e\xc1\xffW\xa7\xf6_\xba\xffL\
-\x89\xe6F}\xdfY\xaf\xfdN\x8b\xe8S\x9c\xf2I\x83\
-\xe3\xe3\xd8\xf3K\x88\xe5P\x8f\xeaBm\xd6Dt\xda\
-Y\xaf\xfba\xbc\xff]\xb7\xffa\xbb\xffh\xc3\xffB\
-b\xd0U\xa1\xf4^\xb9\xffV\xa4\xf7N\x8f\xe9\xfd\xf4\
-\xff\xf6\xec\xfc\xfe\xf8\xff\xfe\xfa\xffc\xbe\xffi\xc5\xff\
-Dy\xdc\xec\xe1\xf8Bp\xd7U\xa2\xf5\xe8\xdc\xf5K\
-\x8b\xe7E{\xddV\xa3\xf4J\x85\xe4b\xaa\xf3H\x7f\
-\xe0>\x89\xe3Cr\xd8\xf5\xea\xfb@\x8c\xe5H\x81\xe1\
-Bg\xd3Q\x95\xedV\xa5\xf5;\x84\xe0U\x9f\xf7F\
-\x95\xeaZ\x98\xef\x5c\x9c\xefd\xaf\xf5I\x99\xedT\x9e\
-\xf1f\xb4\xf7Dw\xdb\xe6\xda\xf4W\x91\xeaV\x8e\xe8\
-K\x86\xe4\xfd\xf6\xff`\xa7\xf4c\xac\xf5e\xb1\xf7W\
-\xa7\xf9P\x90\xe8T\x9c\xf5\xf8\xef\xfd\xf2\xe7\xfa\xf9\xef\
-\xfd<\x87\xe1P\xa2\xf3\xe4\xd9\xf4S\x99\xf3Y\xac\xfd\
-\xea\xdf\xf7\xf9\xf3\xfdT\x8a\xe7g\xb7\xf9X\x95\xeb]\
-\x9f\xf1B\x8e\xe6_\xa2\xf2l\xc6\xffO\x9c\xf0\xfc\xf1\
-\xff\xee\xe3\xf8`\xa5\xf1M\xa0\xf1U\xa7\xf6j\xbd\xfa\
-K\x9c\xefE\x8c\xe6W\xa4\xfaY\x95\xedM\x98\xedX\
-\xa9\xfd\xf3\xe9\xfbT\xa9\xf7\xfc\xf5\xffW\xa7\xfbR\xa6\
-\xf5I\x96\xebk\xc0\xfb:\x81\xdeG\x92\xe9Q\x9f\xf1\
-C\x92\xe8i\xba\xf9R\x85\xe4X\xa9\xfbU\xab\xf8K\
-\x92\xeaW\xaf\xfa\x5c\x9e\xeeP\x99\xefZ\x99\xecA\x89\
-\xe3Bn\xd6V\xa2\xf8_\xaf\xf8J\x8e\xe8W\xad\xf9\
-p\xc9\xfe>\x85\xe1\x5c\xa8\xf5S\xa3\xf4M\x95\xecW\
-\xa5\xf7U\x98\xefGx\xdcu\xce\xfd\xe2\xd8\xf3E\x8f\
-\xe7^\xb6\xfd\x5c\xa3\xf3R\x97\xf0f\xbc\xfc\xef\xe6\xf9\
-c\xb7\xfb`\xb3\xfa^\xa2\xf0F\x88\xe4^\xab\xf6A\
-\x80\xdfO\x80\xe1V\x9b\xf0p\xc4\xfa@g\xd2={\
-\xdcR\x98\xf2X\xa1\xf2b\xba\xfdC\x84\xe2[\xac\xf8\
-\xe3\xd9\xf2\x5c\xb1\xfbY\x9e\xf1Ir\xdas\xca\xfcL\
-z\xdeZ\x9b\xf0Y\xa4\xf4?k\xd4>o\xd6T\x92\
-\xec\xf2\xf4\xff@u\xd9<u\xd9Q\x88\xe6w\xb0\xf9\
-El\xd6\xc4\xd7\xfa\xbc\xcb\xf5\xf6\xf2\xfd\x9b\xc1\xf9\x99\
-\xbe\xf7\xa6\xc8\xf9C\x8e\xcd\xde\x00\x00\x00\x1ftRN\
-S\x00\x11\x19\x15\x06\x0c\x1d\x05\x09\x01\x14\x0e\x0f\x22\x1f\
-\x19\x03s&(\xdd\xdd\xdey\x5c\xbb\xe8\xa2<\xf0\x9e\
-\x0c\x9c\x9e\x08\x00\x00 \x00IDATx\xda\xed\x9d\
-\x0b\xa0Me\xde\xff\x9by\x9b[ooS3\xef\xbc\
-\xd5\xbf\x9a\x91d\x06!\xa2\x92\x18\xc38\x1c\xdd^\x89\
-\xc94\xba\x8d\xf7\xadFC\x91\x86n\x08Q\x9c\x90J\
-\xc3!\xcc\x88D\xba\x1dI\x17\x91\x8eq\x09I\x1d\xa4\
-\x83$F\xa8\x19o\xa1i\xa6\xff\xf3\xfb\xfd\x9e\xcb\xef\
-y\xd6Z\xfb\xba\xd6\xbe\x9c\xb3~{\x9f}\xb6\x93\xea\
-\xec\xf5\xfd<\xdf\xdf\xe5Yk\xef\xa3\x8e\x8a#\x8e8\
-\xe2\x88#\x8e8\xe2\x88#\x8e8\xe2\x88#\x8e8\xe2\
-\x88#\x8e8\xe2\x88#\x8e8\xe2\x88#\x8e8\xe2\x88\
-#\x8e8\xe2\x88#\x8e8\xe2\x88#\x8e8ju|\
-/(\x8e?\xfe\xf8\xef\xc4\x11e\x88#\x1cx\xf4\xf3\
-,\xbf\x8f\xf6G\xc7\x11F\xa4\x0cA\x1e\xf5\xb7\xd4\x8f\
-%\x8b\x1e\x84\x00\x06\xf2\xa3?S\xdf\xfa\x85\xbf\x1bG\
-8\xe1O\x81/\x03\xf9\x90\xdf\xa3~\xacX\xc4\x1c$\
-B \xd7\xfa\x1f\xef\xa8o\xff\xca\xdf\x8a#\xeb\xf0\xa7\
-@3\x90S\x04\x02\xe5w\xc5\xcf\xcd\xa1\xf9\xf7\x9a\x1f\
-\xfe p\x06|\x5c \xe7\xfa[\xeas\x85\x8e\x85\xf8\
-\xf7\x7f?6\xfd\xf8\xf78|I\xb0\x19\xd0M\x81C\
-A\x8e\xf4\xf7\x91\xdfR\x1e\xe3\x1bqd\x1b.\x06\xfe\
-\x08D\x0f\x80\xbf\xfeL~K{\xfc\xd5\x8f9\xe6\x98\
-o\x1c\x03\x8fE\x15\xffV8\xe1\xc3\x01c\xc0 \xe0\
-\x9a@\x0e\x008\xde\xe8\xcf\xe4W\xda\xfb\x1cT\xfc\xf6\
-\xfd\xb4n\xff\x16\x87K\x82\x86\xc0 `\x08`\x0cD\
-o\x00\xb6\xfc\x5c}#:(\xae\xe3\x9bxK#\xc4\
-_\xfef\x1c\xdf\xfc7\xb89$h+\xb0\x9d R\
-\x17\x08\xb2\x7f\xad\xbf\xa3>\x93\x11\xbfa\x1cw\xdc\xb7\
-\x8f\xfbf\x92\xafo\x7f\x1b\xbf\xe01\x85\xbf\x9d\xc2\x97\
-x\xb0\xbf\x8a \xbeI7\x11\xdff(Xn\xc0\x9d\
-@\xe7\x82\x08K\x01\xff\xf5\xcf\xe5\xd7\xea\x9b5|\x5c\
-j\xf1m\xf3\xf5m\xfd\x87\xe3\x88\x00\xfd\xc3\xe4\xdf\x03\
-o5!\x1c\x0c\xfc\x10\xf0\x0e\x06\xa2\xd2\xffx\xbe\xfc\
-\x1d\xf9\x83\xb5\xff\x01\xc4\x7f\xc4\x91vx1P\x0c8\
-\x08\xc8\xa1L$&\xe0Y\xff\xae\xfe\xc7\xfc\xf0\xa4\x93\
-N\xf9\xcf\x1f\xfdhj\x93\xfa3\x17-zd\xcd\x9a\
-5w\xce~~\xf6\xec\xd9\xaf\xbe\xfaj\x9b\xbf\x88X\
-\xd2\xb0a\xc3\xb3d\xd4\xa9S\xa7i\xeb\xd6\xad\x9b6\
-\x15\xf7\xa6M;wn}\x95\x13\xe7\x86\x1a\xd7\xb2h\
-\x1fR\x5c\x12N\x88\xff\x12\xfc\x86\xed7\x9e\xdbY\xc4\
-F\x8a-[\xea\xec\x85\xa8\xac\xdc\xb3g\xcf\x07\xfdg\
-\xcd\xfa\xd1\x8fN9\xe5\xa4\x93l\x08\xbc\x08\x98\x820\
-\x02\x02<\x06\xc0\xf4\x17\xf2\x9ft\xd2\x7f\xfe\xe8\xb5\xb7\
-\xde\x9a?\x7f\xfe\xcc\x99B\xfeE\x8f<\xb2\xe6\xf9;\
-\x85\xfa\xcf<\xf3\x8c\x00@\xc8\xdfhI\xc3%\x0a\x80\
-:u\x08\x00\x94\xbeu\xe7\x8d\x9d\x95\xe4\x09\xd5\xbf6\
-I\xe4V8+~\x9a$~\x13\x18\x1fC\x88\xdf\x0a\
-\x1f\xda\xb7\xdf\xa8\x08\x00\x08\xb6l\x01\x04 \xf6| \
-b\xf5\xea\xf7\x7ft\xcaI?\xfc\x0f\x06\x81a\xc0A\
- \x82\xa9\x90_\x02\x90\xfa\xffP,\xfc\x15\xaf\xbd\x86\
-\xfa/E\xf9A\xff5\xa4\xff\xab\xa4?\x00 \xf5?\
-C\xe9\xdf\x1a\xbe\x04\x00\x9d;\xa7\xbb\xfc\xafM/\x22\
-\x87\xe1\xa7\x19\x86b\xe0\x92K\x00\x00\xf2\x83\x8d\x1b7\
-\xa3\x07l\xdc\xb2W\x10P)\x83\x08X\x0d\x10\x08\x06\
-\xfeC!\xc0\x8a\x01;\x0f\x84_\x0b\x06\xea\x7f\xd2\x7f\
-\xdd\xbfb\x05\xea?\x1f\xf5\x9f\xe9\xe8\xdf\x06\xfd\xbfQ\
-Ck\xf9\xd7\x11k\xbfskx\xe8L\xfa\x93\xb0^\
-\x002_\xf5\xb9\x10\xd4oM\xff:iX\x7fQ\xb9\
-\x80\x89\xcd\x9b7\x93\x09l\x91Q\xb9E10f\xf5\
-\x98\xd5\xb3\xdeE\x06\xbe\xcd\x18pM \x12\x02\xbc\x09\
-\x00\xfeo?<\xe5\xb4\xad}I\xff\xd7\xde\xf2\xd3\xbf\
-\x81\xd1\xdf\x03@gL\x00^\x03\xb8\xea\xda\x8c\x22\x03\
-\xd1\x7f\x9aE\xfc:\xe3\xd0\xfa\x9f)\x02\xfe\xec%@\
-#0BA0\xacr\xd8\x07c\xfb\xf7\x1760\xeb\
-\xfd\xf7\xdf\x7f\xfd\x94\x93\xb4\x0d\xf0<\x10!\x01\xf6\x04\
-\x90\xf4\x07\xf9\xb7\xce\x95\xeb\x9f\xe9\xbfF\xe4\xff;I\
-\xffWm\xfd\xeb\xd4a\xfa\xb7V\x06 Wz\xf0\xb2\
-\x0fsy\xa7\xbb\xb6\x7f\x9dM\x9c\xe9\x17\x9e\x7f*D\
-G#0$\x08\x006Sl\x81\xaf\x11[F\x94\x95\
-\x09\x13\x18\xfbA\x7f\x11\xb3f\x09\x06^\xff\x91\x85\x80\
-\x1f\x01\xe1\xd6\x01\xd6Y\x9f\xa8\xff\x0fO\x19\xb4\xd5\xd2\
-\xdf\xd4\x7fX\x00*\xfd\x1b\xa1\xfc\x16\x00\xca\xfb\xed\x0c\
-\xe0W\x03\xa4W\xeb\x85\x07\x83\x7f\xc9\x16\x0e\x02)\x00\
-\xc0\x08\xd8\xbcy\xc4\x16q\x1f!\x10(\x1b6l,\
-\x100f\x16\xba\x80D\x80\xe7\x01J\x03j,\x18\x09\
-\x00t\xd6\xef\xd1G\xff\xe0\xc7\xa7\xed\xde\xea\xae\x7f\xa8\
-\xffD\xfb\x07\xfa?\xa3\xfc\x7f\xc9\x92%J\xff:\xca\
-\xff\x9b\xda\xfa\x93\xd0F\xf5\xb0+\xf9\xdf\xa4\x1b\xa1,\
-\xf4$q\x03\x0b\x8b\x0dI\x00=l\xde\x5c\xb5ys\
-\xf9\xe6\xf2\xf2\xf2\x11\x80\xc00\x81\xc0Xm\x02\x0c\x01\
-\xca\x03\x89L \x1c\x00p\xbf\x01\x008\xe9\xb4\xdd\xa8\
-?\x01\xe0\xe8/\xcb\xbf\x06`\xffK\x964b\xeb\x7f\
-#\xdc\xb1\xfbc\x00\xc8u\x9eL\xff\xccWwn\x85\
-\xbe!\xed\xa8\x82\x1b\xfc\x9b\xc6\x11DTUU\xa9\xaf\
-r\x81\xc0\xe6\x11\x10\x80\x00\xd8\x804\x81e\xa7\xfcP\
-\x22`\x13\xa0\xb7\x06\xc2#\xc0\x00 \xfe\xc3\xa7\x9e2\
-\x08\xf5\xdfj\xf4\x9fo\xf2\xff\xec;g\xb7S\xfa7\
-j$\xeb\xff:z\xf9o\xecl'\x00G\x7f\xf14\
-\xec\x9c\xfe\x9b(VqJ\xd2\xb6\xf2\x0f\xf7/\xd8\xff\
-\xd2\x99\xa4\xbe\x89\xc5U\x8b\x17/._\x8c.@\x08\
-\xa0\x09\xbc\xef1\x01\x99\x06\xb4\x05X{Ca\x00 \
-\x0d\xe0\x84\xd3H\xff\xeesM\x03\xc8\xea?\xb1\xfeE\
-\xf3\xdf\x00\x96?\xc9/\x09\x90\xf6\xaf\xfc_\x80\xc0\x12\
-\xbd'\xedg\xe2\x00\xa9$\xf4\xb0`\xb8!\x0b\x02\xbc\
-\xff\x9c?\xbb\xe1\xe33\xcf4\xea\xcf\x01\x020\xfc\x10\
-x]\x98\xc0\x7f\x18\x13p\x08\x08ssP\xc9/\xf4\
-\xff\xf1e\xbb\xf9\xfaw\xf4\x9f\x8d\xfa7xU-\xff\
-\xbd\x02\x80\xb3\xf6\xca\xf5/\x9a\x1b\xd2_\x0d>\xb5\xe2\
-iI\x9d\xc2\x88-r\xa1[\xa5\x14\x17\xf9\x86\xe7/\
-\xd8x\x08\x08\x84\xea\x17U]TqQEUE\xd5\
-\x1c\x0cb\xc0 \xa0\x090&\xa0\xd2\x80$ \xdc^\
-P\xe9\x7f\xfc\xa9\xff\xaf\xbaz\x10\xe9?\xd7\xd1\x7f\x8d\
-\xd6\x9f\xa6\xbf\xa6\xfb\x97\xcb_(\xce\xcc\x9f\xafx\xab\
-\x02,\x0a\x00\xd2\x87\xa1\x95\x1f\x01\xf8\xc7\xaa\x8e\x17u\
-\xac\xeaX\xc5\xffn\xc7\x0a\x11U\x15\x15\x1d\xc5W\xc5\
-\x9c\x0a\x03\x011\xa0\x08\x98\x05\x04L=\x09M )\
-\x01\xd9\x01\xa0\xf4?\xadz\xd0 \xb7\x00\xb4\xd6\x7f\xbb\
-We\xfb\x87\xd5\xffY{M\xf7\x0f\x00l\xa4\xc5\xcf\
-\x18\xb0\x0d =\x7fOQ\xf4\x9c\x08}Q&\xd1\xb1\
-UGB\x00\xfe\x03\x02\x02\xfd\x14\xa2\x02(@\x120\
-\x0c\x02\x9a\x80\xfe\xe4\x012\x0d\xa8B\xc0\x22 d\x00\
-N8\x0d\xd6\xbfS\x00\x9a\x06`6\x1a@\x03\xb3\xfe\
-\xf7\xf2\xf1\x8fP\x7f\xa3J\x00:\xe3\xab=1\x7f\x00\
-\xfc\x17z6\xab;\x1b\xa1/\xca0:\xa6\x14\x15\xf0\
-P%\xbe\xf0_\xa8\xe8%\xa4\xef%n\x15\xf8e1\
-\x80y@\x9a\x80$\xe0\x87\xbc\x10P\x048[\xc3!\
-\x00\xf0\xe3~\x97UW\xefv\x12\xc0R\xb5\xfe\xd7\xd0\
-\xfa'\xffoH\xfa\xefe\xf2o\xd4\xeb\xdeM\x00i\
-\x02\x10\xf5\xaa\xcf,\xbb\xb7\xea\x08\xb7\x8b:\xa6\x04@\
-+u\x97qQ\x85T_\x92\xd0\x0b\xe2Fx\xa8\x98\
-Q\xb1\x03o\x1c\x01M\x80\xcc\x02\x9c\x00\xea\x06\x15\x00\
-\xc7\x87\x09\x00\xeao\x12\x80\xde\x01Z\xa4\x1b\x80v\xaa\
-\xfe#\xfb\xdf\xab\xf4\xdf\xb8\x11\xfd\x7f#h\x7f\xed\xb9\
-\xb2\xfa3\x05@\x1a\xf5\xfeo\x22\xca\xfb\xd9\xc2@\xf2\
-\x8b\x9b\x9f\x03\x08\x04\x9c\xbb\x9f\x01Tt\x94w)\xff\
-\x8c\x1bo\x9c!b\x07|U\xec\xa0;7\x81D\x04\
-|\xcb\x87\x80\xac\x00`\xeb_%\x00\xb3\x03\xc8\x0b\x80\
-\x06l\xfd\xef\xe5\xe5\xdfF\xbd\xec\xcd\xfaO\xd0\xea\x85\
-\xb9\xeasb\xfb\x1d3\x89^\xa45,\xf4\x8e\xf8\xd0\
-\x91\xe4\xbf\xf1\xc6^(\xbeP\x1fn3v`\x90\x11\
-\xc8R\xc0\x9f\x80or\x02\x9cy`\xb6\x00\x9cpS\
-\xb5\x06\xc0'\x01\xc0\xfc\xb7\x9d\xbd\xfe\xf5\xde\x1f\xea\xbf\
-\x11\xbd\xff\x5c\xb6\xfe\x93\xf7\xfa\xe9\xd5\x00\xe1\xadn\xcb\
-\xda\xed\x9b\xff:\xc7U]\xc5<\xdd\x91\x99I\xed\x89\
-\x1b!<?\x10\xea\xdf\xb8c\x06Q\xb0c%p@\
-\x0ch\x04(\x0d(\x02\x96y\x08\xd0\x13\xe1\x90\x008\
-\xf5\xa6~\xd5\xd5\xb2\x02\xb0:@\xda\x00\x82\xfd\xdfv\
-\xcf8\xf5\x1f[\xfeP\xff\xa3\xe6\xa6\x02\xbc6\x91\xfe\
-i;@\x06\x05~\xaa\xab\xbec+\x9f\x9bg\xd1\xb7\
-J\xb8\xd0+:\x06\x13\x80\x8a\xf7\xaa\x90\xb7^3\xa4\
-\xf7\xcf\x98\xb1R\xdcW\x8a\xfb\x8e\x95\xf0\xa5l`\x07\
-\xb4\x85d\x02\xac\x12\x0c&\xe0\xf8P\x008\xf5\xb4\x9d\
-\xd5\xa6\x02\xc4\x0e\xe0\x05\xd5\x01\xc2\x09`\xcf\xd3\xfe\x9f\
-\xd2\x7f\xaf^\xffM\xe9,'\xa8\xfd\xd5\xc2W\xab\xdf\
-n\x004\x00\xfe\xcd^Nm\x9f\xadx.:\x8aL\
-\xdfRr\xfd^\x094WOf\xdc\xc8\x83h\x98\xa1\
-\xf4_\xa9b\xc7\xca\xfd;4\x03\xe8\x02\x09\x08\xd0I\
-\xc0\xb6\x80\xac\x008\xf6\xb4\x9d\xfd\xaa\xbd\x09`>+\
-\x00`\x03H\xef\xfe\xefU\xbb?M\xeb\xc8\xf3\xdcP\
-uQ\xf0u&\xe7?7\xa5\xba/?)\xc0\x19\xdb\
-\xa1\xb5W)\x02T\xfd\x9e9\x003\xe0Nz\xcf\xe8\
-u\xa3\xb2|\x88\x0aq\xefe-\x7f\x19\xfb\x85\xfe\xfb\
-\xf7\xaf\xdc\xb1_\xb9\xc0\x9c\x0a;\x0b`\x190\xf5$\
-\x9b\x00\xc7\x02\xb2\x02\xe0\xe4\x9d;\x99\xfesW\xbcH\
-\x06\xb0\x94\x1b\x80\xdc\xff\xb1\xfa\x7f\xad\x7fg\xb5\xf6-\
-\xd1\xb9\xfe\xa9/\xfbH\x84N\xb3\xb8\xeb\x950nt\
-\xa3\x17\xde\xa4\xe83p\xd5\x0b\x0a\x00\x85\x1b\xe9Or\
-\xd1\xcf\x90OW\xe2\xf2\x9f!\xc5\xa7\x1b\x86b`G\
-\x85,\x04\x86i\x02\x96-\x93'\x8b)\x02\xbek\x13\
-\x90\x8d\xfe?\xbeig\xb5\x02`\xae\xd7\x00H\xffW\
-\x95\xfe{\xcfr\xd6\xbf\xb4\xffk\xdb\xb3\xd2\xcf\xf2\x7f\
-\xd4?\xe5z?\x1a\x00Xz\xef\xc8\xf5\xbf($\x00\
-\xb4\xd7\xcf\xc0\x0eO!0C\xd7|V\xacT\x09`\
-\xffJ-\xfe~x\xa2\x08\x98\xb3\x03\x08\x18\xe1\x10 \
-\x9bA\x0d\xc0w\xc3\x01\x00\x0a\x00\xd2\x7f\xb7\x99\x01\xab\
-=\x00]\x00\xb0\x0d\x00Y\x004\xddh\xf5\x7f\xba\x00\
-8\xb7}\xd2Q\x7fJ,\xa4X\xf7\xa5\x00@+\xa6\
-\x7f+\xaf\x07\xb4\xca,\xd53\x00f\xf4\x22\x13\xe8\xc5\
-5\x87\xe7\x8a\x0aG~\xcb\xfe\xad\x10\xb9\x80\x08PY\
-\x80\x95\x01SY\x19 \xa7A\x86\x80,\x00 \xfd\x8d\
-\x01\xbc\xf3\xa2O\x02\xc0\xf3\x7fp\x03\x90\xf4\xdfX\xa7\
-\x8eU\xfe\xb5\xb7z?\xaf\x01\xf8M\xf9s\xe7\x00\xad\
-:\x9a\x5c\xdf1\x85\xf6>\xe5\xb5o\x08\x10n\x0f7\
-\xf9]\xb5z3|c\xa5)\x00a\xe1\xbf\xbd\xf2m\
-\x0b\x01i\x02\x8c\x00i\x01\xbc\x0cp\xb7\x04\xb2H\x00\
-;\x15\x00T\x01\xbe#J\x00\xbd\x09$G@x\x02\
-x#\xfb\xf4\xcf\xa6R\x7fj\xfa\xb4\x05\x04U}Y\
-w|\xe9\xb6\xfb\xfe\xeb\x1f\x1c\xc0\x7fx\x9b!\x00\xbd\
-\xa4\xd7c\xfa\xbf\x91(\xa0\xe8\x15\xa8\xbfq\x80\xfdo\
-\x8b\xbbP\xfdm|0\x10P\x1d\xe0!\xe0G\xbc\x0e\
-\xb4- \x9b\x04\xc0+\x80wV\xacx\xd1\xb4\x80:\
-\x034x\xf5/\x8d\xe4\xf9\xff{-\xfd;;\x97u\
-H\xf5\xdb'X\xff!8@Z\x85\x1f\x00p\x11\x1b\
-\xd0\x87\xec\x00$=\x89\x7fc\xb0\xef\xb3\xe5\xaf\xd7\xff\
-\xdb\x84\xc0\xdbB\x7fA\x00\xdd\xb4\xfe:\x0b\xc82\x00\
--@'\x81o\xb8\x16\x90e\x07\xa0\x0d\x00\xd6\xff\x0b\
-/\xcc\xf71\x00r\x80\xb3\xd4\x0e\xc0Fn\x00f\xf1\
-\xfb\xac\xffTN\xb9\x8f\xb6\xf2g\xfd]\xc7\x8b:f\
-R\xf9\xdf\x18\x1cN\xaf\xaf\xa8\x98\x11H\x00K\x01\xb0\
-\xfe)\xf6\xbf\xad!0i\xa0b\x8ek\x01\xa3e'\
-`W\x01\xd9\x00p\xc2M\xcc\x00\xb6\xca\x0a\xe0\x05\xfb\
-,\x00a\x00m\xf4\xf5_\xac\x02T'~\xb5\xb7\x00\
-H\xb2\xd5\x9f\x0f\x00p\x98\xebn\xd1\x85\x05\x80%\xba\
-\xba%\xb6\x00S\x03\xbe\x8d\x0e\xf0\xb6\xc2\x80\x18P&\
-\xc0Z\x01\xa8\x03m\x0b\xf87\xe7\xc4\x80\xcc+@\xdb\
-\x00\xdey\x8d\x00`%\xe03\xd4\x03.i\xc4+\x00\
-\xb5\x01p\x95]\xff_\xdb\xdeg\xfe\x97\xe7\x14\xa0L\
-\x80\xd6\x7fJ{<\xd9p``HZ\x01\x88\x14\xf0\
-\xf6~&\xbe\x86\xc0\x94\x01s(\x09h\x0b\x18\xe5\xb5\
-\x80\xac\x008a\xa7U\x01\x08\x00`\x08\x84\x0e\xf0\x04\
-U\x00\xcf?\xa3f\x00\x8d\x1a\x9e\xd5p\xaf\x9f\xfet\
-\xb5G{,\x00\xda\x17^\x11\xc8\xc6\x004\xe6\xef\x98\
-\xf1\x947\x05\xe5\x93\x87\x1e\x02\x80\xfeb\xf9\xaf\xf4\xe8\
-\xff\xb6J\x02s\x02-\x80\x00\xf8V\xd6\x00\x9cf'\
-\x00\xa1?\x19\xc0\x93\x1e\x03\xd0\x97\x00K\x00\x9aR\x0b\
-(\xc4\xbfJ\xd9\x00\x9e\xf4\xed3\x04\x0e\xdf\x01Rr\
-\x03\x9fm>w\x0e\x10\x02\x00\xb2\x0bH\x99\x86\x95l\
-\x17\x00\x08\xf0C\x00\xd3\x80\xac\x04\x17+\x0b \x02\xa6\
-\x8e\x92\xad\xa0\x9a\x07\x13\x01\x99\x02 \x0d\x00f@o\
-H\x03x\xf1\x05]\x02<\xf2\xc8\xf3r\x0a\x88\xef\x01\
-\xb1\x84\x9d\x01N\xfa\xc3\x16\xf0\xb9\xear/\xa8\x01.\
-\xb96\xe9I\x1fy\x18\x04\xb5\x0a\x9c\x03d\xb5\xe7c\
-\x08\xe8\xa5'\xc1\xa9\xf8\xc2J^\x04\xfaZ\x00y\x00\
-\xb3\x00j\x04\xe0b\x11c\x01\xdf\xb0s@V-\x00\
-\xea\xff\x06\xd3\xff\xc9'g.z\xe2\x11\x00@O\x01\
-\xa5\xfe\xc6\x00\xd4)`\x9de\x22\x08>\xd9?\xe8\xcc\
-\xaf\x1c\x0d\x82@\xff\xaap\x1c\xc0\xc7\x07H\xfb^i\
-%\x06\x93\x02`\x0a\xf0\xf6\xdb\x09\xaa\x00f\x01T\x05\
-L\x1d}\x92\xea\x04U\x0e8:c\x00N\xd5\xfa\xef\
-~C8\xc0;\x1a\x00\x91\x02\x9ex\xc2d\x80W=\
-\x06Pg\xa3\xbe\x00\x80\x9d\x01\xe4\x7f\x05@\xe0\x09\xbf\
-\xb9\x9a\x04\xda\x93\xa0T\x1c \x9d\xbd\x00\x9c\x03\x07\x13\
-\xe0\xd3\x10\xaedU \xa8\xbd\xf2\xed\x04\x16\xb0c\xb1\
-o\x15\xf0M7\x07d\x04\xc0\x89\xd4\x01T\x93\xfeh\
-\x00\xd2\x01D\x0d\x88\x06@5\xe0_\xda\xa0\xfe\xfa2\
-\x80\x8d\xfa\x0a\xa0s\xf5\xf9\xdf\xe7^\x0b\xfe\x7fn:\
-\x17\xfe\xe5|;\xb8*\x9d\xf3\xc0\xb28\x1f \x99\x17\
-\xac4\x0c\xe0\x14\xd0/\x09\xec\xd7I\xc0\xb2\x00\x01\xc0\
-\x8f\xfc\xca\xc0\xefe\xb3\x0b\xb0\x0a\x00`\x19\xe0^\xd0\
-\xff\x09\xea\x01x\x060% \xbf\x04\x98_\x01\xd6\x9e\
-\xde\x16)Q\x19\x90\xcf\x13B:\xd2\x83\xff>a\x88\
-\x00$%@W\x01(\xfd\xca\xc49\xc0\xe9\x04\xa7R\
-'(\xc7\xc1Y\x01p\x02f\x80U\xd5R\xff\xb9\xc6\
-\x00\x9e\xc4&\xf0y\x04@f\x80\x9e\xecM@\x9a6\
-e\x17\x00w\xde(/\x01U\xf2{N\x07\x0c\xe1\xec\
-\xdf\xecO\x09\x832\xc0g\x9f0p\x970\xdd\xf3@\
-S)\x17\xe8\xcfz\x22\xac\xf6\x03\xfd:A{K\x80\
-\xca\xc0Y\xbc\x0c\xe4\xe7\x85@\x15\x98Y\x09X]\xbd\
-\xd06\x00\xd1\x03\xde+\xf4\x7f\xf2\x09(\x01\x9e\xe7%\
-\x00\xbf\x10\xaci\xeb\xd6\xde+\x80\x02\xae\x00Oz\x11\
-X\xce\xcf\x08\xb2n\xad.2\xeep\x91uN`\x9a\
-4\xa4\xe0\x05\xbd\xd8)a\xcc\x02|s\x80I\x01\xbc\
-\x0c|\xdf\xe4\x00\xa7\x08\xc8\x08\x80\xd3T\x02\xd8M\xfa\
-S\x06\xb8\xf7^\x04`\x91)\x01^\xa5!\x80v\x00\
-\xf5\xfe_\xf22`z\x0f\x08>\x0fL\x0a@\xa1\x9c\
-\x16.\xcb\xc2\x8e\x1d\xbd\xe7\x84fc\x07\x81\xa7\x86\xca\
-K\x02l\x0bX\xb9? \x05\xec\xdfou\x82\xd6\xae\
-\xb0[\x04\x1c\x9fQ\x06\x00\x03X\xb5j\xf7\xaa7\xc0\
-\x01\x00\x80{\xc0\x00\x08\x00^\x03\xd2;\x01*\x00\xd4\
-\x1b\xc0\xb56\xef\x02\xa4\xb7\x83\xafm\x9f\xec=@\xf2\
-sa\x88U\x05zK\xc3\xaaV\xc1\x7f!\xa4K\x06\
-,\x14x/\xf0\xb6\x9c\x06xGAV\x11PF9\
-@\xf5\x01\x9e*0C\x00\xaa\x01\x807t\x06\xb8\xe7\
-\x05J\x01L\x7fU\x03\x9a\x22\x10\xdf\x02\x10\xf4oM\
-\x09\xe0*g?8e\xc9syi\x18\x5c\x95\x8dN\
-\x10\xe8\x06x\x01oG\x09\x81\xef\x85a\xadB\xb9f\
-\xc4\xd4\x01\xe6\xa4\x10\xa7\x0cP\xa7\x06\xe0<\x18s@\
-\xb9O\x0e\xb0\x8b\x80L2\xc0B(\x00\x08\x80?<\
-\xfe\xb8\x04\x003\xc0LY\x02\xb0&\xe0,\xb5\x15\xd4\
-\x14\xdf\x04V\xbf\x11\x18\xe8\x7f\xad\x81 \x9d7|\xc9\
-\xe1\xc5\xa1p]>\xbe?C\x95ok\xd0Q\xa5\x03\
-:i\x10\x0b\x82\x94Z\x85\xf4\x1c\x80!`\x0d\x04\xde\
-\xf6\xf4\x82\xfc\xc4\x809\x1e\x00p\x16\xc4\xcf\x0c\xcb\x14\
-\x004\x00L\x00\x94\x01\x00\x00\xc8\x003\xb5\x03\xc8\x9d\
-\x80%K\xcc \x10\xde\x00\x18L\xa0)\x7f#\xb8\xab\
-\xaeJ\xf0\xc6\xbd\x19\xbe\xfdG\x88n\x90\xb8PhE\
-eB\xa2+\x05/\xa2\xaf\x8b2\x0fy\x99(>\xeb\
-\xe5\xf1\x80\xb7\xf7s\xfd\xb9\x01\xf8l\x09R#\x985\
-\x00\x98\x01VI\x00\xe6>\xcek\xc0'\xac\x12\xe0U\
-\x96\x01\x08\x80\xd3\x85\xfaMy\x09\xa0\xb6\x04\xafe\x18\
-d\xfavP\xd1\xbcA\xc4\x0d\xfa\xc6\xef\xbeNqC\
-\xab\xec\xde \x229\x09X\x08X\x1e\x00\xf3 y^\
-\xc0~\x97\x00O\x158\xd5*\x02d\x1b\x90\x01\x00\x0b\
-\x172\xfd\x1fWc@m\x00\xbc\x06d\x06P\xa7\xe9\
-\xe9\xa77E\x170\xef\x03\xa7v\x84Q\xfal\xdf\x05\
-.\x12\x00\x84\xdcU\x9c\x82\x1b\xc4\x1f}\xf4'\xf9[\
-\xdd\x10\x8a\xe6AE\xc3E\x94\x11\xfc\xc7\x01\xfb\xcdi\
-A\xc1\xa3\xa0\xa9\xff\xe9\x1d\x05ep2\xe8\xc2\xea\xbb\
-\xee\x22\x02\xfe0w\xee\xe3/a\x0f\x80\x00\x18\x07\xb0\
-j\xc0\xb3\x1a\x9a7\x03E\x00Z\x9b7\x82\xf4\xbc\x0d\
-t\x9ao\x03\x1c\xf9\x9bD\x99\xbfs\xe6o\xa2}\x93\
-\xa8\xa4\xa7\xa8K\x13\xb0&BxQ\xc0~\xac\xfeL\
-\x0d\x18tR\xc0Tw\x12\x90\x19\x00P\x02\xd8\x00\xa8\
-\x1a\xd08\x80\xd3\x04\xd4\xf1\x00p\x95\xe3\x00\xc9\xdf\xeb\
-\xbb\xc6\xbfM\x5cR\x18\x14\x02V\x16\xd8\xcf\xae\x11x\
-\xdb\xe7\x04qv\x89\xc82(\x02B\x01`\xe1]\x94\
-\x01\xfe\xf0\x07h\x02_\xd2\x00<\xe1\x02\xa0j@\x0e\
-\x806\x00\xd4>\xf8}\xe0S{\xc7\xff\xdc\xbeQ\xe4\
-\x99\xbf\xa1[\xf4o\x14\x19\x04\x81h5z\xb9\xa5\xe0\
-~}y\x80\xc9\x00\xfb\xf1RAO\x1b\x10\x0a\x00;\
-\x17\xde\xa5\x01\x90M\xe0=j\x0c\x18T\x032\x00:\
-\xd30\x80\xce\x08J\xfc9\x00\xe9}\x98G\xf4o\x15\
-+\xe5?3\xb2\xb7\x8aM\xd8q\xa8\x9c\xd0\xb1\xa3\x9e\
-\x08\xcd\xd0\x16\xf0\xf6\xfe\x80KDFX\x1b\x82\xa3\xec\
->0#\x00N]h\x00x\x5c\x00\xf0\xd2K\xf7\xdc\
-\xf3\x82\x03\xc03\x06\x80\x9e\xd6[\xc2\x81\x03\xd8\x9f\x06\
-\x91\xed\x87\xbd\xd4\x947\x8bN\x8e\x06\xbd[ f\x01\
-5\x12Z\xc9\xae\x13\xf2\xd3\xdf=;|\xea(\xbb\x0d\
-\xc8\x08\x80\x13H\xffU\xb7\xa1\x03\xbc\x83\x00\x18\x07x\
-\xc2\x18@\x00\x00\xe4\x00\x0c\x80\xab2\xfc\x0c\x90\x9a\xf5\
-v\xf1\x89\xa4g\xee@\x1e@\xef\x15\xc4\xb3\xc0~~\
-\xad\xa0\xac\x01q\x10P\x0e\xc3\xe0H\x00\x90c\xc0\x97\
-^z\x11\x1d@\xe9\xcf3\x00\xa6\x00\xeb\x13!\xc8\x01\
-l\x00\xce\xbd*\xc3e_\xa3>0\x22\x156n\x80\
-\x06\x14\xf6\x1eY3\xe0\xb1\x00u\x95\xa8t\x80\xc56\
-\x00\xbc\x0f\xcc\x0e\x00]\x02\xbcD%\xc0\xbd\x0a\x00\xbe\
-\x15\xa0\xc7\x00\x16\x00\xb0)|\x15}$X\xeb\xd4\x01\
-\xa8\xe1\x1f\x19\x93\x88\x09\xc6\xc6\x0d\xb0?\x853AY\
-\x0a\xae\xb4\xf3\xc0\x0e2\x00\xeb\x02\xa1\xb2\x80A\x00\x9d\
-\x16\x98>\x00w!\x00\xb7\xdd\xf6\x07Y\x02\xe8\x1a\xd0\
-\xaa\x01\x9eQg\x04\x9f\xc5,\xa0uSU\x04H\xfd\
-[\x07|$D8\x95A\x11\x7fh\x94\x07\x99\xdfh\
-{\xb8\xc1 0\xc3\xea\x07MG\xa8\x0c\xc0\xe3\x000\
-\x08\x08\x01\x009\x04\x00\x00^2%\xc0\x13O\xb2\x14\
-`\x1c\xe0\xac\x86\xecS\xc1\xa4\x03\x08\xfd\xc5\x0d 8\
-7K\xe9k\xe4\xc7\xc6\xb9\xe6a>N\x08\xfd@\x98\
-\x00\xcd\x03z)\x0f\x90\xef\x18E\xef\x1a\xb1c\x87\xe7\
-\xddB\xc6\xea\x0da\x02\xe0\x9b\xe6\x22\xe1\xcc\x00x\xf8\
-a\xe5\x00\x00\xc0\x0b\x94\x01\xec\x14\x00E\xc0\x12\xbe\x15\
-`\xa5\x00e\x00\xad\xaf\xb2>\x16&Q\x9c\x1bv\x14\
-\xf0\x07G\xfaq\xf4\xeb\x9f\xfe\x1a\x93\x81!\xc0l\x10\
-\x83\xfc;\x84\xf8;\xe8\x09\xbemT\x85\xd5\x05\xf4\x0f\
-\x13\x00\xa1\xff\xc3\xb7\xdd\xc6\x1c\xc0\x00\xc0K\x00U\x03\
-\xf4\xb4\x1d\x80\xca\xc0\xd6W\xa1\x03\xb4\xce\xc1\xa7\x82\x86\
-\x15\x97\xe4 \x12\xd5\x97fv)l\xa0\x95\xde\x19\x90\
-y`\x07\xa9\xbf\xdfz\xcf0:#\xa4\x8c\x9d\x13\x14\
-\x1e\x00r\x0a\xf0\x8e\xcc\x00\xbe\x00\x80\xfe={z\x00\
-\xe8L\x04(\x1f\xc8\xd5\x8a\xcf\x05$\x11\x02\xf3\xd3K\
-.\xc1B\x80\xca\x81\x1bh$\xa4\x9a\x01Y\x0a\xd2\xe2\
-_\xa9\xde3\x8cO\x02\x0d\x00\xce(0\x93\x14\x00\x06\
- 2\x80 \xe0\xa5\x04\x00\xd0$\xb8gO\xbb\x06h\
-M\x0epUk\xe9\x03)\xc7\xb9\xb9\x8a\xe8\x90\xc8*\
-Q\xe8\x1d\x0c*\x07\xe4H\x08'\x02;\xe8}C\xc1\
-\xfe\xe9\xcbr\x00\xb7\x06\xc8\x1e\x80U\x06\x00j\x02\xee\
-\x09\xee\x02\x97X\x0e\x00\xfb\xc1\xa7S\x0ah\xed\x10\xd0\
-:\x8d\xb8*/qn~B\xbd}\xe2%\x00\x0e\xa4\
-\x02*\x09\xcf\x94\x1f @'\x8b\xc2[\x07\x83\xec+\
-M\x05(\xdf;vD\x04\x0e\x80%\xc0mr\x0cd\
-\xc6\x00\xfe{A\xc2\x01\xa0\x0c<\x03>\x1e\xe6ty\
-F\x00C -\xe1\xf3\x0b@\x9eah/\xaf\x9b\x91\
-\xbd\x01\x9e\xb0Z\xd5J\x10P!\x11@\x13\x90\xef\x1e\
-\x5cA\x00,Vg\x85\xf26\xd0\xd9\x0c\xc8\x14\x807\
-\xa4\x01\xd8)@\xcf\x01\xd4(X\x18@O\x04\x00\xfa\
-\x00\x04\xe0\xf4\xd3[7-N\xd5\xf3\x0e\xc0%\x90<\
-~\xf31\x9e\x9c\x00\x03\x81*8/\x19M@\xbd}\
-4\x06@\xa0\xf4/\xb7\xde10L\x00nc\x19\xc0\
-\x02\xc0\xdd\x0b \x00\xeaH\x00Noz\xba\xe5\x00\x05\
-)o\xdem?\xd8\x01\xda\xab\x8dL\x05\x00~\xa8\x00\
-\x10\x00K\x7f\x86q\x00\xf9\xf6\xe1\xe5\x96\x038\xd7\x07\
-f\x05\x00/\x01^x\xc1\x03\x80\xfa\x8c\xa8%\xee4\
-\x98\xcf\x03|QH\x18\x9dk`\xa4\x01\x00\x96\x04\x1f\
-\xb7\xbf\xe4\xe3\xdf|\xfc\xeb3\xe9c\x04\x81\x00\xfc\xd4\
-\x10P\xbe\x02\xd4\xaf\x98\xa1?GD\xcf\x81B\x05\xe0\
-a?\x00\x9e|\x92]\x17\xc6\x01h\xb4\xc4\xba:\xb0\
-\x0ek\x079\x00\x9d\xe3H\x12\xd7\xd2;)\x5cr\xc9\
-\xc7\xe2A\x7f\x8c\xe8\x0dU\xa8\x7f\xaf\x8a\x0a\xfa\x00\x11\
-\xfa\xfc\x08Y\x03xR@\xb8\x00\xa8\x93\x01\xfc\x1d\xc0\
-\xec\x07\xf6\xf4w\x00\x0d\x80\xda l]\x5c\x91s\xa3\
-\x00\x06\xda\xa3\x03\x88/\xfcLi0\x00\xb8 \x05?\
-D\xac\xd7\x8c\x0a\x90\x9d:\x00\xbf\x1a\xe0\xfd\x10\x01\xb8\
-\xcd\xda\x0aR5\x80\xba.\xe8\x99g$\x00m,\x00\
-\x12:@-V6u\x00\xce\x95)\xa0\xfd\xc7\x1a\x00\
-`\x00>R\x08,\x80\x8c\x1f\xe5W\x00\x94\x8f\x88\xa0\
-\x06`\x0e`\xba@\xe7|\x10\xed\x00\x8d\xf4vP\xa0\
-\x03\xd4\xe2\xf4\x9f\x1e\x00\xf0f\x1a\xed\x95\x03\xc8\x14\x80\
-\x1f'\x8b\xc2\xc3\x07\x89\xcd@\x0av\xa8O\x12S\x0e\
-@5\xc0\xb4\x08j\x80\x97L\x1bx/\xaf\x01L\x11\
-\xc0\x1d\xc0 \x80\xf3\x80\xd3O\xd7s\x81\x1a\x1f\xd9\xbb\
-\x91~\x8a\x9f\xae\xd4\xfecY\x06|\x5c\xd5\x0a\x11\xa8\
-\xd2\x9f\x22(\xe5\xaf`\x1f#6\x16?AhZ\x04\
-)\x80\xf4\xbf\xe7^]\x04>\xe2\x03\xc0\x92\x9e\x0a\x81\
-3j\x15\x00ag&\x89\xc3\xb9\xf0)+\x0c\x80\x1b\
-0\x0bTtd\x9f&\xaa[\x00\x0d@\xffH\x01x\
-\xe1\x1ew/ \x00\x80:g\x9cQK\x1d \x1c\x9e\
-$\x00\x9d;o<Wf\x81*\x0d@EG\xf6Y\
-\xa2\x1e\x07\x08\x19\x00\xda\x09\xf8\x83q\x00\xb6\x17\xf0\xfc\
-\xf3\x8f\x04\x03PkS@\x18\x00\x18\x06:wV\x00\
-\x18\x07\xa8\xb2\xd7?\x95\x00\xe5\x11\x03\xf0\x12w\x80'\
-\xccV@\x0c@\xee\x01\xc0\x14\xe0~\x9e\xb0\x06`L\
-\xa4\x00X\x9b\x811\x00\x85\xeb\x00\xafG\x0e\xc0\x131\
-\x00y\x02\xa0\xca\xa9\x02\xe7D\x0d\xc0m<\x05\x04\x01\
-\xf0\x97\x18\x80\x1c:\x80I\x01\xf8!\xa2\x1e\x00\xde\x0f\
-\x0f\x00sB\x10s\x00M\xc0\x9a\xe06\x10\xba\x803\
-\xe4\xb6`\x1c\xe9\x05\xbd\xbf\x0a\xbc\xbf\x1a\xbc\xe1\xbe\x06\
-@\x8e\x03\xab\xec.P5\x01\xbc\x06x=2\x00\xcc\
-$X\x03\xc0O\x0b\xc5s\x02\x14\x00g`+\x18\xcb\
-\x99\x01\x00\xc0\x00X\x00~\xe6N\xfbs5\x00g\xd2\
- \xa8\xcaM\x01\x12\x802\x03@\xe8\x93@i\x00\xf7\
-$\x00\x80\x10\x80i\xa0\x9e\x07ZC\xe18\xd2\x0a\xf9\
-\x91\xcb\x10\xb6\x03\xd8E\xe0\x9c\xdc\x02p\xaf\x0d\xc0#\
->\x00,\xb1\x00\x88\x09\xc8\x1a\x80\xcd\x1b\xed\x0c \xd6\
-\xff\x1c&\xbf\x17\x80\xe9Q:\xc0=1\x00\xb9\x06\xe0\
-c\x07\x80\x8a9\xce 8Z\x00L\x1bx\x8f\xb7\x06\
-\x88\x01\xc8e\x0a\xa8\x92\x08\xccq\x12@\xa4\x00\xb8\x93\
-\xc0\x9c\x03\x80\xcd\xc4\x19\xb5\x1a\x00\xc7\x02\x98\x03\xcc\xd1\
-]`\xe4\x00<\x9e\x0f\x00\xb0\x918C7\x14g\xd4\
-N\x006;E`\x80\x03\x8c\x88\x0c\x80\xe06\xf0\xf9\
-\xe7#\x04@\xea\xce\xa2v\x11\x90\xd0\x01\xe6H\xf9+\
-\x8c\x03\x18\x00\xde\xb7\x01\xf8F\xd8\x83 \xf6\xfe\x00\xee\
-IAK\x1a\xc1iA=9\x01\xb8-L\xfa%V\
-[\x89\x9erX\xfffM\x0c\xab\x08\xd8\xcc\x1c\x00B\
-\x08_\xc1\xf4\xc7\x93\xc2\xcb`\x10\x88\x00\x0c-(\x00\
-\xd4-\x05\xfdSG\xa0N\xcdG\xc0r\x00\x00`\xb3\
-\x02\xa0B\x01P\xe1\x05`V\xae\x00x$D\x078\
-\xa3N\xda\xeb\x9f!pF\x0dE \x1d\x07(\xcf1\
-\x00r3($\x07\x08\xf6\xff\xff\xd6q\xc6\x7f\xfb\x22\
-`\xfd\x17j(\x00P\x05n\xb6\x1c@\x010g\xce\
-\x1c\xdb\x01\x86\xe5\x02\x00\x96\x01\xc2q\x00\xb5\x90\xeb\x04\
-\x89\xaf!\xa8]\xa5\x00w\x00\x01\xc0f\xcb\x01$\x04\
-V\x13\xc0\x01\x98\x1a\x0d\x00/X\x00\x84\xe4\x00\xbe\x06\
-\xe0h\xffX\x00\x035\xb9\x14p\x1c !\x00\x1e\x07\
-\xc8\x09\x00\xe18\x80\x9f\xfeZw\x1d\xc9\x11\xa8q\xa5\
-@\x22\x07\xa8\xc8\xb5\x03\xbc\x94\x85\x03\xa4\x02\x80W\xff\
-\xc7\xbcQ\xcb\x5c\xa0 \x1c\xc0g\x10\x14\xd8\x06\xb6\xf9\
-\xcb_\x9a5k$\xdf'\xa0\xa193$\xbdp\x97\
-~\x00\x04\xff}F\xcd\x0dS\xd3*\x046\x13\x00\x9b\
-\xfd\x1c\x80\xe4W\x93\xe0\x88\x01ps\x00\x02\x00\x9f\x1a\
-$\xaf\x0f\xa4\x8b\x84\x1b5j(c\xefYiEC\
-x\xa3\xa9\x9eF\xfe\xaf\xbf\xfe\xdd\xef\xfe\xf8\xc7\xdf\xff\
-\xfe\xd1\x7f\x1e~\xfai\x0b\x01\xc1\x98}\xe2AM\x8a\
-:{\xf7\x0a\xf1\xb7\xd4\xd9\xb8W\xdc\xc0\x01\x90\x00\x0b\
-\x00\x16\x8b\x17+\x07\xc87\x00\xaf\xfe\xc5\x9e\x077L\
-W!\xf8\xfbF\xff\xb2\x7fl\xda\xb4\xe9\xcf\x08\xc0\xef\
-\xef\xbbo\xc3?\x9f\xd6\x0c@M\xd8S!P3\x19\
-03\xf4-\xca\x02L\x16\x983\xa7\xaaB\xfb\xbf\xbe\
-,\xa8\xf8\x01h(\x0d@\xae\xfe\x87P\x7f\x04\xe0>\
-\x08\x8e\xc0c\xe0\x012\xd5\x9cuV\xcf\x9a\x0a\x00\x18\
-\xc1\xc6-\xc2\x02\xa4\xfc\x9b\xa5\x05Ty\x1c\xa0\x9c;\
-\xc0\xeb\x11\x02po\xe4\x00H\xfd\xbf\x5c\xb0@\xe8\xff\
-g\xad\xff\xa3\x8f>z\xc5?\x0e\xbb\x08d`3E\
-\x07\x00\xd5\x81\x84\x80\xca\x01U\x0e\x00\xb6\x03D\x09\x80\
-\xfdf\xd1a\x03\xa0\x0b\x80\xc3\x0bn_\xf0\x10\x19\x00\
-&\x00\xd0_\xc4\x86\x7f\x94=\xad\x19\xf8o\xee\x02\x0d\
-k\xab\x03,&\x00\x16\x8f(~\x07`\xfa?\xd6\xbb\
-\xb7\x04\x80\x1b\xc0_\xff\xfa\xd7+0\x0f\x98Z\x00\x8b\
-\xc1\x9a\x89@z\x0eP\x9e3\x07\x88\x0c\x00\x96\x00\x9e\
-\xfe\xf2+\x0e\xc0\xefI\x7f\x11\x02\x81\xbfn8\xec_\
-\x0a4\xac=\x0eP\xe5\xe9\x02\xa2\x03\xe0a\x9f\x22\x90\
-\x11\x80\xe7\x85??\xdb\x22\xa0\xd1\x12\xf5\x96q\x1a\x81\
-\xa4\x025\xe4\x05\xe0\xd3_\x7fE\x0e`J\x00\xd2\x9f\
-\x10\xa0R\xc00@\x08\xa8\xb6\xd0\xfa\xff4,r\x02\
-\xc8\x01\xb6\xa8.@DUy\xd5b\xcb\x03\x16\xf3\x1a\
-`l\x7f\xf3\x0e1\x11\x01\xe0\xb4\x01.\x00m\x10\x80\
-Fl\x1a\x94\x02\x00\x0dU\xfd\xdf\xb3'J\xfa\xf4W\
-\x02\x00\xac\x01\x7f\xe78\x80D`\xc3?\x9e\xa6\x90\x0c\
-\xf4\x94a\x90S\xff\xb7b6\x06\xa1>\xcc\x036n\
-\xb1\x00\x80X\xcc<`\xb1\xd3\x04D\x0d\xc0\xbdQ\x01\
-\xd0\xd0\xe8\xff\xb5\x01\xc0\xab\xbfD\xe0_\x1c\x80\xc7z\
-\xba\x0ch\xe5\x8b37\xec\xf5\x02\xb0E;@\xb9U\
-\x05\x12\x00#r\x06@$\x0e\xa0\xf4\x97\x19\xe0+\x02\
-\xe0!\xbb\x09 \xf17lP\x08P\x1e0\x0c\xd8&\
-\xd0\xb0\xf8M\xa00\x1d I\x0d\x90\x09\x00\xc6\x00\xc8\
-\x01\x0eOV\x00l\x82\x14\xf0G\xab\x060\x08l\xa0\
-R@\x13\xe0M\x04\xc5\x8b@\xedr\x80\x86\x0dy\x06\
-x\xfa\xe9\xaf'\xab\x14 \x01`9\xe0\xaf<\x11l\
-\xf8\xfai\xcb\x054\x01=\x9dR\xa0H\xf3@\xeds\
-\x00\x05\xc0d\xec\x02\xe4 \xd0J\x02\x1b\x18\x02\x09J\
-\x01\x8d\x003\x81\x865\xc4\x01\xa0\x0dp\x1d\xa0\xbc\xbc\
-\xa8\x1d\xc0\x01\xe0+\x09\xc0C\xbc\x0d\x00\x04(\x01l\
-\xb0\xaaA\xbf\x96\x90\x11P\xd4y\x80\x00\xd8\xe28@\
-\xb9\xaf\x03\x8c0\x00\xbc\xcf\x01\xf8f18\x80J\x01\
-\x8f\x19\x00&0\x00\x14\x012\x0bp\x02L)\xf0\xd8\
-c5\xa9\x1a\xdc\xeb\x05@9\xc0fp\x80\xc5\xf6\x14\
-\x80o\x05D\x06\x80K\x80\xba8l\x0d\x020[\x9e\
-\x14\xd2\xa0\x0d\x9d\x14\xf0\x97F*P\x0a[\x12'\xd4\
-\xaaE\x00^yE\x02\xd0\x1b\x01\xb0\x08\x08B\x00\xa6\
-\xc3\xaf@x\xeaAe\x07=\xf5\xff\xa8a\x91\xc4^\
-\x13\x80\x80\x086\x09\x82\x98#\xbf\xcc\x1c\xb0\x8c>3\
-.b\x00^p\xaf\x0e\xcc\x1e\x80\x86L\x7f\x05\x80j\
-\x03\x08\x00]\x06\x18\x04\xbc\xa5\x80E@3_\x02\x8a\
-\x08\x01\x06\x80p\x80-\x1b\x95\x03,\x16\x08\xe4\x1f\x80\
-{\xa3\x00\xa0\x99\xd0\xed\x97\x0c\x80\xdbm\x0b\xa0,\xa0\
-\x5c`\x83S\x0db\x1eH`\x02=\x19\x02\xc5\x05\xc0\
-\x96\xbd\xb8\xfc\xb9\x03\x94\xd7L\x07@\x00~I\x00L\
-\x9e \x01\xe0\x04\xc84\xc0\xf6\x05\xacR\xe0iD\xe0\
-\xb1\x00\x04\x1a6,.\x04\xb8\x03\x08\x03\xd8\xa2\x1c\xa0\
-\x1c\x10\xa8i\x0e\xc0\xf7\x01^y\x9a\x00\x98\xa0r\x80\
-\x00@\x13\xa06\x86e\x1e\xb8\xc2.\x05\xfe\xe5\x96\x02\
-=\xfd]\xa0(\xf2\xc0\xde\x86\x96\x03l\x94U@\xb9\
-v\x80\xc55\xc9\x01\x18\x01\x12\x80\xaf\xc8\x02T\x12\x08\
-@\xe0\x0ag* \xf3\xc0cI\x8a\xc1b0\x81\xbd\
-\x0dm\x07`\x16`\x00X\x9c\x08\x80QET\x03\xe0\
-_\x90)\xc0\x05@{\x80$\xe0\xf7<\x0fl\xb8\x22\
-I)\xd0\xb3Y\x91\xe6\x01\xc7\x01T\x1bP.\xaa\xc0\
-\xf2\xfc\x03\x10e\x0d\xa0R\x00L\x02\xb0\x0a0\x040\
-\x04XC\xe0L\x05\x9eN\xe8\x02\x0d\x8b\xa5%\x0ct\
-\x80\xcd\x8b\xf3\xe5\x00\xecC\x83\x128\x80 \x00\x19h\
-\xd6\xa8\x99\x02 \xd5\xc0&P\x020y\x02\xf6\x01\xb2\
-\x0e\xd4\x04p\x04XC\x90\xb8\x14h&\xa2g1\x85\
-U\x06\xda\x0e \x96\x7f\xa0\x03\x0c\xcb\x13\x00k\x08\x80\
-\xd9\x12\x00$\xa0\x0d\x00\xd0,-\x00\x9a5S\x00\xfc\
-\xdf\xb3\xcc\x02t\x12\x90\x04X.\xa0M\xc0\xca\x03_\
-\x1e\xf6C\xa0Y\xcff\xc5I\xc0^E\x80\xf4\x80r\
-\x8f\x03\x94{\x00\x18Z\x8c\x00<\xa6\xba\x00\x03\x80M\
-\x80\x8d\x80U\x0alpZB\x7f\x04l\x06t\xedY\
-,\x16@5\x009@\x15\xd7\x9f\x9f\x118&\x22\x00\
-X\x11\xe0\x9c\x17L\xdb\x01\x04\x00\xee\x07\x08\xf53\x05\
-\x00\xe7@\x12\x80\xaf\xbeB\x02\x1e\x92e\x80?\x02\x8f\
->\x1a\x90\x07\xf4t\xf8\x95_\xc2\x7fV'\x82\xe2p\
-\x81F\x02\x81F\x0c\x01\xea\x02U\x11 \x16\xfc\xe2\xf2\
- \x00(\x03\xc09\xa1\xb9\x00@\x17\x01\xcf?\xff\x8c\
-\xaa\x02\xe0\x12\xc1\x8c\x00\xf8%\x04O\x01d\x01\xca\x03\
-\x88\x00\x9fR\xc0g\x83\x80O\x87\x05\x02&\x8a\x04\x01\
-\x0d@C\xb6\x19\xb0Y\xe6\x00\xb4\x80r\xa3>d\x80\
-\x9a\x06\x80\xca\x01\x82\x00\xd5\x0a\xa84\xe0\x83\xc0\xa3\xca\
-\x046\xf8\xb7\x84\x06\x81f\xcd~)\xfe7E\x07\xc0\
-\x96-uX\x0e\xc0s\x02\xca=\x06P\x93\x00x@\
-\x12\xd0\xbb\xb7\xf2\x00\x1c\x08\xf9\x22\x90Z)\xa0\x10\xc0\
-\xffI\xd1\x01`\xfa\x00\x1a\x06\x8a2\xd0q\x00\xd9\x05\
-F\x02\x80g\x10\xe0\x02\xf0\x08\x03\x80\x8a\x80W\xd50\
-\x80\xc6\x01K\x96,i\x94<\x14\x00\xaf\xbc\xa2\x01\x90\
-\x16\xf0\xd0C\x9a\x80\x00\x04\x02K\x81\x7f=\xf7\xca+\
-\x9c\x80f\xe0\x02\xcdt\x8bZ\xb8a;@\x1d,\x02\
-\xd4$\xb0|\xb3\xe5\x00#L\x17\xa8\x01\xd8\xc3u\x14\
-\x00\x00 \x00IDATx=B\x00\xac7\x0b}\
-\x22B\x00.dI@\xd5\x01\x81\xa5\x80>i\xd0-\
-\x05\x0e\xbfb#\x80\x89\xa0\xe0\xf5w\x000\x060\xc2\
--\x02\xcb\xe5\x9bC\xe4\x08\x00\xfe\xf1\xd1N\x0e\xa0Y\
-P;h\x05q\x1c\xf4\x17\x9a\x07\xd1\xd1n\xd6,\xd1\
-Q\xc7\x7f\xaa\xe4\x7f\xe59\x09\x00\xd5\x81\xbde3\x98\
-\x14\x81\x80R@\xe4\x01\xed\x02\xda\x07D\xb4i\xd3\xac\
-M3\x19\xfa\xb7(0\x08\xc4-\xa8\x11$\x04\xca\xd1\
-\x00F,V%\xc0X\xbe\x17T\xcc\x00p\x0b0\x04\
-$B a)\xf0\xdcs\xcf\xb9>`\xc9_\xa0\x08\
-\x18\x00tH\x07\x90}\x00\xddY\x0dX\x93\x00\xd0U\
-\x00f\x81\xd4\x10HP\x0a\xf8\xb9\x00\x99@#\xe6\x02\
-\xcd\x0a\x0a\x01\x8f\x03`\x0d0\x02\xd6?K\x02#\xf0\
-\x9a\x80\x9a\x09\xc0\x85\x13U\x19\xa0\x000\x08$-\x05\
-\x9c\x8db\xe6\x02^\x13hV\x90&\x90\xdc\x01\xcak\
-\xa8\x03\xfc\x0f\x07`B\xef\x94\x11\xb8/\xe5R\xe0\x15\
-\xe9\x02m\xda\x140\x02\x09\x1c`\xb1r\x80\xf2\x1a\xe9\
-\x00\x1a\x80\x0b'N\xd4\x04,X\xa0\x10H\xbd\x14\xb8\
-\x22\xa8\x14P\x0dA\x1bS\x0b\xeaR\xa0`\xf2@\xb0\
-\x03XI\x80\x8d\x01j\x14\x00\xcf\x02\x00\x13\xa4\x05\xc8\
-\x89\x90?\x02\x9e\x0d\x82\xfbR/\x05\xacf\xa0\xc0J\
-\x01\xee\x00{Y\x1fXn\x10(\xd7\x0eP\xb3\x00\x90\
-\x16p\xe1\x85\x94\x04\x12 \x90\xb8%tK\x81/\x0f\
-\xfbT\x83\x02\x806*\x09\x14T\x1e\xf0:\x00\x93\x7f\
-\xb1j\x04\xca\x17G\xe9\x00w\x05\x00\x80\x04\xccd\x1b\
-\xc2\x08\x80\xb8\xb7kG\x00\xd0\xa60D\xb3\x14C\xeb\
-\xaf\x00@\x02&j\xfdSG \xf1t\xd8\xdb\x13\xe2\
-/\x99\xf2\xef\x99\x83p\x01`'\x85l\x19\xa1S\x00\
-U\x02\x98\x00\xca}\x00\x18\x15\x1d\x00/8\x00\x10\x01\
-\xb3!\x04\x00\xedB\x03\xe0Y\xb0\x80\x096\x01\x0c\x81\
-\xcc[Bn\x03H\x01$\x824~\xd5\x1c1\x00\x00\
-4R;\xc2\x95(\x7f\xf9\x96\xcd\x0c\x00\x95\x04\x98\x03\
-\x8c\x91\x1f\x1d^\xf4\x00<\xa0\x00\x98\xe8\x22\x90z\x1e\
-\x08\xdc(v\x10 \x13(,\x17`\x004\xe4\x0e0\
-\x02\xbb\x00^\x04\x94\x97\x8f`{A5\x0b\x80\x9f\x9d\
-\x03\x00L\xb4\xd2@\x18\xa5\x00\xe6\x01\xbb\x18x%\xcd\
-\xdf6\x97\x0eP\x89e@\xa5\xd9\x0e\xb4\x1d\x80\xde'\
-\xbaf\x02 \x08\xf8\xb9\x00`\x22\x07 \x82R\x80\x06\
-\x03m^i\xc3\x07\x03\x85\x94\x02\xb4\x03\x8c\xa0\x1a`\
-s-\x02\xe0\xc2\x0b\x7f>q\xa2\x95\x05\x1c\x04\xb2)\
-\x05\x9cr\xb0\x80\x5c\xc0\xe3\x00\x95\xe6\x0a\xc1\xe4\x0e0\
-4\x1a\x00\xde\xf1\x01`\x91\x0d\xc0\xec\xd9\x0a\x80\x06m\
-4\x04\xa2\x1bL|`q\xe5\x89\xe0\x00\xe8\x1c\x00\x04\
-L\x98\xe0 \x90F\x1e\x08\xde(\xb6\xf3@\x1b'\xb4\
-\x19\xe4\x05\x09\xdd\x0b\xee\xdd\xa3\x1c\xa0\x92\x1c@\xd4\xfc\
-\x05\x05\xc0\x22\x0f\x00\xcf\x84\x08\x80$ ;\x04\x12L\
-\x87\x13\x22\xd0&o\x08\xec\x11\x00\xec\x81{\xe5\x1e\xb1\
-\xfe+\xc5\x9d\x1c`\x04\x8c\x02\xbc\x00\x8c\xb0\x01x\xbd\
-\x06\x00`r\xc09\xe7\x00\x00\x1a\x81\xe0R \xd3\x8d\
-b^\x0ax\xe4\xcf\x13\x02\x12\x80F\x95\xc2\x01$\x00\
-\xb2\x0a\x1ca\x03P\x9es\x00^\x04\x00$\x013g\
-\x0a\xfd\x09\x00\x81\xc0lM@\x83v\x0dX\xb4I1\
-\xa4\x06\xcfy\x00 \x02&N\x0cr\x81\x87\xb2/\x05\
-\xac\xb9\x80\xaf\x15\xe46\xf6\xecA\x08\x9a\x01\x02{\x10\
-\x00\x11\xa0\x7f\x99@@8\xbe%\xbf\x06`\xac\x03\xc0\
-\x7f\x167\x00\x0f<\xf0[\xac\x02\xce\x91u\xc0D\x8d\
-@\xb6\xa5\x80w\xa3\xd8\x83\x00\xfd\xd6\x0d\xf6\x08-\xf2\
-\x0b\x00\xe6\x01\x0a\x0d\x00\xf3\x00\x84\x81\xf6\x02\xe9\x8d\x82\
-\xc7\xc8\xf7\x08\xab\x09\x00\xfc\x16\x00\xf8\xc9\xcf~\xf6\xb3\
-\x0b\x0d\x01\x99\x22`o\x14\xfb\xb4\x84.\x02>\xbf\xf6\
-\x9e<9@#_\x07\x00\xe1\xe9|\xd0\x1a\x0b\x80p\
-\x80\x9f@H\x00~\xceM`B\xa8-\xe1\xd7\x04\x80\
-/\x02\x0d\xf6\x14\x8c\x03T\x22\x00V\x1f0\x82\xce\x07\
-\xcc\x05\x00>\x83\x80\x993\xcd\xf5\x81\x02\x00\x89\xc03\
-\xed^m\xf7j\xc6\x00<\xe7\xa4\x00\x00@v\x02I\
-\x10\xc8v\xa3\xb8\xb0J\x01\xa8\x8c}\x1c\x00\x1b\x81\x11\
-\xca\x01t\x09X\x10\x00\xa8>\xe0\x99g^m\xf7\xea\
-\xab\x19\x02\xf0\x9c\x0f\x00T\x07\x12\x01Y\x97\x02\x89\xa7\
-\xc3\xcf%\xee\x0a\xf2\x00\x00\x04\xf5\x01\xc6\x016\x0b\xe5\
-7\x8f\xd05\x00\x07`\xcc\x185\x08\xacA\x00`'\
-p\x8eE@V\xa5\xc0}\xa9\x96\x02m|K\x81\x5c\
-\x03\xb0\xa7\x11\x19\x009@\x19\xce\x82d\xf1\x07U@\
-y \x00\xa3k\x0c\x00?\xf3A`Bd\xd3a\x88\
-\x07\xf3\x8e\x80\xe5\x00\x94\x03\xb6\xa8$ \x00\xd8\x5c.\
-+\xc1\x11f/02\x00\xfc7\x03\xeeu\x00X\xf3\
-<+\x03E\xd8U@R\x14\x1a4\x80\x03\xfe\xa0\x06\
-\xe0\x7f,\x00\x82\x11\xc8l\x970\xe1F1\xda\xc0\x83\
-\xaf<\xa8\xabA6\xd3\xd2\xbfn\xe4\x00\x88JP\x0e\
-\x85T\x0d s\xc0\x08\x1c\x06\xa9:\x80\x8f\x81\xac\xbd\
-\xa0(\x01\xb8G\x030s\xe6\xa2'\x16e\x0f@\x03\
-\x09\xc0\x83\xc1\x00\xa8\x91P\xf4\xa5\xc0S\xca\x05\x0c\x03\
-\x0d\xbc]M\x1a\xd6\x96A\xe0\x7f{\x0f\x9d\x9f\xb0\xa7\
-\xd9\x9eJU\x06V\xea-\xc1\x11\xaa\x0b\xa8\xb1\x00\xfc\
-\x0f\x0c\x02~\xfb[\x03\x80\x8d@t\xa5\xc0X\x9d\x07\
- \x5c\x02\xda(7h\x10%\x02\x06\x80=\x10\x95\x0d\
-I\xfeJ4\x802\xaa\xfbu\x12\xa8\xb9\x00 \x01\xbf\
-5\x00\xb0\xc1p\x8eJ\x01?\x04\x1a\xe4\x00\x01\x17\x00\
-\xab\x11\x04\x00 \x09\x94\x8f0s@,\x01j*\x00\
-\x9c\x80\x9f\x85Y\x0a$\xde(\x96\xd5\xa0\x9f\x0bD\x9e\
-\x07,\x00\x1aY\x0e n\xb8',\xcd_N\x01\x22\
-\x07\xe06\x05\x80\xf5\x8e\xf1\x04\xc0\x22\x0f\x00\x88@\x03\
-\x0b\x82\x94\x02W\x9c\x0b\xc0\xb3?\xf9\x89\xd7\x04B.\
-\x05\xbco.\xf2\xd4S\xb4\xfe1\x1a\xe4>`\x1a\x08\
-_\xb6\x03\x94\x89{Y\x99\xa3>\x07`\x16\xce\x81\x1c\
-\x00\x8e\xc9\x1f\x00\xcf\x84\x01\x00\x0e\x84\x03\x10H\xa9\x14\
-\xc8h\xa3\xf8)\x9d\x02\xf2\x80\xc0\x1e\x1b\x005\x0c\x86\
-*\x10<\xc05\x00\x17\x80\xa1\x05\x03@\x83\xd0\x00\xf8\
-\xd3\x9f2(\x05\xb2\xdb(\xd6\x08\xe4\xc3\x06\x1c\x07\xc0\
-\x1cPY\xb6E9\xc0f\xa9\xbc.\x02\x0b\x14\x80\xf0\
-\x1c@\x10\xf0'\x9b\x80s\xc2\xca\x03\x897\x8a\xb5\x0b\
-\xe4\xcf\x01*-\x07\xa0Y\xa0r\x80\xf2\x9c:\xc0;\
-\x1c\x00\xaa\x02\x17-R\x00\xacYs\xe7\x9d\xb3\xe1\x86\
-qq;\x15\xe9\xc9/\x00x\xca\x17\x00 \xe0O?\
-\xcbqK(J\x81\xa7\x1et\x22w\x14\xb4i\xb0g\
-\x8f\x8d@YeY\x99,\x02\xac\x04\xa0\x06\x81\xfa-\
-\xa2`/(b\x00\x9e\xcc5\x00\x8e\x09$\xef\x07B\
-\xd9(\x16\xc5\xe0sy\x01`\x8f\x01\xa0rO\xa5\x09\
-l\x03t\x02\xc8#\x00\xf7\xe6\x1e\x00\xc7\x04R)\x05\
-B\xb8\xa2\xf8\xa9|\xb9\xc0\x9e\x06\xc6\x01$\x02\xd8\x05\
-\xda\x0e\xa0\xce\x08\xc6\x0cP\xc3\x1d\xc07\x0f\x9c\x13\xfd\
-t\xf8)\xab'D\xf9\x1f\xcc\x85\x034\xf0w\x00'\
-\x05\x94\xe5\x09\x80{\xf3\x02\x80\x7f\x1e\xc8G)\xf0`\
-^\x1c\x80\xaa\x00o\x0dPk\x1c O\xa5\x807\x0f\
-\xe4\xc9\x01\xca\xac\x1a@:\xc0\x88Z\xe5\x00\x19\x94\x02\
-\xa1l\x14{K\x81\xbc8\x00\x94\x01\xb5\xdd\x01rS\
-\x0a\xf8M\x87m\x06\xf2R\x03l\xc1\x14Pf\xad\xff\
-H\x1d\xc0\xda\x0dz\xe7\x1d\xf7\x8c\x10\x04@m\x07\x09\
-\x04\xae\xbbS\x84\x0d\x00\x22\x90\x18\x05\xf1O\xda\xa9\xc3\
-*\x0err\x00\xf2S\x0a<E\x08\xd8F\xc0^\xa5\
-z\x85\xed\xd2\x9f\x81\x06Q\xb0\xa7\x81\xd9\x0e@\x07\x18\
-F\x16P\xe6)\x02\xc7\xaaSBk\x09\x00\x99\x96\x02\
-\x0fe]\x0ax\xeaA\xf9\x22\x99\xdf\xb5\xcb\x0e\x01:\
-\xaf~\x0f\x03\xa0R\xdc?Pe\x80\xb6\x802Y\x00\
-\xb8\x00\x0c\xad\x1d\x00DY\x0a\x04o\x14'@\x80\xef\
-\x7f\x84a\x02\xab-\x07\xd8\xa3G\x81\x95\xc9\x1c :\
-\x00\x1e\xf7\x02\xe0T\x01k\x10\x00\x81\xc0\xc5*\xda\xa5\
-\x1c\x0f\xb6K\x0f\x80D\xd3\xe1\xa8K\x01\x83@;\x0e\
-@X!\xc4_\xdd\xc0r\x80J\x7f\x07\x90\x160\xac\
-\x80\x01\xb88B\x00\x92\x96\x02\x13\xc2\xd9(\xbe\xc2\xa7\
-\x14\x08\xa8\x04\xac|\x80\x17Iep#\xfb\xb0\x1d\xe0\
-\x03\x04`\x98\xda\x0f\xd0%\xa0\x1e\x04S\x0dX\xdb\x00\
-H1\x0f\xe4\xa0\x14h\x17\xc4@&!\x0d\x80;\x00\
-\x01\x00E\xa0\xde\x0f*\xb3v\x02,\x00\xa6\xe6\x06\x00\
-\xb6!,\xb7\x84\xadV\x10k\x81\x88\x01\xc8\xcbt\xf8\
-\xcb\xc3\x1e\x17\x08=\x09\xb43\x9d\x80\x0c\x9d\x03*\x19\
-\x02e~\x00,\xf3\x00\xf0\xad\x1a\x0c@\xfe6\x8a\x93\
-\xe4\x81l\xc4W\x00\xac&\x00*\xd1\x03\xb8\xfc*\x0b\
-X\x00\x8c\x99\xa5\xdf &*\x00\xdea\xd7\x07\xabS\
-B\xac>`\x0d&\x01\xd9\x0a\xa4\x01\xc0\x83\xedt\x13\
-\x906\x00)\xb6\x84\xbd\xc3\x9f\x0e+\x08\xd6\xe2=\x5c\
-+P\xbd\x80.\x03l\x07@\xe9GH\x16@\x7f\xf5\
-\xa1\x91\x0a\x80\xd1\xf9\x01\xe0\xceL\x01\xc0C\xf8T\x86\
-\x00\xa4]\x0a\x846\x1d\xc6\xc9\x90``\xed\xda\xb5\xe2\
-+,\x02.\xb6\xb2\x00\xc9\xff\x01s\x80-\x84\x80\x8e\
-\x02\x02`M~\x00\xc8\xdfF\xb1\xb6\x81\xb5k\xd7\xae\
-\x0d\xcb\x04\x0c\x00P\x0eZ\x00X\x0eP\x16;@\x01\
-l\x14k\x06\xc0\x04\xc2A \x81\x03\x0c\xa3Q\x90\x1d\
-\xb1\x03\x14@)\x80\x04\xac\x0d\xa7 \xf4w\x80=\x95\
-V\x12\x18\xc1\xf4\x0f\x00\xe0\x07\xb5\xca\x01\xa2-\x05\x92\
-N\x87\xf1q\xad.\x07#p\x80=j\x14\xe4Z@\
-!\x01\x90W\x07\xc8\xcbF\xb1'\x0f\x84\xd0\x0f$v\
-\x00\xd5\x06\xc6\x0e\xf0\x93\xc2\xda(f\x0dA\x96\x08$\
-t\x80a\x9e\x1a v\x800J\x81\x8c\xa7\xc3\xbc%\
-\xc4\x17\x90})\x90\xd0\x01\x86\x95\x95\xe5\x12\x00C\x80\
-\x02@\x120\xff\xde\xf9\xf3\x9fT\x9b\x01z;\xe0\xe6\
-\x9b5\x01\x08\xc1\xc5\x17\xaf]+^\x0c\xf4Hk\x03\
-_\xefZ\xf9\x17\xe4A\xcc\x16\x80(\xf3@\xf0eD\
-,\x0f<\xb5\xd6\x8evt\xa7\xd7\x9a\xe08X\x00\x5c\
-L\xe7\x98\xb4\x83Y\x10\x01\xa0\xfa\x80\xb2a\x1e\xfd\x09\
-\x00=\x09\xae\xed\x00\xe4h:\x9c\xa0\x14p\x11Xk\
-\x10H\x85\x00\xf0M\x05@;\x00\xe0\x03\x09\xc0\x07\x95\
-c+\x85\xdc\xfe\x06\xc0\x01\x18\x15\x0d\x00<\x07h\x00\
-\xdc$p\xcb\x9d\xb7\xdc\xc9\xe2\xe2\x8bg\xf3\xcd\xc1\x80\
-P\x87)$\x00\xf2r\xee\xf0?\x02\xd4\xbf8\xd3h\
-\xd0@<\xacF\x00d\x8c\xfd`,T\x01\x82\x80a\
-|\xfd\xd3VP\x0c@V'\x0c%}\xbf\xc94\xa6\
-\xc3O]\x17\x02\x02\xab=\x00\x08\x03\xf8\x00\xe4\x0f\x00\
-\x00K\x80\x18\x80B8w\x18L\xe0\xba\xec\x11\xf0q\
-\x00J\x011\x00\x05\xd5\x12^\xe1[\x0adm\x02~\
-\x0e\x00\x08(\x00\x86\xc5\x00\x14^)`\xe5\x81\xacK\
-\x01\x8f\x03Tr\x07\x88\x01\x88\xa4\x14\xc8\xa6%\xdc\xe0\
- \xb06+\x17P\x0e B\x03\x009`\x18V\x81\
-9\x07\xe0\x0dg\x12\xf4\x82\x03\x80 \xa0T\x02\x80\xa1\
-\x01X\xbbV\x00\x90\xf4\xf5\xd3\x11\xba\xee\xba\xd0\x01\xc8\
-o)p\x9d\x88`\x02\x02\x8f\xc8g\xeatJ\x09\x00\
-\xc9\xbfG4\x01\x95c\xc7\xa2\xe2e\xd4\x0c\x0eS\xfa\
-\xe7\x14\x80\x17}\x01X\xf4Hii\x86\x00\xac\x95\x00\
-\x5c\x17\x09\x00Y\x97\x02\xe9\x9e;\xfcW|\xbfI\x86\
-\x80\x80@ap\xb1z\x94\xd4'\xf6\x00\x0d\xc0\xea=\
-\xabu\x158\x96\x030,\x06 \xc2R \xa5\xe9\xb0\
-\xb8'i\x09%\x03V2HL\xc0g\x94\x02\x1c\x07\
- \x02b\x00\x0a\xad\x14p\xf3\xc0\x06{:\xfc\xa6C\
-\x80\xe3\x01\xe9:\x00\x16\x01\x12\x80a1\x00\xa1L\x87\
-\x7f\x1erK\xb8A\x15\x83\xaa\x14x3\x91\x07d\xe1\
-\x001\x00\xa1\x96\x02a\xb6\x84\xf0m\x03\x9f\x0e[\x95\
-\x00\xc8\x9e\x8a\x07\xf88\x00\xb6\x01\x95\xc3d!X\xa6\
-\xf5\x8f\x01\x88\xe2\x84\xa14\xa6\xc3\xf7\xb9y`\x03\x12\
-`J\x817=i\xe0\xe2`\x00\x02\x1d`\xact\x00\
-\xb5\xf4\xb9\x01\xb0\xdd`\x0d\xc0q\x11\x01 \xcf\x08\x98\
-\xff\xe4\x93\x1c\x00\xd5\x07\x22\x04l\x12 \x00\xe0\xa7\x08\
-x\xe3NI\x08\x00\xf0f\x84\x00D\xdb\x12\x9a]B\
-M\xc0\x06U\x0a\xbc\xf9\xa62\x01\x8a\xd9\xea\x12\xba\xd9\
-\xb3\xfd\x8e\x0bLOT\x1b\x08\x04\x88\xf5\xcf \x00\x0b\
-\xa8\xe4\x0cH\x030\xef\x0e\x10\x05\x00z?\xf8%\x0b\
-\x00@`\xd1L\x0f\x00k\x0a\x14\x80(7\x8aY\x1e\
-P&\x00~\xf0\xd7+\xa0\x14`\x04 \x04t<\x82\
-\x08\x10?b\x00\xc0\xa5\x82\xabM\x0a\xf8\x80FA\xe4\
-\x03ec\xf3\x08\xc0|\x11\xec\x0a\xd1E-[>r\
-\xcd5\xd7H\x00n\xbe\xf3\xe6\x9bQ\xf6\xeb\xae\xc3\x87\
-\xeb\xf0\xbb\x7f\x5c'\xff\xc2\x9b\x10\x11\x03\x10\xe5\xb9\xc3\
-,\x0f\xa8o\x88\x00\xbc\xdf\xe4\x9b2\xae\xb3C\x1d \
-7f_,L\xa0\xddZJ\x05\x08\x80A`\xac&\
-`\xd8X\xb8\x8fU\xa7\x03\xa9\xf7\x8a\xa7\xf3A\xa6\x84\
-\x08\x00{\x8b\x88w\xdey\x91.\x0f|\x01\x01\xb0\xca\
-\x80\x96\xa2\x0c\xb0\xc6\x81V1\x900\xe4\xf1\xc0c\x14\
-1\x00\xb9\xb8\x8c\x88L@\x13 J\x01W\xff\x14\x8e\
-\x89\x1e\x09\xaf^m\x00\xa0*\xa0\xb2\x0c\xa5/\x03\xf9\
-U\x09\x90\x17\x00\x9e,F\x00\x22+\x05\xfc*\x01\x0c\
-\xf1\xe4\x1f\x87]\x07HM\xff\xd5\x0e\x00\xda\x01*q\
-\xfd\x0f\xcb3\x00\xf3\x8b\x13\x80(7\x8a%\x02\xa4;\
-#@!\x90\x22\x01\x17s\x07h\xc0\x1d\x00\xaa\xc0\xb1\
-\x94\xfd\xe5\xfag\xe7\x03\xc5\x0e\x90\xe7\x13\x86<&\xb0\
-A\xc7\x15\x94\x07R\xb6\x00\xd9\x10\xae\xf6s\x00\xb9\xf6\
-\xd5\x10 \x7f\x00\x14\xad\x03D\x9d\x07\xb4\xffs\x02\xae\
-\xf8G\xea\x04\x5c\x1cP\x03P\x11 \x10(\x1bK\x15\
-\xc0\xb0\xd8\x01\x0a&\x0f\xb8\xed@2\x02Rr\x00\x9f\
-\x1a\xa0r\xecX\xac\x00\xc6\x96\x8d\x8d\x1d \x1f\xbb\x84\
-\x0b\x92\xe6\x01V\x08\xf0\xb8\xe2\xd1\x94\x09P\x0e\xb0\xda\
-m\x03\xa5\x03\xc8F0\xd75\xc0\xe3\x08\x80:%\x04\
-c&\x1b\x04,j\xa9\x01\xb8F\xdc\x0c\x02IQ\xc8\
-\x13\x00\xe1\x94\x02~&\xc0\xd3\x00\xb3\x00$ )\x00\
-t\xacp\x0a\xf0\xd9g\x9fi\x07X\xadj\x00\xb9'\
-(\xd5\xd7\x00L\x7f\x9f>2,\x97\x00<)\x01\x98\
-)\x01h)\x11\xb8F\x00pM\xaa\x00\xdc\xa2\x00x\
-3\xe7\x00\x84\xb9K\xc8L \x90\x80G\xaf8\xcc<\
-\x00\xce\x9e\xbb9\x18\x80\xb5k?\xfb\x8c\x01\xc0\xaa\xc0\
-J,\x03,\x00\xc6H\x00\x86:\x00|?7\x0eP\
-\xbc\x00\x84s\xc2\x90k\x02\xf7a%\xa0\x08\x90\x18\xc0\
-p\xc8N\x02\x01\x87\x85\x03p\xb1\x0f\x00\x95R\xfb\x02\
-\x00@:\xc0\xa2b\x06 \xd3]\xc2\x05\x01&\xc0j\
-A\xdd\x0e\x12\x00\x82\x80G\x1f\x05\x0b\xb8\xeeMc\x01\
-\xb7\xa4\xeb\x00H@eB\x07\x185j\xf4\x94\xd8\x01\
-r\xdc\x12\xfa\x99\xc0\xa3l\x1ep\x05\x01p\xdf?\x18\
-\x00\xa0\xff-\xe9;\xc0XQ\xff\x8f\x1d;\xac\x10\x00\
-\xa8\x11\x0e\x908\x0f$G \xc0\x04\x0c\x01t\x8a\x88\
-\x00\xe0Q\xd82t\x8a\x80\xd4\x1d`\xb5u\x81\x90_\
-\x0a\x98\x16;@dy`b\xe2\xb3E\xfc\x09\x90\x95\
-\xa0:WT\xac\x7f\x11\x87\x0d\x00w&\x07\xe0b\x0b\
-\x801\xa6\x08\xf4s\x80i\xb1\x03\xe4i\x97\x90\xa7\x01\
-\x8b\x00\xfd\x1esP\x00>\x0a\x00\xfc\xfe_lO \
-=\x07\x18c\xce\x0d\xaf4\xea\xeb\xb3\x01\xfc\x018\xe6\
-\x98o\x1c\x1b6\x00/r\x07\x98\xcfGA\x04@i\
-)\x07 \x85@B\xae\xbb\xee\xe6\xeb\xf2\x09\x80\x1f\x01\
-\xa9\x94\x02\x1e\x13\xd0\x04\xdc\xa7\x9a\x01\xa4\x80\xf4\xbf\xef\
-\xf7\xff\x14\xaf\xf1f\xea\x00\x82\x0f\x08\x04\xc9\xcf\x00\x90\
-\x04x\xfa@}:\xc84\xfd\xb9\xb1\xe1\x01\xe0\x9e\x13\
-f\x00 \x02\x96\x9a\x1c0\x1c\x00h\x09\xd3\xc0R@\
-\x00\x22U\x02n\xbe\xe5\xe6\x9b\xaf\xbb\xf9\xe6\xbc:@\
-\x90\x09$l\x09\xb9\x09x\x09Psa\xcc\xfdH\x83\
-\xf8\x19\x02\x00!^\xb3x\xe9\xd7\x042\x80\x00|\xb6\
-Z\xdcU\x0a\x00\x00\xfa\xcbY\x90e\x00\xfa|\xa0\xbc\
-\x010\x9c\x03P\xbah\x17$\x81[Jo\xd9U\x5c\
-\x00dz\x01Ab\x02\xe8\xfa\x11\xa9\xff\x1f\xff\x98&\
-\x00\xa0\xffg\xda\x01\xc6|\xd0\xbf\xff\xd8\xb1\x1f\xb8\xfa\
-\xe7\x1f\x00\xee\x00k\xc0\x02\xd6\xec\x82o\xb7\x14\x1b\x00\
-.\x01I\x11\xb0\x08\xd8\x14H\x80Z\xfe\x7f\xf4\x00\xe0\
-\x1f\x9f\x19\x00.\x06\xf9\xdf\x05\xf9W\x8f\x11\x16\x00\x00\
-p\xf9m\x00\x86\x16\x8a\x03\x94\x8a\xe5\x7f\xcb\xae5E\
-\xe7\x00\x19\x94\x02\x06\x01_\x02\x14\x04\xf8L\xfc\xf0w\
-\x12\x80[nN\xa0\xbf\xe5\x00\x9f\x19\x07p\x01\xe8\xaf\
-\x10\x985\x06/\x0a\xc8\x1f\x00\xfe\x0ep\xcd-E\x08\
-@\xf2R \x01\x01~CAA\xc0\xef\xb5\xfc\xbf\xfb\
-\xf3a\xe5\x00\x89\x00H\xec\x00\x1f(\xf1\xc7\x9ak\x02\
-|\x018.\x7f5\x80\xd0\xbfH\x1d \xe5R 1\
-\x01|s\xe8\x8fR~\xd0\xffwoJ\x00\x92X@\
-\x8a\x0e\xd0\xbf@\x00p\x1c`\x17\xe4\xff\xa2u\x00\xff\
-\xd1\xe09\xc1&\xe0\x12`\x7fF=R \xe5\xff\xf3\
-\xa6\xaf\x8d\x01\xa4\xe1\x00h\x01\x00\xc0\x98\xfe\x8a\x80\xfe\
-\xf6\x18\xa8\x90\x1c`\xd1\xaeE\xb0\xfa\xd7\x14\xaf\x03\xa4\
-k\x02H\x80\xaa\x047\xa9:@!@\x01\xf2\xffy\
-\xd3\xa6\xc3)\x01\x80\xa3\x00\x8f\x03\xacv\x01@\x07\x18\
-\xc3\x01X\x16:\x00w\xc9+C\xde\x90o\x12\xa3\x09\
-x\xcb\xb6\x00u\x89\x98J\x03X\x09\xc0<\x00\x07\x83\
-\x89C\x1d\x907\xdf\xbc\xbb`\x00H\x84@\x02\x026\
-m\xb26\x874\x05R\xfeM_\xbe\xc9\x00\xf0?\x1a\
-\xd4\x19\xc2\x88P8\x018\x80A@\x94\x01\xfd\xfb\xcb\
-\xb3\x82\x80\x00;\x05L\xcb\x0f\x00K\xbd\x00 \x01\x14\
-\xe9\x00pwa\x01\xe0\x7f\xb6H\x10\x01\xac\x15\xb0\xce\
-\x15\x13\xb7\xdf\xa1\xfa\x7fF6\x0e\xdfm\xf4\xbf9\xe8\
-x\x98\x01\xa9J\x02\x06\x801\x02\x00A@\x7f\xd2_\
-\xdc\xc7\xe8\xbd\xc0\xa2\x07\xe0\xe6B\x03\xc0)\x05\x92\x12\
-\xf0\xd0C6\x02\x7f\x165\x1f<h\xf9\x17\xa4`\x00\
-\x1e\x00.\xfe\xcc\x03\x00Jo;\x00\x02@%@\xec\
-\x00Q\x9a\x80K@\xef\x09~\x13\xa1M\x7fV\x0ch\
-\xf17mzh\xc1\x97w\xbf\x99\x82\x01\xf89\xc0g\
-\x1a\x801\xa9\x02\xf0\x83\xd8\x01\xa2&\xc0)\x03ng\
-\x00\x18\x17\xd8\xa4\xe5\x17\xfa\xdf\x9d\x8a\x01\xf89@\x00\
-\x00\xfdu\x11X\x13\x00(D\x07p\x088'\x98\x80\
-\xdb\x0d\x01\x0a\x01\x1d\x0fm\x02{@\xffO\xc1\x00\xd2\
-p\x80\x9a\x05@A:@ \x01\xfe\x16 \x08X\xe0\
-\x00@\xea/X\xf0\xcf\xbb\xdf\xbc;%\xfd\x938\xc0\
-\x18Y\x01\x92\xfb\xe7\x04\x00\xcf \xe0E3\x08p\xfb\
-\xc0\xe1B\xffE\xc3K\xe5\xae0]*\x22QH\x0e\
-AA\x02\xf0\x93$I\xc0T\x01\xb7\xb3\x93D6=\
-$\x03\x7fr\xfb\x82/\xd9\x00\x00_p)}\xf9\xac\
-\x0e\xb6\x87\xa6\xa7\x81\xefj\xf9\x1d\x00\x84\xfaxep\
-\xbe\x01\xa8\xbf\xc8\x01`\x11\xde\xcd@\xa0\xf4\x965\xbb\
-\xd6\xc0\x16\x91\xf7I\x11\x00\xf0\xa7D\x00\xf4v\x00x\
-H\xc7\x02Z\xfc\xb7\xdf\xfe\xe5\xe1\xbb\xef\xb6\xf5\x17\xeb\
-\xbc\xf4\x1a\xd83+\xf5\x1e\x14=?\xdb%\xd5\x07\x00\
-\x0c\x02\xfde\xed\xa7\x01\x18c\x030*4\x00\x16\xda\
-\x00\xfc\xe1\xf1\xb9\xefH\x02^`\xb3@\x99\x04\xea\xd7\
-\x9fy\xf9\xe5\x04\xc0\xf0\xe1r \xb8\xab\xd4\x1bk\xd8\
-\xa3|\x82\x08\xdc|\xcd\xdd\x18\xc5\x07\x00\xaf\x02\xa4\x07\
-\xe8\xe8\xbd\xa0\xf7\xed\xbd7\xfd\xf3n\x19\xc6\xf9\x13\x1d\
-\x14\x85\xc0.\x11\x92\x00\xc1\x80v\x801$\xbc\xeb\x00\
-\xd3r\x0d\xc0[\xca\x02\x08\x80E6\x00\x8bJ\xfd\xc4\
-\xdf\xb5\x06_\xde\x9aR\x81\xc6-\xa5\xf4\xe4\x1a\xca\x0e\
-\x05\x0d@\xc2>@\x03\x80\xcd\xe0\xed\x96\xfc\xe2g\x0b\
-\xbeV\xf2\xdf\xcdl\xde\x96\x1f\xf7\xcf\xe1\xd0\xc0\xf7E\
-\xb7\xc8$\xe0\x00\xf0\xae\x04\xe0\x83\xfe\x1f\x04\x01\xb0,\
-g\x00\xbc\xe6q\x80\x99\x1e\x07\xf0C\x00^&>\xae\
-)5O\x0a\x1b\x80dE\xa0}\x86\x906\x01\xe0\x01\
-\x02\xdc\x1f\x17\xbf\xb8\xfb\xeb\xaf\xd6\xfe\x9a]\xf4\xb8+\
-\xc0\x01V+\x07\xf8\x80;\x00e\x80\x9c\x03\xe0u\x00\
-\x0f\x00\x01\xf2\xaf!\xd1i\xb7\x88~V\xd0\x00$m\
-\x03\x85\xfev\x1d\xd0[j\xff\x95\xf8\xdat\xf8n\xaf\
-\xfd;\x00\xe0\xe2\xc7/86~\x0e\xf0\x99L\x01\x12\
-\x01\x09\x804\x80\x82u\x80\xd2`\x07\xd8\xc5\x0c`W\
-a;@\xd2A\x10+\x02L* \xf5\xbfZ\x80\xc9\
-\xffMm\xff7\x07\x18\x00\xad\x0ci\x00\xa5^\x07\x10\
-5 \xa5\x00?\x00\x8a\xcd\x01Jw\xa9\xbe@:@\
-A\xd7\x00IG\xc1\x12\x81\x09\x5c|!\xfd\xed_\x09\
-\xf9\xbf\xa4W\xf4\xa6\x9d\xfe=\xfa_C\xc6(\x0d\xc0\
-\xc7\x01\xde%\x07\x80F\xc0.\x03Y\x13\xa0\x00\x98Z\
-\xe8\x0e\x80\xa7\x8b\xc8\x02P\xc1P\xb8\x00$\xdf\x0c\xb2\
-\xe4\xc7\x95\xafn*\xf9C\xf6g\xab\xdfg\xfd_\x03\
-\x07\x04\x0b\xe25X\x11\x06\xd4\x00\xef\xea2p\xac\x95\
-\x02|\x00\x98R\xa8\x0e\x00/\xb4\xd4\xf8\xbf\xac\x7f\x0b\
-\x15\x80D\xdb\xc1?7\xeb_&\x01x\xfcJ\x13\xc0\
-\x92\x7f\x12\xfb\xbf\xa5\xd48\x80\x90>\xb8\x06X\xbd\xda\
-\xeb\x00c\xe8\x8c\xe0(\x01\x90\xb3\xe07\x04\x01s\xe7\
-\xaaI\xd0k\xaf\x09\x0bx\xeb\xad\xf9\xda\x03\xea\x13\x00\
-\x97_>\x9c\xa2\xa5\x0e\xf1\xc2\x9c\xf1\xb0w\x05\x88\xb8\
-[\xea\x7fwQ\x9c\x10\xf2s\xae\x7foe\x03\xa8<\
-\xdc',\xf8\xe7\xdd\x96\xfe\xf0\xd5R\xdc\xc4\xa38\x1c\
-\xa5t4\x82\x0e\xca\xae]tL\x10\x00\x9c\x06\x0a\x07\
-\x10\xa1\x0d@\x110\x06n\xe8\x00\xd3\xa7O\x9ff\x00\
-\x18]\x84\x00\x94\x16\x1a\x00\x09N\x09C\x04&X\xd1\
-[=\xf9\x0an\xbd\xbf|\xca\x88\x0f\xf2\x0b\xdd\x95\xfc\
-t<\x12\xe9_:\xbc\xd4\x05\xe03\x02@\x12\xf0\x01\
-\x000vL\xff1\x8a\x80\x9a\x00@\xa19@\x82\x8b\
-\x03~N\xcb\xdf\x83\x00.~\xd0\xffK\xdb\xfd\xc5+\
-k\xd9\x12\xdd\x9f\xe4\xa7\x87\xd2\x04\x87d\xd7\x1a_\x00\
-\xde5)\x00\x1d`l\xec\x00\xf9Y\xfe\xa0\xbfc\x01\
-\xbd'|\x85\xdaO\x9e\xf0\xd5&\xee\xfe-\x11\x00\xd0\
-\xbf%\xe9\xaf\xec\xbf4\xf1\x111\x00\xec\xd2\x00\xe8\x22\
-\x10\x1d\x00)\x88\x1d \xd7\x17\x86\x04,\x7f\xa1\xbd\xf8\
-\x9a8y\x82\x9b\xfc\xb1\xfcS\xf2\x97\x96\xa6\xae\xbf\x0f\
-\x00\x96\x03\xe0\x96\x90\xd6?v\x80\x1c]\x1a&\xb3\xbf\
-[\x01\x88\x9f\x88\xb5/n\x96\xfb\xc3K\x82\xe5\x7f\x8d\
-*\xfe\xd2\x90?\xa1\x030\x08\xec\x1404t\x00\x16\
-\x06\x01\xf0\x22\x00\xf0\x02\x07\x00\x18\xa8/b\xb8\x1d)\
-\x01\x80\xc7\xe4\x9a\x96\xc4@\xe1^\x1c\xea\xba\xffD\xb3\
-\xfe'\xc3\x17\x97\xbf\x14{\xbf\x96\xd4\xf4\xb54y?\
-\x15\xfd\x87\xefR\xdd\xc0.=\x0a\xc2\xb0\xc5\x97\x09`\
-\x96\xec\x02\xf5e!\x04\xc0\xa1\x18\x80\xa8\xe4\x9f\xe8\xc8\
-\x8f!\x96\xbfI\xfe\xa5\x22\xf7c\xd5\x0f/\xbbe)\
-=j\xf9\x93\xae\x7f_\x00\xe0\x8c\x801\xef\x9a\xa5\xcf\
-\x9a\x801\x11\x03\xb0\xea\xe1U\xab8\x00<\x07\xbc%\
-\x01XZ\x7fi}_\x00\x86\xd3`\xc8J\x0a>Q\
-\x0amR\xdeS@\xb2\xe4\xef\xbb\xfcI\xfd\xc9\xbd\xbf\
-\xe4\xc9\xdf\xff%R$9\x14-]\x00vi\x07\xb0\
-M\xc0\xe3\x00C\xf9\xe9\x00\x04\xc0\xf7\xc3\x00\xe0\xae\x87\
-W=L\x00\xfc\x81\x01\x80g\x84\x18\x00\x96*\x07\xa8\
-o\xea\x804\x00\xc0\x18\x9f_\x00\x92\xc8\xff\xf3\x00\xf9\
-'O\x9ep!s\xff\x96pk\xf9\x0b\xf9\x92\xe8\xfb\
-\xf0\x96\xe6\xd5\xa7p$\x86\x0f/mY\xca\x19\xf8l\
-\xd7\xbb\xef\xbe\xfb\x99;\x0a\x82m@\xb9\x15\x98C\x00\
-\x1e7\x008e \x00\x00\x03\xe1\xcb\x1d\x02\xd2\x00\xa0\
-e\x1e\x01HR\xfb\x05\xba?\xc8?\x99\xcf}[j\
-\xed\x95\xfa\x96\xb6)\x1c\x07\x1f\x00v\x11\x00\xefj\x00\
-\xc0\xfa\x85\xfe\xfdq\xfd\xcf\x9a\xf5>K\x019\x03\xe0\
-\x85\x9a\x04@\xb2\xe4\xcf\x96\xffDk\xf9\x8b0\xad\x9f\
-X\xfc\xe3[2\x04Z\xda\x08\xa4v\x18\x12\x00`9\
-\xc0,\xcc\xff\x1a\x80\xd7s\x0e@\x0dr\x80\x0c\x93\xbf\
-\x10\xffB\x96\xfc\xc5\x0b\xf0hi\xaf\xfeT\xe4O\xdd\
-\x01\xc6\xcc\x82\x1c\x90?\x00j\x8c\x03d\x9c\xfcE\xf0\
-\xd6o\xbcY\xf4-\x7f\xf1\x0b\xf3<\x0d\xf7O\xc3\x01\
-\xc6\xa0\x03\xcc\xea\x1f;@\x9eZ?\xd4\xdf$\xff\xf1\
--\xc7\x8f\xe7\xa9\xdf\xa9\xf6S\x97?\xb1\x03X\xb3\x00\
-\x81\xc0,\x1f\x07\x18\x1d;@\x88c\x7f\xff\xe4?\xd9\
-M\xfe<\xe7\xc3\xf2\xcf(\xf93\x00Z\xda\x9d\xa0\x02\
-`\xd6\xbb\x8e\xfc\xead\x80|\x00P\x13\x1c \xf3\xe4\
-o\xb9\xff\xf8\x96\xe3\xd5\xda\xffE\x96\xcb?1\x00\xee\
-4\x90\x0c \x97\x00\xa8s\x82^\xe3\x93 5\x098\
-[\xce\x01\x18\x02\xf8\xecr\x17\x0a'~A1~|\
-\x8e\x01\xc8\xac\xf5\xbb\xd0#\xff\xf8\xf1\xbf\xb0\xc3z\xb1\
-\x89_\xbbo\x10?\x1c\x80]\xca\x01\x14\x01\xb3\xe4\x8d\
-9\xc0P\xfd\xf6\x10\x02\x80\x97\x0b\x07\x80_\x14*\x00\
-\xa9l\xfaN\xf4_\xfd\x937\xfd\x8b\xc9\xef\xe8?\xfc\
-\xf2\xe1\x97s\xf9\xd3\xd6\x9f\x03Pj\x01\x00\x16\xa0M\
-`\x16b0\xbd\xe0\x01(P\x07H\xc3\xfd\x13$\x7f\
-_\xf9\x87g'\x7f\x02\x070\xf2\xcf\x92\xfa\xc7\x0e\x10\
-\xda)?\x09[\xbf\x89\xbe\xc9\xdf+\xbfg\xf9\x0f\x1f\
-\x9e\x1d\x00\xc9\x1c`z\xee\x00\xb0\xcf\x0b~\xd1\x0b\xc0\
-\xd2\xa5\xf5u\xa4\xfd\x9a5\x01\xf9\xfe\xe8\xd8d\xad\x9f\
-\x92\xdf\x12\x1f\xd5\x96_\xe1\x84\xa8\x05a_\x90U\x81\
-V\x0d\xa0J\x80Y\xac\x08\x04\xfd\xf3\x04\x00\x110\xb3\
-y\xfd\x99\x8a\x81\xe1\xe2V\xbfP\x01H\xde\xfaM\x0c\
-t\x7f\xb5\xe9\xeb'\x7f\x98\x01\x00\x88o\x06\x80]z\
-Cp\xd6,V\x02\xd0\xe9@\xf0\x0ea\xd6uA\x87\
-\x0c\x00\xc7\x86\x07\xc0\xdc\x84\x004_\xda|f\xf3\x99\
-\xda\x02\xea/*T\x00\xb2h\xfd\xd4\xdc\xd7\x95?\xfc\
-\xb0\x01x_\x010\x0bR\x80\xca\xfec\xa6\xe7\x18\x80\
-D\x0e0\x7ff\x13!\x7f\xf3\xfa\xea\xbc\x10\xd0\x1fn\
-\x05\x07@\x82\x8f\x08Ku\xee\x1b\xf5\xeaO\xe6\x00\xb8\
-\xfa\xc7\x8c1\x19 b\x00VI\x00\xe0MB\xe6\x22\
-\x01\xaa\x0c|\xeb-}N\xc8\xfc\xa5M\x84\x09\x18\x07\
-\x90\x85@J]\x00\x14N \xffx  Z\x00\xb2\
-H\xfer\xee;\x9e\xe2\x17\xc4\x00\xbc0\xef\xab\xbb<\
-{$`\x1c\x04\x00\x0c\xd7\x0e\x80\x04L\xc72`:\
-\x89o;\xc0P\x0e\xc0\xcb/\xffW\x98\x00\xac\x92\x00\
-\xbc\x11\x0c\xc0\xd2\xa5M\xa4\x07\xf0\x22\xa0~J\x00\xc0\
-?\xce\x09\x00Y\xb7~\xe3\x0d\x00R~\xfd\xda.\xcf\
-\xb2\xf5\xf3\x8f]\xbb>)\x95\x0e\xb0\xcb\xae\x01\xf4\x14\
-@\x0204\xdf\x00\xcco\x82e@}\xcb\x02\x0a\x0b\
-\x80T\x06\x7f\x81\xee\x7f7[\xfe\x8e\xfc\xd9\x0e\xfe\x12\
-\x01\xf0\x0b\xdb\x01\xd0\x00\xde\xa5\x02@:\xc0\xf4\x82\x00\
-`>:\xc0\xd2\xfa3\x99\xf8\xc3\x0b\x0b\x80\x8c\xdc\x9f\
-\xcf}\xe9\x17t\xe5\xbf|xt\xf2\xfb9\xc0\x98w\
-\x85\x03\xbc\x8bs\xa0\xe9\xe0\x00\xd39\x00\xf3\xf2\x06@\
-s\xa8\x01D\x02XZ\xa8\x0e\x90m\xf2\x1fo\xc2\xd6\
-?\x84\xc1_\x0a\x0e\xf0\x89\x02`\xba0\x01\xa8\x01\xa6\
-\x83\x03\xcc\xa2K\x02\x0a\x01\x00\xa8\x01 \x05\xcc,P\
-\x00\xb2N\xfe\xe3s\x9c\xfc\x83\x1c`\xfa\xf4w\xa7\xcf\
-\x22\xf1\x11\x82\xe9\x05\x03\xc0|\xd0\xbf~a\xd6\x00i\
-\xb6~\x9e\xb9o\xc0\xea\x1f\xee.\xff\xf0\xbbA\xaf\x03\
- \x00\xa0=d\x80\xc2q\x00\x91\x01\xa0\x06(H\x07\
-\xc8b\xd7O&\xff\xbb\x93\x9a\x7f4\xf2\x07:\x00\x9b\
-\x03\x15T\x0d\x80\xd7\x87\x14\x1a\x00I\xdd?\xc1\xdc\xf7\
-_\xdc\xfc=\xb5\xff\xe5\xc3\xa3t\x7f\x7f\x07\x00\x06p\
-\xe1\xe36P\xe4E\xe0B\x09\xc0*\x04\xe0\x8d7\xe6\
-\xce\x9d;\xd7\x05\x00\x18\xa8K5\x00\x0c\x84\xcf\xc70\
-\x10\x88CS\xdf\xec\x12\x06GD\x00$v\xff\xc4s\
-\xdf\x7f\xde\xcd\xdd\xdf\xfeu\xf9\xebI\xe5\xe5\xa5\x11\xf5\
-\x87_\xbe}\xbb\x04\xe0\x93O>\xd9\xf5\x09\xc44\x0d\
-\x80\xd0\x9b\xc4W\xcb\x1f\xaf\x0c\x1d\x9a\x0b\x00\xe6f\x05\
-\xc0\xf6\xc0[t\x00\xa4q\xa1\xbf\xaf\xfb\x07\xc9/\xf4\
-\xaf\xcf\xf5\x17\x8f\xdbC\xbb\x01\x00\x97;\x00\xd0\x86\xe0\
-4\x09\x80 `:+\x01\xe1\xfd\x81\x22\x06\xe0a\x7f\
-\x07P\x08\x98\x0d\xe1\xa5K\xcf>\xfb\xecBq\x80\xf0\
-Z\xbf\xe0\xd5\x7fy\xb8\xab_:\x00\x9f.\xed\x92\xfa\
-3\x0b\x00\x08\xd4\x100b\x00\x16\xaa\xcd\x00\x8f\x03\xbc\
-h\x010\x7f\xbet\x00i\x03\xf5\xd3\x08\xfd\xca\x91\x80\
-\xf0\x00\xc8\x22\xf9\x8b\xd6/h\xedK\x9e\xa3\x0cQ:\
-\xb1]4e\x00\x9f\xec\x22\x07\x00\x00fY)\xe0\xfd\
-\xf7_\xa77\x8a\x16\x00\x8c\x8a\x12\x807\xd2\x01\xc0l\
-\x0b\xe4\x05\x80?e\xb7\xe9k\xfa\xbe\x9c\xcb\x8f\x87\x84\
-\x00\x10\x95\xc0'\x1a\x80].\x00\xd3\xa7\xe7\x1a\x80t\
-\x1c`i^\x1d \xcb\x8b}\x12d\xfe\x1c,\x7f\x1f\
-\x07\xf8\xc4\x0f\x80Y\xd3\x0b\xda\x01f\xa6l\x01\xa1\x03\
-\x90\xf1\x95\xbe2\xf9\x07\xba\x7f\xfd\xdc\xc4p\x8f\x03\xb8\
-\x00@\x0d\xa0[\x00h\x02\x0b\xcf\x01\xea7\xcf\x9b\x03\
-dv\xa5o\xb2\xe4_?7\xfa\xe36zR\x07H\
-\x04\xc0\xe8H\x00x8\xa1\x03\x00\x02u\x9b4Y\xaa\
-\x9a\xc1\xe6\xe77\x87\x10\xaf\x04\xfb\x01\xa71\xf4\xc9x\
-!\x02\x90\xdd\xc5>oz\xe5\xc7\xdf\xcf\xfd\x95\xcf?\
-?\xe24 \x10\xd8>|\xbb\x06\x00\x11\x98\xa6\x00\xb0\
-c\x9a>\x1fH\xee\x06G\x06\x80\x8f\x03\xbcf\x00\xa8\
-k\x01 \x1c@\x10p~J\x00(\x17\x08\x01\x80?\
-e\xb4\xe7\x7fap\xf2\xf7\xfdm\xcf\x8fV\xff\xed\x84\
-\xdcv\x1c\x07m\xd7\x00|\x12\x08\xc0\xeb6\x00Sr\
-\xe0\x00+\x92\x01\x00\x06\x90s\x00\xb2\xbb\xd2\xf7_\xde\
-\xbe?\x1f\xf2+Wt\x00\xf8D\x020]\xa6\x80|\
-\x00P\xe8\x0e\x90\xe5\x95\xbe\x09\x97\xff\xf9L\xfe\xf3s\
- \x7fB\x00\xbc\x0e04v\x80l\xaf\xf4\x0d\x90\xff\
-|[\xfe\x9c,\xff\xed\xd8\x07\x00\x00\x10\xc9\x1d\x00*\
-\xc0\x82s\x00\xaa\x02s\x07@\x86\xad_a%\x7f\x8f\
-\x03 \x00\xc3\x939@\xce\x00H\xd3\x01r\x09@:\
-c\x7f\xef\xc5>\x01\xc9\xdfg\xf5\xe7F\x7f,\x03\x03\
-\x01p\xcb@\x04@v\x81\xb5\xd4\x01\xb2\x9a\xfb~=\
->\xb5\xe5\x9f[\xf9\x0b\x12\x80\x02u\x80?eu\xba\
-\xf7\xe1\xd4j\xbf\x9c\xb9\xbf\x9e\x05\xfa\x030\xcd\x03\xc0\
-\xb4\x5c\x00\xb0\x8a\x01\x00\x04\xac\xd0\x00H\x02\xee\xb8\xa3\
-.\x86\x04\xe0l\x02\xe0\xfc\xe6\xb87|\xf6\xd9\xb4G\
-\x1c\x14\xe2\xe0N\x9a\x941\x00\xd9m\xfar\xf9\xc5/\
-1i\xd2$\xdf_1\xf1\x0b\x085\xea7\x11\xd8\x01\
-l\x12\x80\xedj\x14$\x00\x80\x98n\x030\xcd\x0f\x80\
-CQ\x01\xf0F\x10\x00@@\x89\x00\xa0\x09\x86\xd0^\
-}\xd7\x91\x18\x80\xf3\xcfW\x16\x90&\x00\xd9\xb5~\x5c\
-}q\x97f\xe5\x89$\xbf\x7f\xb8\xd1\xbc\xfev\x1b\x80\
-O4\x00\x9fL\xdb\x85\x04L\x7f\xdf\xe8o;\xc0\xa8\
-h\x01\x98\x1b\x0c\xc0|\x0e@\x13\x05@\x93\xd4\x01\xa8\
-\x9f\x11\x00Y\xb5~\x8e\xf7\x07K\x02\xbf=\xce5r\
-q\xf78\x80@`;s\x80i0\xfd\xa7=\x00\xfc\
-\x92\x00,\xb3\xf7\x82r\xee\x00o\xe5\x03\x80\x8c\x06\x7f\
-\xee\xdc\x17\xc5\x17\xce\x9f`\xf9\xd3\xc2l\xbe\xbd\x89\x90\
-g\x9d\x10\x08\x9fmo\x1e\xcd\xbdI\xfde\x16\x00\x9f\
-lw\x1d`\x9aq\x80ih\x019\x03 \xd8\x01J\
-\xf2\x00@(\xc9\x9f\x16\xff\xa4\xfa\xec7\xf1\x91\xbf\xb9\
-\x94\x1f\x110\xcf\x9a\xd4\x8f\xe2\xee\xa9\x01\x1c\x07\x98\x86\
-k\xff\xfd\xda\xee\x00\xd9]\xe9k\xcb\x0f\x07\xdcR\xdd\
-M\xfe\xcdQ\x17|\x94\xca7\xc7gDB\xb8\x8f\xe2\
-?\xec\xd4\x00\xdb}\x1d@H/K\x80Z\xe9\x00\xa1\
-\xb4~$\xff\xe5\xf5\x13&\x7fL\xcc\xdb\x9b\xd7G\xc5\
-\xe5\x22%\xa1\x84F\xe13\x90\xaa\x03\x80\xfc\xf8P+\
-\x1d \xbb+}m\xf9\xfd\x8c\xdf\x9b\xfc\x9b\xd0\xda\xc4\
-\x87\xe6\xcc\xad\xed\x9fe\xff\x1c\xbe\xa7V\x03\xbc\xaf\xe4\
-\xb7\x01\x90c\x80P\x01\xc0+\x03\x8c\x03\x08\x04V\x88\
-x\x8d\x13p\x87\xe8\x03q\x16P\xd2\xa4\xae\x01\xc0n\
-\x04\x83Bt\xd9p\xa0E\x17\x9e\x22\x00Y\xbd\xc9\x93\
-\xdc\xf4\x85\xaeo\x12v\xfdg\xe3\x0d;\xfd\xb3}\x7f\
-\xbfuM\x84\xd2\xcd\xc5\x0a\x15\x0f\xdb\x9b\xc0\x1f\x90\x07\
-y\x97\x8b6\x94\xe7x\x17\xff'Z\x16\xdbY|b\
-\xb5\x01\xd3\x94\xf8\x94\x03\x86\xcas\xc2\xe7E\x0e\x80N\
-\x02+\x18\x01o\xb5\x90\x83\x00D@\x00 | -\
-\x00\xc4\x81\x07\x09\x84\x1a\xa9\x01\x10F\xf2\x1f?\x89\xe4\
-?[\x8e\xa90\xfc\xe5o~\xbe\xf8\x12\xb5\xff:J\
-\xfa\xeb@\xfcu\x12\x03\xf5s\xf9\x8f\x9a\xa8\xbf%<\
-c]\xf3\x0c~\xbe\x9d\xfe\xb3gc\x15\xb2}\xfb:\
-\xe5\x01\x9a\x80]\x84\x80\xed\x00C\xa7\xe5\x0a\x80\xad\xcc\
-\x01^\xcc\x13\x00\xd9]\xe9\xdf\x0f\x86]\x00\x00\x1f.\
-IDAT\xcb\xd5G\xfd\x93\xc8\x0fCml\xfcH\
-\xb2&\xa4\x19\xe6\xebuB\xc0\xed\xcd\xe9\xa7\xcd\xe9\x1f\
-5\x87\xaf\xe6 o\xba?G\x1e\xc4\xd3\xe6\x00\xc4\xba\
-\xb3e\x19\xba\xce\xad\x03U\x15\x00-\x00\xac}\xca\x00\
-\xb5\xc9\x01\xb2i\xfd\xb4\xfc\x97+\xf9\x99\xfe\x9eu\xcf\
-\x9e\xad\x83\x07\xd4\xad9<\x80\xfa8\xec\xac\x8f9\x01\
-\x7f*\xa4Ut\x00)d\x13)\xfd\x1c\xf8B#\x11\
-\xff\x99u\xd8g\xf8\x00\xa0\x1d\xe0\x13\x0d\xc0\xb4\xf7-\
-\x00\x86\xe4\x08\x00\xb3\x1b\xf0\xe2\x8a\x17\x9d*\xf0-\xac\
-\x02\x96\xd6\xc5m!\x0d\x00l\x0d$\x07\xe0\xec\xd4\x00\
-\xc8\xeaJ_\xcb\xfc'q\xef\x0fZ\xfe\xde@\xe1y\
-m\xdb\xa4\xb9\xfa\x09=\xab\xaf\xfea\x13v\x0f\xfe\xb9\
-\xf3\x9fi\x8e\x16\xd1D\x03\x00y\xc0\xee\x04\x19\x00\xd3\
-<\x00L\x8d\x14\x80UZ\x7f\x17\x80\xd7r\x04@\x16\
-o\xf1\xd7\xfb\x1fR}\xa5?7\xff\x94\xe5O\x1c\xf5\
-\x9b\x84\xf3s\x01\x8b\x0b\x80\x99\x06\xcb2@(\x9fs\
-\x00\xf2\xed\x00I\xdd\x7fb\x0a\xad\x9f\xdf\xf2o^`\
-\xe1\xe3\x00\xdb\x1d\x07\xb0\xa3v8@\xf6s\xdfI*\
-\xfbgd\xfe9\x04\xa0\xf9\xf9\x89\x1c@u\x02\xd3j\
-\x95\x03\x84\xd1\xfa\xe9\xd5\x7f~A\xeb/\x08H\xe0\x00\
-\x9f\xb8\xeaG\x0d\x80&\x80;\xc0\xdcw\xa8\x0f\xa0F\
-\xe0-\x8b\x81\xbar \x04\xd1$\x95 \x08DLB\
-\x04|\x01\xc8\xe6\xfd}I{Z\xfb$\xfa{\xef1\
-\xbb-\xc4\x90\xed\xc7\xbau\xe7\xafc\x8d\xc0\xa7\x9fz\
-\xd2\xc0t\xdd\x05\x12\x00\xf2\xba\xa0Ca\x02\xa0\x86\xc1\
-\xd2\x01\xb6*\x00\x04\x02\xaf)\x00t\x0e\x90\x00\x94(\
-\x00JR}\xb9\x89\x01\xc82\xf9\xab\xb6\xdf]\xf5M\
-\x0a5\xb0\x1bX\xd7d\x1d\x06\x89\xef\x03\x00\xb4\x81C\
-m\x07\x88\x14\x80U6\x000\x0a\xb2\x01x+\x0a\x00\
-@\xff,\xae\xf4e\xd6/\x17\x7f\xa1\xaf~\xb5\x89b\
-\x03@\x0e\xf0\xa9o!\x98'\x07X\x91\x13\x07\xb0\xe5\
-Oo\xec\x8f\xc9\xdf]\xfd\xef\x15\x81\xfc%A\x0e\xf0\
-\xa9\xeb\x00j\x10<$J\x00\x16\x069\xc0\x8a\x1c8\
-\x80g\xf9\xa7w\xb1\xcf$\xae\xff{,\xf97)\xec\
-H\xd5\x010\x05D\xed\x00\x0b\xad6 \xb75\x007\
-\x80\x0c\xae\xf4-\xba\xe4O\x06\xd0$[\x07x9\x1a\
-\x00V\xe5\xba\x06\xe0\x05\xc09\xe9_\xe9;\xc9N\xfe\
-g7/\x92\xe5\x9f\x9e\x03\x0c\xa5\x1ap\x88\xde\x0a\xc8\
-\x95\x03xk\x80\x90\x01x\xf6Y\x06@\xfa\xc9_M\
-}\x8b)\xf9\x07\xd7\x00\x1a\x80\xa1\x81E`\xe4\x00\xac\
-\xda\x8d\x00\x10\x01sW\x98\x22\xa0-\xec\x08\xb6\x10\xf7\
-\x16\x8d[\xd0\x9e\xa0\x02\xa0\xa4\xa4\xae\x8e\xe0\xd7\xfb^\
-sq{\xef\xec\x8f\x0c\x00\x0f<`\x03\x90\xee\xc7\xfa\
-\x99\xd5\xff\x91\x88\xf7x4ib~\x93\x84\xbfU\x1e\
-\xf5/y\xaf\x09\x03`\x1d\x03\xe0S\x17\x00Z\xffF\
-\x7f=\x07\xda\x16b\x17\xb0\x10\x01\xd8\xed\x00\xf0\x8e\xb6\
-\x80\x90\x00\xe0\x0e`\x01pN\x9a\x1f\xeb\xa7\xdd\xff\xa3\
-\x8f\x5c\xfd\xf9\xff\xb6@\xe5O\x11\x80\xa1|\x08\x10-\
-\x00\x0b\xef\xaa\xce\x85\x03\x08\xa9|\x01\xf8\x89\xa7\xf6\x9f\
-\x90l\xd3\x97\xad~g\xf9[\xab\xbfn\x93\xe2\x01`\
-\x88\x04\xe0S\x01\xc0P\xee\xfe2\x01D\x0b\x80\x9f\x03\
-\xcc]\x11\xa2\x034'\x00>\xb2\x00\xf8\xad\xb2\x00\x90\
-\x1f#\xc1\xd8\x9fm\xfa&p\xffb\x90?\xb1\x03h\
-\x00\x86\xca\xaf\xdc\x01\xe0\xef\x00+B\x00\x00\xf57\x00\
-\xfc\xaf\x01\xe0'\x16\x00\xba\xf8K\xa5\xf37\xf27/\
-\x22\xf7/@\x07\x90\x15\x80\xbf\x03\x84\x04\x00\x0at\xf6\
-GT\x05:\x00\xfc\xec\x1c\x09\x00\xc9?1\xc9\xdc\xd7\
-M\xfe\xcd\xdf+6\xf9\x938\x80\xa8\x02h\xf1\x0f\xcd\
-\x99\x03\xac\x22\x00\xa2s\x00\xa9\x93\x0f\x00\xcf>\xcb\x1b\
-@K~O\xeb\xf7/?\xf7o\xee\xad\xfd\xeb\x16\xba\
-\xfe^\x00\xd6y\x01\xc8\x99\x03\xdc\xb5P9\x80\x1a\x05\
-\x87\xef\x00\x1a\x80\x8f,\x00\x1e`\xfa#\x01\xbe\xf2\xb3\
-M\xdf\xe0\xda\xaf\x88\x96\x7f\x8a\x00h\x07\xc0\x13\x82#\
-u\x80jU\x02\xaczc7\x02\xb0u\xeeVn\x01\
-\xd7\x8bx\xed\xb5\x16:\xeeh|\x87\x0a\x01\x80|\xa0\
-?\x04D]\x84\xa0\xb9\xb4\x80\xff\xfb_\x22\xe0Ye\
-\x00\xb2\x000\xf2\xfb\xce}I\xfbI<\xf37\x01\xad\
-5\x8a\x14\x09~\x8d\x02\x8a&4C[gb\x99\x06\
-\x00\x14\x97\xea\x0f\xd5S\x00\x04`*\x9f\x03\x85\x03\xc0\
-NY\x05Z\x0e\x80\x00\xf459\x00\x09h\xeb\x07\xc0\
-\x1d%w\xa4\x00\xc0\x1d \x13\x8a\x86\x04(\x00\x14\x01\
-\xa4\x7f\xc2\xe4\xff\xaf\xf1\xde\xa5/\xc4'\xe7\xe1\xff\xa7\
-\x84\x1c\x16P\xd4E\x06JJ\xd6\x95(\xfd\xd7\x0d\xd1\
-\x00\x10\x02$\xbd\x04`\x19\x010*t\x00\x16\x22\x02\
-\xd5\x0b\xef\xf2s\x80\xb9\xc6\x01\xb2\x03\x00\xf3\x04\x11\xe0\
-\x05\x00\x1d@\x88\x7fa\xa2\xb9\xaf\xa7\xed\xd3\x89\x87\xad\
-\xf9\xa2\x91\x9f\x01`b\xbb\x17\x00S\x01\x0ce\x00L\
-\x09\x17\x00\x99\x05\xb0\x0b\xd05@\xc8\x0eP\x02\xab\xf5\
-=U\x05|\x85\x00(\x02~\xa6\x09 \x0b\xf0\x9b\xfb\
-N\xf2\xd3\xbf\x89\xb3\xfaK\x8aG~_\x07X\xe6\xe7\
-\x00\xd2\x00,\x07\x08\x1f\x00a\x00\x0be\x11`\x15\x81\
-\xb6\x03\xb4\xcd\x18\x80\x12\xbc\x98H\x03 \x1c\x80\x15\x01\
-\xcf\xca\x14p\xa1#\xff\x85^\xf9\xdfs\x97\x7f\xb1\xca\
-\x9f\x92\x03\x0c\xa5}\xc0i\xc6\x00\xa2\x00`\xe7B{\
-\x14`\xb6\x03\xfb\xf2>\xf0\xb5\xeb\xa1\x17P\x00\xb4x\
-\xcb\x02\x80U\x84\x81\xafW\xa7\x00\x01\xc0\xd7\x0e\x00\x93\
-'\x13\x018\x00\x9e\xc8\xe5\xb7\x93\xffG\x1e\xf7\xbf\xa3\
-\xa4\x08\xdd\xdf\x02@\xd7\x81\xcbx# \x97\xbd^\xff\
-C\xc0\x01\x1c\x00\xb6\x85\x9a\x02`3\xa0Z\xea\xafO\
-\x0cV\x0e\x00\xe3\xe0\xac\x00\xa0\x1a\xa0\xaer\x80\xaf\xff\
-\xf7\x7fd\x0ep\x08\x00\xf9/\x04\x03\x90\xf2\xf7\x96\xc9\
-\xff\xa3\x80\xe4_\xb4\xf2s\x00\x9a\xac\xe3\xd3\xa0!\x12\
-\x80OT\x01\xa0\x0c\xc0\xe3\x00\xdb\xa2s\x807,\xf9\
-\x99\x03\xb4\xcd\xca\x01t\x0e8,\xc47\x160\xf9Y\
-\xd0\xfa\xc2\xc9\x17\x9a\x98\xac\xdc\x7f\xd2\xa4@\xfdK\xec\
-\xe5_RR3\x00\xe0\x0e\xa0\xd6\xbf\xac\x01\xa8\x0b\x8c\
-\xc8\x01\x16\x9aS\x82vk\x0bX\x81g\x851\x07\xc8\
-\x1c\x80\x12\x0e\xc0\xa4\xc9\x8e\x05<;Y\x87\x00A>\
-\xdbt\x98\xad\xfe\x8f\x82W\x7f1\xca\x9f\x92\x03\x0c\x1d\
-\xaaO\x06\x02\x07p\x01\x08\xad\x06\xd8\x89E \x01@\
-\xbb\x01[\xb7\xca:p\x05\x1b\x05\xbd\x06e \x04L\
-\x03[4n\x5c\xaf^c\x88;\xc4\x13\xa1@=\x88\
-;\x12D]\xe6\x01\x90\x03\x18\x01\x93\xa5\x09X\xb1\xe0\
-_N\xe9W\x97\xc7\x1d\xe6\xff\x95\xec\x7f\x5c\xa0Q\xf7\
-\x8e\x12I1\x1f\x06\x09\x99\xf9,H\x07\x12\x10\x0d\x00\
-f\xfdW\x13\x01\xc2\x01\xb6*\x02t\x16\x08\x0b\x00E\
-\xc0\xb3\x9a\x00\x8f\x05\xc8\x8f\xf5s+\x7fK~\x16\xc5\
-)\x7f\x00\x00C\xb6s\x00\x86~:\x8d\xc9o\x9f\x10\
-\x16j\x17\x80\x16P\x8d\xea\xd3(\xc0\x00\xc0&\x01\xa1\
-\x02\xf05\xc9o\xca\x00\x0b\x01\x96\xfc\xdf\xf3\xea_\x13\
-\xe4\xe7\x00\x94\xf8:\x00 @>0\x84\xce\x08\x86&\
-@\x03\x10^\x0d@\xfa\xe3\x8e \xe8\xbfj\xf7n\x0b\
-\x80\xf0\x1c\xc0\x22`\xd2\xa4/%\x00z\x1e8\xd9\xa4\
-\x81M\x87\x9d\xb1O\xdd\x1a'\x7f\x00\x00\xcc\x01>\x1d\
-:\x8d(\x182\x8d\x0c\xc0\x06\xe0\xe5\x90\x01\xa8\xd6]\
-\x80\x01`\xab[\x03\x5c\x9f1\x00\xf5<\x160i\x93\
-K\xc0\x03\x92\x80\xff\xfbg\xc2\xe4o\xb2\x7f\xbdb\xd6\
-?\x05\x07\xf8t\x1ah\x0f\xcb_\x95\x00\xf3\xe6Y[\
-\x01!\xd5\x00;\xc9\x02\xaa\xef\xaa^\xe5q\x00k?\
-0\x0b\x00|\x92\xc0\xe1\xc9\x8a\x00uv \xc6W_\
-Ns\xdc\xbf&.\xff\x94\x1c\x80\xca\x00=\x05\x88\x08\
-\x80\x9d;\x15\x01\xb2\x0d\xe0\x0e\xd0W\x13p\xfd\x0a9\
-\x0dn\xabZA\x10_=\x11\xaf\x87`H\x10\x8d\x0d\
-\x04\xb2\x19\xfc\x12\xa6\x01zW\xe0\x01\xe1\x00\xcfN\xa6\
-\xe4\xcf\x16\xff{4\xf0\xf3\xfe\xe7\x12\xff\xdf\x8a!X\
-O\xa8f\x81\xda\x01\x94\xfa\x9f\xca\x22p(\x19@$\
-\x0e\xa0v\x03\xaa=\x0e\x00\x04\xac\x90g\x86^\xef\x02\
-\xd0B\x01\xd0\x225\x00|\x08\xf8\xfa\x01\x1c\x08!\x02\
-\xff\xfb\xac\xc0\x80\xdc_\x8f}H\xfd\xbaw\x94\xf8\xc9\
-_\xdc\xfa\xb7\xb0\x01\x80F`*\xed\x08\x13\x01Ce\
-\x16\xc0\xe5Og\x03\xcc\xf3l\x05\x84T\x03\xec\xdc\xa9\
-\x92\x00\x01\xb0[\xb6\x81\xb4%\xdc\xd7\xca\x01\x94\x05Z\
-\xb4hk\x03\x90J\x08\xd1\xeaq\x02\x00\x81\xe9_?\
-\xfb?:\x9e\xd5\xf2[\xd6\xaf\x0d\xff\x8e\xc6w4\xae\
-)!\x00\xa8\xc7l`]\xc9T\xb9)8d\x88\x02\
-\x00\x95\x1f\xf2)\xad~]\x03N\x0d\x1f\x00]\x05V\
-Wk\x028\x00}\xfbZ\x00\x5c\x7f}\x0f\xe9\x02i\
-\x02\xd0\x18\xaa\x06\xc8\xdbu\xd9\xbe\x90p\x81\xaf\xa9\x05\
-\xfc\xf3\xd7\x87}\xdb~U^4\xaeY\xd1\xa2q=\
-\xb2\xb0z:\x07L\x85\xfb\x10\xb8\x09\x06\xd0\x01\xa8\xfc\
-cS\x00\xeb\x84\xb00\xbb\x80\x9dB\x7f\xd8\x0f\xaa\xc6\
-\x14@\x04\xcc\xa5:0\x00\x80\xb6\x99\x00\xd0\x18\xeb6\
-S\x0a\xd2y\xe2\x1f\xf9\x9c\xe7'\xd5\xafG\xe2\xd78\
-\xf9\x1b\x97\xb8\x00p\x07 \x13P\x1e \xf5\xa71\x10\
-\x1f\x03\x84\xe6\x00\x94\x02\xd0\x01\x10\x00 @\xb5\x01\xdd\
-\x0d\x00xRH[\x09@\x8b\xcc\x00@\x0f\xb8\xa3\x1e\
-G\x80\x18\xf8\xc8g\xbb\xa7\x9e\xd0\xff\x8e\x9a\xa9\xbf\x8f\
-\x03\x94\x88\xe5?o\xdd2t\x80\xedCT\x1b0\xc4\
-3\x07\xe4\x83\xc0\xb0j\x009\x0c\x14m \x01\xa0\x8b\
-\x80`\x07\x90E@F\x00\xd4\xe3\xfd\xa0O\x98q\x7f\
-\xbd\x9a*\xbf\x9f\x03\xac3\x0e\xf0\xa9\xe3\x00\x9f\x0e\xb1\
-j@=\x08\x0c\xcb\x01\xb0\x0c\x5c\xb8S9\xc0\xaa\x14\
-\x1d \x13\x00$\x01\x0a\x81\xba\x81\xea\xd7\xd5\xcb\xbfq\
-\x8d\x0c\x04\x00\xe7'%\xf5\xa8\x06(\x01\x07\x98'\x08\
-X\x07\x00P\x1d@5\xc0P\xa5\xbf\xed\x00a\x02 \
-\xbb\x80j\xe5\x00\xd2\x02\xfa2\x07Xq=!`\x01\
-\xd08m\x00\x88\x00m\x02\x16\x03|\xe2S\x83W\xbf\
-q\x00\x0e\x80,\x02\xa4\x03\x0cQ\x00X%\x80sN\
-p\xb85\x80j\x03\x84\x03@\x11\xb8[N\x02\xfa\x1a\
-\x00^\x93\x08d\x07\x80\xf4\x80zu\xfd\xe2\xbdz\x94\
-\xfb\xeb\xd5p\xfd\xfd\x1c`\xaa\xb0\x00\xd9\x050\x00\xac\
-1\xa0\x0d\xc0\xcba\xa6\x002\x00h\x03p\xfd\xcb>\
-\xb0;\x9e\x19\xc8'\x01\xafi\x00\xdaf\x0a@c%\
-\xae/\x02B~\xd5\xf8\xd5`\xf9\xc1\x01\x1a[\x00L\
--\xf1q\x80\xa1\x12\x80\xa1\xac\x09\x88\xc6\x01\xb0\x08\xc0\
-6\xa0z\xf7*f\x01\xb2\x0a\xeck\x08h{\xfdy\
-=\xae\xefq\x9e\xea\x03\xb3\x22\xc0D\xdd\xba\xde\x9f\xd5\
-`\xf9\xd1\x01\xe0@\x88\xaf\x83\xe2\x95\x1e<([\x81\
-y\xaa\x0d\xc4\x10\xba\xcb\x02@\xed\x05G\x08\x00\xb8\x00\
-\xa4\x80ji\x02T\x03l\xc5\x14\xe0\x00 <\x80f\
-A\x99\x02\xe0\x87@\xed\x92?\x10\x80yC\x86\xd8\x0c\
-\xd0\xc9\x80\xac\x09\xe0\x83\xc0\x10\x01X\x88\xf2/T\xf2\
-\x8b\x22P:\x80(\x04%\x00\x17 \x01m\xa9\x11\x00\
-\x0bh\xdb8\x93I@j\x044n\x5c\xab\x00\x80\x14\
-0\xcf\x03\xc0\xa7Cd\x01\xa8\xce\x06\x99\x17\x1d\x00\x18\
-D@\xf5n3\x0c\x16\x1e \x1d\xa0\xaf\x9e\x05\x00\x00\
-m\x11\x80\xb6\x99\x03\x90\x18\x81\xc6\x8dk\x11\x00\x07\x11\
-\x00\x95\x02\xcc0P\xa5\x01H\x04\xf3\xc8\x00\xe6\x8d\xb2\
-\x07\x81!\x01\xf0\x85\xee\x04\xab\xa1\x0e\x94\x8d\xe0V\x85\
-\x80t\x80\xbe|\x18$\x01\x10\x08d\x0c@ \x03\x8d\
-kEX\x00\x94\xc8\x1c\x00\x00\x80\x09\xd8\x819`\xde\
-2\xd2\xdf\x9a\x03\x85\x03\xc0\x17\xcc\x01d\x15\xc0\x8a\xc0\
-\xad\xb2\x08\xeck\x010\xaeG\xdb\xb6|g8\xc3\xf0\
-;0\xb5%\xd4\x0b>x\xb0q\x89\x02`\xde<\xa1\
-\xff<\xa7\x0c\x1c\x02\x17\x05\xea1\xc0h^\x03\x86\x02\
-\xc0\x17\xda\x02\xaa\xc9\x03\x04\x02d\x01jOp\xaev\
-\x00gW\xb8\xadKA\xdb\x16q\xa4\x05\x81<\x9d\xa6\
-D\xf4\x85\xa2\x0a\x10u\xc0<\xe1\x02\x8e\x01,\x83\x04\
-0\x84e\x80\xb0\x01\xf8B[@5y\x00\x12\xf0\x86\
-N\x02r\x1a\x8c\x00\x8cS\xe7\x85\xf8\x03\x10G\x16\x00\
-\x90\x058\x00,\xc3\x8bB\xed\x1a0t\x00T\x12X\
-\xb8\x93\x8a@\x91\x02x!\xa8\xb3\x80\xed\x00\xd0\x0c\x9e\
-'\xa2-\x8d\x85\xd2\x01\x22\x15dj\x05V\x8dM*\
-\xc0$ 4.qj\x80eF~p\x80\xd1V\x0d\
-\x18\x1e\x00_(\x07\xc0nP\xea/\x09\xe8N\x1e\xa0\
-L\xe0\x82\x0b.\xb0\x08\xe8\xd1\xb6G\x8f\x1em\xcf;\
-\xafm\xdb\xf4(\xa8\xd5!\x0e\xcfym\xcf3\x00\x1c\
-\xa4(A\x008\x02P\xff-cs`k38\xbc\
-\x14\xf0\x85\x9e\x06\xd9\x0e`\x8d\x83V\xd00@\x03\xd0\
-V\x00\xd0C\x01\xd0\x96&\x03\xe7\xc5 $\x11^\x1f\
-\x16\x02\xe0\xbc\x16L\xff\xa9B\x7f\x00`\x9d\xa5\xbf\x06\
-`\xde(g/p\xdb\x81\xff\x17\x1a\x00_\xa8>@\
-!`u\x82|\x1ex\x81!\x00d\x17\x04 \x00\xa4\
-\xfdy\xc9\xa3m\xad\x8a\xe0\xc3\xa0\x9e0\x00\xea\xcd;\
-XB\x0e\xa0=`\x9e\xda\x07\xb4\xa7\x00!\x03`R\
-\x80\x94_\xe8_\xcd\xa7A\xddq\x18`\x080}\xc0\
-yD\x80z\xa9\xa9\x10\x10\x07?R-\x1a\x9f\xa7\x01\
-8\xe8\x01\x00\xb3\xc1<\xd5\x05x\x00\xd8\x16\x02\x00'\
-\x82\xfc\x0a\x01C@\xb55\x0d\xea\xde\xbd\xaf\xe5\x01\xbc\
-\x13TI@U\x84\xb1\xb6i\x00\x005\x80\x02\xa0\xe4\
- \x16\x82\xebh\xbd\x1b\x03 \xf5y\x09\xa0j\xc0\x03\
-\x07\xc2\x01\x80\x15\x01;\xad\x14\xa0\x09\x00\x00X+\xa0\
-\x080\xbd\xa0\x22 \x89\xef\xc5a\x01@E \x00\xa0\
-\xd3@\xc9A\x1a\x061\x00\xd0\x11\x8c\x01D\x02\x00\x86\
-5\x0f\xe4U@wq\xa7\xf5\xdf\xb7\xef\x05D\xc0\xf5\
-\xdeyP\x0b\xac\x08RI\x7fq\x9c\xa7\x8a\xc0\xf3D\
-\x15x\x1e\xce?5\x02\xf3\x94\x03\x90\xf0C\xe6\xc9\xb3\
-\xc1\xa2\x05@[@\xb5\xad\xbfj\x04d\x0e\x90\x8d\x00\
-?C\xf4\xfa\x1e\xac\xdco\x1bG\xaa\xa1\xe7\x00\xf2;\
-\xca_\x0f\xf4/\x91\x04P\xfeW\x09@g\x00sQ\
-@\xe8\x0e\xf0\xb9,\x03L\x16\xe8\xa6M@W\x01\x82\
-\x82\x0b\xa8\x15P\x89\x00\x9aAJ\x02z\xd5\xc7\xfa\xa6\
-\xd2 \xa8~\x10\x00\xd0\x85 \x9c\xf51\xcf7\x8c\xfe\
-Q\x00@\x9d\xe0Mp7e\xe0 \x81\x00Y@w\
-$\xe0R\x99\x06 L7\x00m\xa0F\xa1G\xed\xed\
-\xf8R\x0e8L=\xc6\xd1\x8a\xa1\x5c\xc0\x1a\x81\x83S\
-\x01\x80\x83\xba\x12T\x06@C\x00<\x19\xe0\xd0\x149\
-\x06\x0a\x09\x80\xbf{,\x00\xf5\x1fD\x04\xe82P\x10\
-p\xa9\xf4\x00M\xc0\xf5\xd7;\x08\x8c\x1b7\xaeG\x1c\
-\xa9\x04\xad\x16\xb9b\x0e\x1ed\xfa\x1f\x9c:O{\x00\
-\xd3\x9f]\x18|(T\x00\x94\xfe\x9fc\x1d <\xa0\
-_uu?S\x06\xdc\xca\x09\xe0\x00\xd8I@\x11\x00\
-\x08\xc4\x10\xa4\x10\xe3\x02\x00@\xf9\xa7\x1a\xf1\x87\xb0\x0c\
-\xe0t\x81\xa1\x01\xa0\x10\xd8\xf9\x05X@?U\x09\x0e\
-\xaa\x1e\x84U@\xb7\xad\xb7n\xb5\xd3@\xdf\x0b\xbav\
-\x05\x0f\x90\x04\x8c\x1bg\xa4\xf7\x8fXo\x1f\x00\xe4\xb1\
-9\xafG\x0b\x81\xc08\x09\xc1TH\x01\xbeU\x80\xa9\
-\x01\x0f\xe9& \x1c\x00$\x01\x9f\xa3\x07\x10\x02\xfd\xc8\
-\x03v\x13\x02\xa0\xfe\xfd\xd8\x090\x0f\xe8\x8a\x06p\xc1\
-\x05\xac\x1fH\x84@\x1cAq\x1ex\xc08\x04`\x9c\
-\xac\x01\xa6\xfa\xaaO\xa7\x03\xf2\x9d\x80\xb0\x00\x00\x02>\
-\x87\x12\xe0\x0b\x95\x04\xc0\x01\x06\x88\xbbH\x01\x83\xb6\x0a\
-\x0b@\x02\xba\x0b\x04.\xf5\xa4\x81\xeb\xfd\x22\x965\xe5\
-\x003\x00\x0c\xce#\xfd\xa7R+\xe0e`\x94>\x1f\
-\x94e\x80\xd0\x00\xf8\x02M@8\x00$\x81\x9b\x08\x00\
-\xb4\x80A\xd8\x08\x10\x01\xdd1\x07\x98v0!\x02q\
-$\x0bH\x022\x1b\x8cC\x07h1\xaa\xc5\xd4qz\
-[Pm\x00Q\x01\x887Y\x01D\x00\x80\xcc\x02\x22\
-\x09P+\xa8R\xc0\x00\x22`w7,\x03\x04\x01[\
-u/\xd0\x15\x07\x02\x17\xb0z\xf0\x02\xb74\x8c#1\
-\x00\xac\x14\x00\x06\x0e\x8e\x1b\xa5\xf7\x84(\x0bLu\xd7\
-\xbfq\x00\xa9\x7f\x88)\x80\xd2\xc0\xe7;?G\x0b\x10\
-&@\x8d\xc0 \x01\xc0\xa0A\xdd\xbau\xbb\xf5\xd6[\
-\xb7\xdeO&\xd0\xfd\xd2K\x05\x03]\x81\x83\xaeX\x0c\
-&\x8eXj\x16\xec\xb8\xc8\xc5\xaf\x8aBh\x08\x0e\xf6\
-\xd0\xa3\x00@`\xaa\x9c\x00\xe2\xea\xb7{\x80\x97\xc3\x05\
-\x00\x18\x80\xe5\x0f.\xf0\xb9\xaa\x03\xfbU_\x06\x1e0\
-\x08\x18\x90\x04t\xef\xce\x09\x10\x01F\x90\x1c\x818\xfc\
-B\x08~A\x0f\xe2`t\x0fT_\xc8?\x1a\xf4\x1f\
-5\xea\xe0\xa8\xa90\x11\x94\xe5\xa0$`\xf4h\xb7\x09\
-\x0c\x15\x00`\x00 @\x0b\x10!-\xa0\x1a\x1c\xc0\x9f\
-\x00b\xa0\xabt\x81\xbe\x17\x8c\x8bE\xcd\x08\x83\x1e\x92\
-\x01 \xa0\x87H\x03\xa3\x90\x81QB\xfdQX\x0c\x8e\
-\x1a5\xca2\x00\xd3\x04\x86Z\x03\xa8f\xf0\xf3\xcfG\
-B+p\x13Y\x00\xb4\x02\x80\x00\x11p?\xb5\x02D\
-\xc0\xa5}e\x12\x90>\xd07\xa0 \x88#\xa9\xfeS\
-$\x03\x82\x02\x02\x00\xf4G\x07\x00'P)\xc0[\x02\
-\x1a\x00\x8e\xcd\xda\x01\xb0\x06\xf8\x1c\x01\x10\x04\x90\x05\x88\
-\x14p\x19\x96\x01X\x05\x80\x05\xdc/\xcb\x80K\x89\x00\
-\x85\x80\xf8\x1a'|@\xdc\xdc\x88%\xf6\x04;2\xa2\
-\x06\xb8\xe0\x02l\x06/\x18\x87y`\x94\xb8\x93\xfe\x82\
-\x80Qv\xf8e\x80}\x1c\x80\xeff\x08\xc0\xdf\xfef\
-\x92\x00\x01 \xaa\x00 \x00=\xe02\xe1\x02P\x08\x12\
-\x00\x80\x00#\x80\x12A_\x00\xe0\xd2\xbe\xfc\xd5\xc5\x91\
- \xe88\xe1$M\x08\x8f\x08P18ZT\x82\xa2\
-\x15\xd0\x92\xcf\xd37\xe8\x00\x98\x03l\xb3\x00\xf8~\xb6\
-\x00\xfc\xfdo\xc6\x03\x88\x80\xcf1\x09\xf4\x03\x0f \x00\
-p\x1c@\x08\xb0V@3\xd0\xb5\xab\x9a\x0d\xc4\x16\x10\
-\xb0\xe0\xbd\x07\xa6+,|\x95\x09.\xa0n`\xb4\xf8\
-\x06\x00(\x08\x0ez\x0c\xe0\x90\x95\x01\xd6\x87\x02\x80\xb2\
-\x00\xd9\x0b\x08\xf9GB\x1d \x09\x90Y`7\x94\x01\
-\xbbo\xc5n\xb0;A\x00E\x80\xb6\x01\xc3\x80\x81\xa0\
-o\x1c\x9e\xd0P\xa0\x03t\xb5\xab\x81qT\x0ax\xd5\
-G\x03\x98\xc2K@\x02@8\x80\xaa\x01\x8f\xc5\x12 \
-C\x00\xfe\xa6r\xc0\xe7\x7f'\x07\x90\x9d\x00 P\xad\
-M\x00\x0b\x01\x99\x08X;`R\x01{\x8euA\x1c\
-\xde\xe8{\xa9<2}\x1d?\x00\x18 \x17@)8\
-z\xf4\xa8\x80\x02@W\x00\x94\x014\x00\xc7d\x07\xc0\
-\xdf\xb9\x07P\x8c\x1cy\x13\xb5\x02X\x07`\x19 \x09\
- \x04\xbaw\xbf\xd5b@\x02~\xe9\xa5\x16\x12vt\
-\xad\xb57\xbf\x83\xe1\x93\x14TS8Z\x11pPM\
-\x00u\x01\xa0z@\x07\x00\xe5\x00\xdf\xc9\xd0\x01\xb4\x07\
-\x18\x0b\xf8\x5c\xb6\x02\x22\x0d\x10\x01\x88\xc0 M\x80\xee\
-\x08\x0c\x05\x1e\x08\x9c\x88\x13\x80\xf7\x08\x01\x09\x97\xa2\xfe\
-\xe3\xa6\x08\x06DC8e4X\x00 \x00\xc2\xd3\x00\
-X\xad\x7f=\x05\x94\xfa\xef;\xc5\x05\xe0\xf8\xb4\x018\
-\x95\xf47\x85\x80\xb2\x00\xec\x06\x85\x05\x5c\x86\xa5\xe0\x00\
-2\x81\xdd&\x0f\xdco\x0aB\xc9\x00/\x0d\xe3\xf0\x89\
-\xee\xf2v\xe9\xa5\xce\x81\xeazH\xdc\xbav\x9d2\xa5\
-\xeb\x94\x1e$\xff\xe8\x83\x98\x09F\xab\xe5o\x1b\x80,\
-\x01\xf7\xed;\xc1\x9d\x03\xa5\x0f\xc0Q\x1fJ\x02\xc8\x03\
-\xfa|\xae\x08\xb8i\xe7H\xb0\x80\x9b\x80\x00(\x03\xa8\
-\x0e\xc0\x91\x90\x1e\x0a`tw\x22\x16:\xbd8$\xf4\
-G\x13\x98\x02\x83\x94)\x90\x01\x88\x81\xd1\xb2\xf9\x13\xe5\
-\x1fU\x80\x1e\x03\x08\x05\x80.D\x80i\x06>\xd71\
-\x92\xa6\x01\x98\x04\x80\x80j\x93\x06\xf4X\xc0\x97\x81\x98\
-\x89$V\x80N\xa0\x0fKW\xf8\xea\x0a&p\xa8+\
-\xe8,\xf4F#\x90\x1c\x8cV\xfaOq\x0d T\x00\
-\xa4\xfc\xc2\x02\xfe\xae\xcb\x80\x91\xb2\x0c\xa8\xc6:\x80\x06\
-\x02\xd4\x11v\xdb*K\x01m\x04)\xb2\x10Gw5\
-J\xeb.S\xc1!q?t\x08\x0984\x05\x8c\x00\
-\x11`\xfa+\xf9-\x03@\x078\xe98g\x0c\x90\x01\
-\x00'j\x07\x90\x10|nL@\x0d\x85\xe5Dh\x00\
-\xd5\x82\xdd \x11\x0c\xea\xc6\x08\xf0`\x10\xd3\x90\x22\x05\
-\xc6\x1c\x91\x81C]\xd1\x02\xa6L\xe9!nS@\xf9\
-\x1e\xa3\xa7(\xffG\xfdu\x13\x08\x06\xb0\xef\x07\xa1\x00\
-\xf0\xa1\xed\x01B\xff>\xba\x19\x14\x1e\xb0S\xf7\x02\x22\
-\x06\xc9\x91\x00\xdc\xbb\xc9\xb8\xb5\x9b\xe2\xe0~\x04!\x80\
-\x868\xbc\x0b\x04\xd7\x08|S\x0c@`1H\xf2k\
-\xf5u\x01\xa06\x02\xf7\x81\x03\xf0.\xf0[Y\x00\xf0\
-\xb7.\xdc\x03\xfa\xfc\xbdO\x9f\x81\x9f\x9by\x80L\x03\
-\x94\x07.\x93.\x00\xfa\x0f\xd2\x08\xb8u\xa1\x8c\x98\x04\
-\xbf\xf0I\x9d\x82\x81\xee\x87\xba\x1f:$\x10\x80<p\
-H\x9a\x00\x8b\x97Y\x020\x19\xe0\xc7V\x17\x98!\x00\
-G}\xa8-@\xc8\x8f6 \x10\x18\xc8=@\x12p\
-\x99,\x05L*\xe8\xd6\xcdb\xe0V\x95\x15\xfc\xe3\xfe\
-[\xe3\xe0\x87\xc3,\x10\x00\x00\xf3\xc1!\x15S\x5c\x06\
-^~\xd9\xab\xbfS\x03~\xf7\xe8\xefd\x04@'\x01\
-@\x17\xcd\xc0r*\x03\xfa\xf4\xf1#\xe02i\x02\x03\
-d&\x18\xe4\x98\x80i\x0f\xe2H\x03\x04\x8a\x97\xbb\xdf\
-\x7f\xe8\xd0\xfd\x87\x1c\x06\xd0\xfc\xa7\xbc|H\x03p\xc0\
-\xf4\x00\xaa\x06\xcc\x12\x80\x13\xd1\x02L3\x08\x08\xf4\x81\
-,00\x11\x02\x034\x02\xfe\x18\x0c\xb2\x9c\x01\xeeq\
-\xd8n\x89K\xa5\x9b\x02\xe0e\xfa:\xf4\xb2\x8b\xc0!\
-\xa3?[\xff\xe8\x00|'@\x96\x00\x19\x03`\xd2\x80\
-\xac\x05\xfb\xf0,0r\xa4C\x00!\xc0!\xe8F%\
-\xc1 \x12\x7f\x9bz\x9d\xf7\x8b[-\xd7?\xe1\xcb\xdf\
-vk7y\xb2\x95D\xe0\x90_\xbc\xac\xeb?+\x03\
-\x9c\xec\xd9\x0a\xca\x08\x80\xa3>\xf4'` \xab\x04\xbd\
-&\xa0\x19\xb0\xac@v\x07\xd4\x22\x0c\xba\x1f\xfe<\x88\
-\x0a\xc6\xda\xbc\xda\xb7\xa9\xbb\xf8\xc2\x83\xb1\x8d\x8e\xc76\
-uXn%\x06\xb6\x91\x15\x08\xb1=\xea\xab\xf5\xcf\x0d\
-`\xdf\x09\xc7\xf1& s\x00N\x96\xfa\xdb\x04@\x16\
-@\x04\xae4\x04\xb8\x08\x5cF\xf2\x0f\x184\xc8J\x08\
-\x8c\x07\x22AAQ\xfb@\x18\xc4n\xdd\xb6\xe1a\xd8\
-\xc6\xf3&\x1d\x91m\xba\x8b\x126\xf0\xb2\x96\x9c\xc76\
-\x9e\x01H\xff#?pJ\x80L\x018\xb1\x8b\xc7\x03\
-\x96[\x08\x984 \x110\xb5\x003\x02\xc9\x80?\x0a\
-qxb\x1b\xff\xb6\x8d \xd8\x866\xf02\xba\x00\x85\
-\x8f\xfd\x93\xfc&\x03\x98)\xc0w\x8e\xff^&\x00\x88\
->\xa0\x8b\x0d\x00\x8d\x03\x88\x80\x81\x8e\x09(\x04\x8c\x11\
-\xf0t\x00\x0d\x82j\x12\x06\xe0m\xd0\x80Z\xce\x84u\
-4\xf06@\x1d\x22Z6\xdb4\x04\xdd\x84\xc6\xb7\xde\
-\xba\xed\xfe\x97\xb7A&\xb8_q\xa0\xe4W\x1d\x80$\
-\xc0\xce\x00d\x00\x99\x01\xf0\xe3.\xca\x03t\x1aXn\
-<\x80\x9b\x00U\x83\x0a\x02\x8b\x01\x8b\x02;\x06\x0d\x88\
-c@\xa2\xa33h\x10\xf9\xe7\xb6m\xddHi\x14]\
-\xc8N\xf7m\x96\xfer\xfd\x1f\xb12\x80*\x012\x03\
-\xe0\xd4N]<Y\x80\x06\x02\x7f\x97\x04\x0c\xb4\x11\xd0\
-\x04\xf8\x98\x01\x82@\xe5\xc1\x80\xcbby\xad\xb8\xcc\xf9\
-\xcec\x9b\xb8Q*\xc0\x1b\xdc\xef\xb7\x10\xb0\x97\xbf\xc7\
-\x00\xb2q\x80\xa3N\xee\xd2E!\xa0=\xe0W\xca\x04\
-\x06\x02\x02\x98\x08F\x8ed\x0c\xf43%\xa1\x9f\x1b\xc8\
-\x22\xf12\xc5\x02\xbc\xec8.\xebw@};0\x00\
-\x8f\x12\xd2p\x00\xef\x88\x81\xe0@\xc5\xfd\xdbx\x1c\xb0\
-\x1a\x00a\x00f\x0a$3@\x16\x00\x9c\xd8\xa9S\x17\
-O\x1d \x08X\xde\x87\xfa\xc1\x81*\x11\x8c\xb4\x18`\
-Vp\x19\x1a\x01\xdd\xe8%\x0e\x107\xfd\x83~\x97\xb9\
-6Q\xebb@\xbf\x01\xf2\x98\x0c\x90\x14\xb0\xc5\x22\x11\
-\xd8FF n\xdd\xb6\xf9\xa9\xcf\xf4\xdfw\xf2q\xd6\
-\x14\x88\x0c S\x00\x8e\xbaZ\x10`\x0a\x81\xbf\xb9&\
-\xd0G#`\x5c\xc0@\xd0\xcfJ\x08\xfd\xfa\xad\xbf\xec\
-@?\xba\x0f0T\xd4\xf6\x9b8\x1e\xfd\x0e\xf4\xc3\xa3\
-r\x00\x97\x0bB\xc0\xd2\xe7\x81\x01\x07\xc8\x0b\xc8\x02\x06\
-\x18+\x10\xba\x9b\xf5\xbf^\xea\x1f`\x00\x99\x02 ,\
-\xc0\xa7\x0e\xf8\x954\x01\x01@\x00\x02\x1a\x82\xf5\xfd\xe0\
-v\x00\xe4\xb7i\x80\x9f\x1d\xc0\x9f\x1e\xa8\x95wu\x0c\
-\xfa\xa1\xee\x97\xf5\xe3?\xd1\xcf\x0f\x10\x06\x07\xc8\x09\x0e\
-\x1c\x90\xea\x1f07K~\xd0\x9f\x19\x80i\x023\x07\
-\x00,\xc0\xaf\x12\x04\x02\x98\x07POx\xe5\x95\x5c\x7f\
-\x9d\x0c\x90\x83\xf57\xa1\xd8x\xa7\x1b=\xab\xb5\xf7\x03\
-\xfa\xe5\xabU \xbe\xd3aZ\x8f\xcf\xd6\xcbE#0\
-\x10\x85\x01\xc4\x00i\xf7\xe2\x89r~\x09\xc0z\xdd\x01\
-h\x038\xc6\x18@V\x00\x9ch\x13`\x18X\xfe+\
-\x95\x06l\x06\xae\xbc\xd2c\x04\xf8\x08\xafM\xbc\xa8\xf5\
-\xeb5\x01\xf0\x03\xb8\xad\xbf\x09^n-z\xec\xa7\x9e\
-\xf6\x93\xcf\xd51\x80\x83\x84\x87\xcaD?\xf5\xf7!E\
-\x08\xe5\x07H\xf5\x07X\xf2\x1fP\xeb\x1f\x0c\xe0\xfb\xdc\
-\x00d\x0f\x909\x00G\x9d\x0c\x04\xf8\x9b\xc0\xaf\xa4\x09\
-h\x04\x06\xc2h\xc8\xc3\x80\xc6`\xe4M\xf2\xbe~\xa4\
-x\xad\xca\x1b\xf0\xdeO=\xd6\x82\x18\xc9\x9f\x8d\x84\x17\
-n\x8e\x06\x1e\xab\xf5\xebGZ\x10\xac_\x7f\x00n\xfd\
-\xc4\x97'\xf6\xadW\xab\x1f\xf5\xf7\xa9\x00\xb2\x05\xe0\xd4\
-\xab\xaf\x0eH\x03\xa2\x14\xc0L\xd0\xc7b`\xe0\x95\xda\
-\x08\xae\x1c\xe9!\x01b\xbd\xe7\x8f\xeb\xcd\xcf\xd9\xd3\x1a\
-\xf8\xe8\xber\xba\xf9\x1e\xa1\xf5x\x5c\xd6\xaf\xf7!\x81\
-\x02\x9f\x83\xfc\xeb\x99\xfe?\xe6\x09\x80\xf5\x00Y\x00 \
-,@\x10\xd0\x85\xa7\x81\xbf\xd9\xa5\xc0\xf2>\xcb\x91\x00\
-\xc6\xc0\xc0+e\x00\x04\x01\x1c\xf8Q\xb1~d\x0d\x8e\
-\xf5A\xaf\x12\xfe|\xe5zqs~N\x7f\xb6\xe4\xb7\
-\x9f\x82\xf6\x07\x98\xfcG\x8e\x80\xfcv\x02\x90\x06\x90\x05\
-\x00G]\x8d\x04t\xe1\x85\x00K\x04\xc0\x80\xb6\x01\x8b\
-\x01M\x01 \xc0\xc3}\x95@\xc8@\xf6\x88\x0f\xcaA\
-j\xccs\xf1\xe2\xe4\xeb\x93\x0bc\xa4}X\xe0X\x98\
-\x835\x92\x1d+0\x82}\xea\xbe\x1ej~\x99\xf7\x0f\
-\xb0\xd5\x8f\x00\x9c\xc4\x0b\x00i\x00\xd9\x03p*\x12\xd0\
-\xc9\x9f\x80_I\x02\x96/\xef\xe32@ \x88\x18x\
-e\x82\x10\xa0\x8ctn\xfc[Mz\xceoW^\x89\
-\x0f#\xad#\xe1\x1f\xfb\xae\x14\xe6@_\xfb\xc0\xf0\xd7\
-\xef\xd3\xb6o\xa5\x7fQ\x01~\xff\xfbn\x02P\x06\x90\
-\x0d\x00G\xfd\xf8je\x02Z~\xc7\x04l\x08\x06\xba\
-q%\x820P>:\xaf\xcf\x1c\x03ul\xd8\xb7\x1a\
-\xf2|\xa4yu#\xd5\xeb\xc7\x9f\x0e\xa4\x05\xa0\xe57\
-\x8f\x03\x8d\xfc\xea\xfb\xbe+\x95\xfa\xeb%\x07\x96\xfc\xde\
-\x04\xc0\x0c +\x00\xb0\x0c@\x0f\xe8\xf4\xe1\x87\x96\x0b\
-tpm\xc08\xc1\xc04\xe2J\xfa\xdag\xdd\xaf\x94\
-_\xe6[\xd1\xfe\x5c\xa6D\xf53vWz\xfb\x1d\x11\
-\x11\xfb\xae\xc4\x87}\x12\x80}`\x01W\xbaK_\xc9\
-\x7f\xe4$\x92_'\x80\xa3\x99\x01d\x07\xc0\xf7\xaf&\
-\x0f\x80n\x80\x9b@\x07\x9e\x09\x18\x04}\xfa\xb0\x8c\x90\
-&\x0cq\xd8\xb1\x8f%S\xa1\xf8@M\xc0@\x96\xfb\
-}\xf57C\xa0\xac\x01\xa02\xc0E@\xb9@\x07\xfa\
-\xfa\x95\x84\xc06\x03C\x82\x7f\xd4FM\xfb\x0c4\x1d\
-S\x1fz\xc0\x9bZ/\x18G\xe0\xd8\xf4\xa1\x7f\x22(\
-\x10\xb7#\x03\xe5\x13\xb4\x15\xa1\xfc\xc0#<N6\xfa\
-\x1f\xeb\xd5?K\x00\x18\x01\xbc!\xfc\x9b.\x07; \
-\x03\x12\x02\x86\x00\x9a\x81\x9b\x1d<\xb1\x5c~9?[\
-\xdeg\xb9\xfaG\xcb\x8b\xee\xe7\xf4c\xf3\xb3\xe5\xec&\
-\xff\xb6\xec\x9f\x97\xab\xbf~\x04T\xefC\x07\x8d\x1d\x19\
-\xb3X\x90\x96#\xf6\xbaw\xf4?\xf6XV\x00\xa8\x19\
-@\x08\x00\xc8BP\x0d\x85l\x17\xf8P\xa8O\xa1\x11\
-\x10u\xa1\xc5A\xe2\xe8#\xbf\x9c\x9f\xd11\x92O\x8b\
-\xed\xe7\xf4c\xf33\xa3?\xfb\x81\xb2\xc9>\xf4_\xe9\
-\xe3\xfe\x97e\x1c\x11\x7f8\x22\xfe1*=\x10\xefH\
-\x80\xc6\xa0\x13\xe8\x7f\x8c\xa5\xff\xd1\xb6\x01d\x0d\x00\x15\
-\x82B\x7f\xd9\x11Z\x08t\xe8\xf0!\xe6\x01\x8a_\xd9\
-\x01\xaf\xc0I\x0d\xf6A\xea\xb3\xbcv\xc7\x11\xbc\x9b\xa0\
-c\xf6\xab#\xe2\x09\xfc#\xf9\xb5\x9c\xc4\x1fx\xc4\x1b\
-\x1d\x8e\x0c>\x19\xe5\x97\xf6\xaf\xd7?\xd3?{\x00\x18\
-\x01WwQ&\xa01\x18\xdcA\xebOV\xe0r\x80\
-\xaf\xcb\x1b\xb5Uq\xad\xfb\x91\xe5j\x81,g\xcb\x05\
-\xe3\x88\xb4\xd2#\x00\x02*\xbd\xfc\x88_\x0c\x1e<\xf8\
-\xe4c\xd8\xf2\xe7\xfa\x87\x09\x80\x22\x80L@\xd7\x02]\
-\x98\x0f\xd8\x10\xc8\xa4\xf07?[\xe0\x08\x1c\xa1\xa3\xd1\
-\xa1\x16\xdd\xcc\x03\xdd\xc4q`G\x89\x1f/x\x06\x04\
-\xf8G\xa7#\x1d\x06[\xfa\x7f+H\xff0\x008\xea\
-\xc4\xab\x0d\x02\xb2\x16\xe8\x02\x04\x10\x03\x83?\x1c<\x18\
-r\x817~\xd5\xc1\xef\x87\xea\xb5.\xef@\x0f\xcbk\
-\xe5M\x1c\x1c\xf8f\x94\xef\xa0\xbe\xd9G\xee\x08=\x80\
-\xdf\x93\xedw\xe8\xd0I\xe8\xdfI<\xa2\xfe\xc7\x1e\xcb\
-\xf4?\xda\xab\x7f(\x00\xe8^\xc0A@3 (\x18\
-L^\x90\x12\x03\x1d\x8c\xea\x84A\x1c\xbeq\x84=\xc2\
-\xb7\xc1G\x06\x1f\xe9\xa4o\xa0\xbf%\xbf\xdf\xfa\x0f\x09\
-\x00F\x80@\xa0\x93<S\x00 \xe8\xc2 @/\x18\
-\x0cv\xe0o\x08q\xa4\x1b\x83;\x0cVO\xe0\xf9\xe0\
-\x0eZ~\x11'\x1c{\xacg\xf9{\xf5\x0f\x09\x00S\
-\x08\xf80\x80\x10h+@;\x18<\x18s\xd4\xe0\xc1\
-\x01\xaf+\x8e\x80\xa3\x22\x8f\x99<x\xfa0R\x90\xf4\
-\xa8~\xa7N\xa7\x1a\xf5U\xf6\xf7\xd3?4\x00L!\
-\xa0\x12\x012@\x10h\x10\xbaH\x04\x08\x82\x84!r\
-Y\xad\xd6\xbb\x93\xa9\xa1\x95\xe0\x83;t\x08<Z\x98\
-\xf6;\x81\xfc\x1d\xf6\x89#\x7f\xb2\x16_\xba\xffw\xa3\
-\xd6_\xa4\x81\x93m\x02h@\xcc\x10\xe8\x22\x8bC\xc2\
-\xa0\xcb\xe0\x0f\x13\x92\xd0\xe9\xc3\x0e\xf4\x92\xe0\x11\xef\x1d\
-:\xd5\x9e\xbb\xd0]\x1e\x07\xf7 \xc1A\x84op\x88\
-\xe0.\xff\x15\x0c\xf1\xe7N\xd8\x8b\x9d\xf0\xadoq\xf5\
-\x8f\x96\xf2G\xaa\xbfc\x02\x98\x07\x02 P(\xc0\x8b\
-\x83WC\xaf\xc9\x1e\x22B\xc1\xf0!x@\xa7\xdax\
-Ci\xe90\x91\xea\xa4\xbc\x02\xa0\x8b\xc2`p\xa7.\
-\xc0\x80Q\xbf\x13\x1c\xf6\x93O\xb5\xd7~\xa0\xfd\x87\x0d\
-\xc0Q\xc7\xf1J@\x1b\x81\x84\xc0\x97\x02\xe5\x09\xd83\
-\xa8Pl\x7f\xf8!\x19@\x17\xf9\xd0E.\x8f.\xec\
-\x19_6\xc5\xf6s\xbf/\xfc\xbb\x02\x7f\xa5\xbf\x1d\xa8\
-\xbf<\x96\x9d\xd4a\xedd\xc7\xd5\xa7*\xe5\xbfk\xcc\
-\xdfw\xf9\x87\xae\xbf\x93\x07\x0c\x01\xdc\x0a\xe87\xee\xa2\
-_\x88~\x0e\xaf\xaf\x13\xdd\xe0\xfe!w\xffN\x9d\xd4\
-\xd2PO;\xf1\x7f\xa2\xffTl?\xf7|\xe9W\xa7\
-\x09P\xc7\x8d\x8e\x0a\x9cz\x11$<=\x9e\xc0\xa5\x97\
-\xeaK\xf9s\xa0\xbf\x17\x017\x02~{7>4G\
-\xac\x93\xef\xd3\x0e\xbe\x7f*\x9e\x9f\xf3\xa7\x9d|\x7f\xaa\
-\x97}\x82\xc3t\xb5zT\x87\xf7\x04\xa9\xf8\xd1G\xab\
-\xa5\x1f,\x7fD\x00$E\xc0&!\x8eT\xe3j\xd3\
-Z\x99\xd4j\x1d\xd2\x93OT\xe2\x1fm\xe2;\x81\xf2\
-G\xa5\xbf\xa7\x1c\xf4\x95\x9f\xa7\x87 \xb4\xafV\xdf\xe4\
-S\xfdC\xfa\xd7;\xa9\xef\xb4\x0ba\xfe\x5c\xc0?\xef\
-\xa4\xfeA\xa7T\x96\x00?B\xfe\xcf\xd9!=\xf1\xd4\
-\xefP\xd8\xe2\xa3\xfa~\xf2G\xa9?\xd8\xc0\x89)\xf9\
-\x80\xdb7\xc8\xc3';\x88\xab\xcds\xf6\x07M\xc0\xd5\
-\xfc\x88\xb3?\x17\xee\xcf\xaf\xd6?\xb8\xba\x93\xef\xaa\xb0\
-\x0eB\x1aq\xe2\xa9B\xe5\xefx#P\xfd\xa8\xf5'\
-\x1f8\xf1\xea8\xa2\x8f\x93Q}\x19\x8e\xf6\x01\xe2\xe7\
-F\x7f\xe9\x04\xe9[A\x1c)K\x7f\xe2\x89\xc7\xdba\
-\x14>\xfe{\xc1\xea\xe7L\xfe8\x22\x08.d\x90\xfa\
-I\x22>\x885\x0f\x81\xef}/\x96\xbf\x96\x22pT\
-:\xe2\xc7\xfa\xd7@\x02b\xf9\xe3\x88#\x8e8\xe2\x88\
-#\x8e8\xe2\x88#\x8e8\xe2\x88#\x8e8\xe2\x88#\
-\x8e8\xe2\x88#\x8e8\xe2\x88#\x8e8\xe2\x88#\x8e\
-8\xe2\x88#\x8e8\xe2\x88#\x8e8\xe2\x88#\x8e8\
-\xe2\x88#\x8e8\xe2\x88#\x8e8j}\xfc\x7f\x1d!\
-\x0e\x1bx-r\x92\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-"
+from np import profiling
+from np.utils import log
 
-qt_resource_name = b"\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x08\
-\x02\x8cY\xa7\
-\x00p\
-\x00l\x00a\x00y\x00.\x00p\x00n\x00g\
-"
+# compiled by scripts/generate_resources.py
+RCC_FILE = pathlib.Path(__file__).parent / "icons.rcc"
+TRAY_SIZES = [16, 20, 24, 32, 48, 64]
 
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9a>4m\xb6\
-"
+_registered = False
 
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
 
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+def ensureResources() -> bool:
+    """Register icons.rcc on first use, Qt maps the file instead of copying it"""
+    global _registered
+    if not _registered:
+        _registered = QResource.registerResource(str(RCC_FILE))
+        if not _registered:
+            log.error(f"Failed to register icon resources from {RCC_FILE}")
+        profiling.mark("icons.registered")
+    return _registered
 
-qInitResources()
+
+def trayIcon() -> QIcon:
+    ensureResources()
+    icon = QIcon()
+    for size in TRAY_SIZES:
+        icon.addFile(f":/icons/play-{size}.png")
+    return icon
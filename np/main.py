@@ -1,42 +1,59 @@
 import asyncio
 import sys
+import time
+from dataclasses import replace
 from typing import override
 
 import PySide6.QtAsyncio as QtAsyncio
 from PySide6.QtCore import QRect, QSize, Signal
-from PySide6.QtGui import QIcon, Qt
+from PySide6.QtGui import Qt
 from PySide6.QtWidgets import (
     QApplication,
     QLabel,
     QMainWindow,
     QMenu,
+    QMessageBox,
     QStackedWidget,
     QSystemTrayIcon,
     QVBoxLayout,
     QWidget,
 )
 
-from np import DEV, core
-from np.media import Media, PlaybackData, SessionsData
+from np import DEV, LATENCY_FILE, PREWARM, STARTUP_PROFILE_FILE, VIRTUAL_LIST, core, icons, profiling
+from np.artwork import artworkCache
+from np.media import Media, MediaData, SessionsData
+from np.store import MEDIA, PLAYBACK, TIMELINE, StoreDiff
+from np.tracing import tracer
 from np.utils import log
 from np.widgets.NowPlayingList import NowPlayingList
 
+# seconds to wait after media startup before pre-warming the main window
+PREWARM_DELAY = 2.0
+# seconds a single session may take to answer during initial population
+SESSION_FETCH_TIMEOUT = 2.0
+
 
 class AppTray(QSystemTrayIcon):
     onQuit = Signal()
     def __init__(self, parent: QApplication):
         super().__init__(parent=parent)
         self.app = parent
-        icon = QIcon(":/icons/play.png")
-        self.setIcon(icon)
+        self.setIcon(icons.trayIcon())
         self.setVisible(True)
+        profiling.mark("tray.visible")
         self.mainWindow = None
+        self.prewarmCost: float | None = None
+        self.firstShowLatency: float | None = None
 
         self.activated.connect(self.handleClick)
 
         self.menu = QMenu()
         show = self.menu.addAction("Show/Hide")
         show.triggered.connect(self.handleClick)
+        stats = self.menu.addAction("Latency stats")
+        stats.triggered.connect(self.showLatencyStats)
+        dump = self.menu.addAction("Dump latency stats")
+        dump.triggered.connect(self.dumpLatencyStats)
         quit = self.menu.addAction("Quit")
         quit.triggered.connect(lambda: self.onQuit.emit())
         self.setToolTip("Now Playing")
@@ -45,7 +62,12 @@ class AppTray(QSystemTrayIcon):
         self.app.focusWindowChanged.connect(self.handleFocusChange)
 
         self.media = Media()
-        self.media.onPlaybackInfoRefresh.connect(self.handlePlaybackInfoChange)
+        # (playing, sessions) the tooltip was last built from
+        self.toolTipCounts = (0, 0)
+        self.media.store.changed.connect(self.handleStoreChange)
+        if profiling.enabled and not PREWARM:
+            # with PREWARM the report waits for the pre-warm, see startMedia
+            self.media.onUpdateMediaSessions.connect(lambda _: profiling.report(STARTUP_PROFILE_FILE))
         _ = asyncio.ensure_future(self.startMedia(), loop=core.loop)
 
     def handleClick(self, reason: QSystemTrayIcon.ActivationReason):
@@ -53,6 +75,7 @@ class AppTray(QSystemTrayIcon):
         if reason == QSystemTrayIcon.ActivationReason.Context:
             return
 
+        t = time.perf_counter()
         if self.mainWindow is None:
             self.mainWindow = MainWindow(self.app, self, self.media)
         
@@ -62,15 +85,33 @@ class AppTray(QSystemTrayIcon):
             self.mainWindow.show()
             self.mainWindow.activateWindow()
             self.mainWindow.raise_()
-
-
-    def handlePlaybackInfoChange(self, _: PlaybackData):
-        apps = len(self.media.mediaSessions)
-        playing = sum(1 for pi in self.media.playbackInfo.values() if pi.playback_status == "PLAYING")
+            if self.firstShowLatency is None:
+                self.firstShowLatency = time.perf_counter() - t
+                tracer.record("window.first_show", self.firstShowLatency * 1e6)
+                log.debug(f"First show took {self.firstShowLatency * 1000:.1f}ms (prewarmed: {self.prewarmCost is not None})")
+
+
+    def showLatencyStats(self):
+        a = self.media.artworkStats
+        artwork = f"artwork: {a.reads} read, {a.downscaled} downscaled, {a.clipped} over the size limit, {a.failed} failed"
+        commands = self.media.commands.summary()
+        QMessageBox.information(None, "Now Playing - Latency", f"<pre>{tracer.summary()}\n\n{artwork}\n{commands}</pre>")
+
+    def dumpLatencyStats(self):
+        tracer.dump(LATENCY_FILE)
+        self.showMessage("Now Playing", f"Latency stats saved to {LATENCY_FILE}")
+
+    def handleStoreChange(self, _: StoreDiff):
+        store = self.media.store
+        counts = (store.playing, len(store))
+        if counts == self.toolTipCounts:
+            return
+        self.toolTipCounts = counts
+        playing, apps = counts
         toolTipText = "Now Playing"
         if apps:
             toolTipText += f" - {playing}/{apps} apps"
-        self.setToolTip(toolTipText)    
+        self.setToolTip(toolTipText)
     
     def handleFocusChange(self, win):
         if DEV:
@@ -80,6 +121,30 @@ class AppTray(QSystemTrayIcon):
 
     async def startMedia(self):
         await self.media.start()
+        if PREWARM:
+            await asyncio.sleep(PREWARM_DELAY)
+            await self.prewarm()
+            profiling.report(STARTUP_PROFILE_FILE)
+
+    async def prewarm(self):
+        """Build the window, its native handle and the initial session data while it is hidden"""
+        if self.mainWindow is not None:
+            return
+        t = time.perf_counter()
+        self.mainWindow = MainWindow(self.app, self, self.media)
+        # rows and artwork are filled in while pre-warming, hidden mode starts once that is done
+        self.mainWindow.hiddenMode = False
+        self.mainWindow.ensurePolished()
+        self.mainWindow.winId()
+        self.mainWindow.centralWidget().layout().activate()
+        build = time.perf_counter() - t
+        await self.mainWindow._initialFuture
+        self.mainWindow.list_view.flush()
+        self.mainWindow.hiddenMode = not self.mainWindow.isVisible()
+        self.prewarmCost = time.perf_counter() - t
+        tracer.record("window.prewarm", self.prewarmCost * 1e6)
+        profiling.mark("window.prewarmed")
+        log.debug(f"Pre-warmed main window in {self.prewarmCost * 1000:.1f}ms ({build * 1000:.1f}ms on the GUI thread)")
 
 class MainWindow(QMainWindow):
     @override
@@ -100,6 +165,19 @@ class MainWindow(QMainWindow):
     def close(self,):
         super().close()
 
+    @override
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.hiddenMode = False
+        self.applyHiddenChanges()
+        # the first frame shows current rows instead of waiting for the next batch
+        self.list_view.flush()
+
+    @override
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.hiddenMode = True
+
     def __init__(self, app: QApplication, appTray: AppTray, media: Media):
         super().__init__()
         self.setUpdatesEnabled(False)
@@ -108,6 +186,7 @@ class MainWindow(QMainWindow):
 
         self.app = app
         self.app.aboutToQuit.connect(self.aboutToQuit)
+        self.media = media
 
         self.setWindowFlags(
             Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint
@@ -126,10 +205,18 @@ class MainWindow(QMainWindow):
         self.loading = QLabel("Loading")
         self.view.addWidget(self.loading)
 
-        self.list_view = NowPlayingList()
-        self.list_view.onPrev.connect(lambda appId: asyncio.ensure_future(self.media.prev(appId)))
-        self.list_view.onPausePlay.connect(lambda appId: asyncio.ensure_future(self.media.pausePlay(appId)))
-        self.list_view.onNext.connect(lambda appId: asyncio.ensure_future(self.media.next(appId)))
+        if VIRTUAL_LIST:
+            # opt-in, the view, its model and delegate are only imported when asked for
+            from np.widgets.NowPlayingListView import NowPlayingListView
+
+            self.list_view = NowPlayingListView(media.store)
+        else:
+            self.list_view = NowPlayingList(media.store)
+        self.list_view.onPrev.connect(self.media.prev)
+        self.list_view.onPausePlay.connect(self.media.pausePlay)
+        self.list_view.onNext.connect(self.media.next)
+        if DEV:
+            self.media.onCommandRoundTrip.connect(self.list_view.setRoundTrip)
 
         # self.list_view.doubleClicked.connect(lambda x: asyncio.ensure_future(self.handleDoubleClick(x.row())))
         self.view.addWidget(self.list_view)
@@ -137,41 +224,147 @@ class MainWindow(QMainWindow):
         self.appTray = appTray
         self.appTray.onQuit.connect(self.quit)
 
-        self.media = media
-
-        self.media.onPlaybackInfoRefresh.connect(self.updatePlaybackInfo)
-        self.media.onUpdateMediaSessions.connect(self.updateApps)
-        self.media.onMediaPropsRefresh.connect(lambda appId: asyncio.ensure_future(self.updateMediaInfo(appId)))
+        # while hidden only the latest state per session is kept, see applyHiddenChanges
+        self.hiddenMode = True
+        self.hiddenAdded: set[str] = set()
+        self.hiddenRemoved: set[str] = set()
+        # session key -> store fields that changed, the store already holds the values
+        self.hiddenDirty: dict[str, set[str]] = {}
+        self.hiddenProps: set[str] = set()
+        self.hiddenEvents = 0
+
+        self.media.store.changed.connect(self.handleStoreChange)
+        self.media.onUpdateMediaSessions.connect(self.handleSessions)
+        self.media.onMediaPropsRefresh.connect(self.handleMediaProps)
         self._initialFuture = asyncio.ensure_future(self.getInitialData(), loop=core.loop)
 
     async def handleDoubleClick(self, idx):
         print(idx)
 
+    def handleSessions(self, apps: SessionsData):
+        if not self.hiddenMode:
+            self.updateApps(apps)
+            return
+        self.hiddenEvents += 1
+        self.hiddenRemoved.update(apps.removed)
+        self.hiddenAdded.difference_update(apps.removed)
+        self.hiddenAdded.update(apps.added)
+
+    def handleStoreChange(self, diff: StoreDiff):
+        if not diff.fields:
+            # sessions coming and going reach the list through handleSessions
+            return
+        if not self.hiddenMode:
+            self.refresh(diff.key, diff.fields)
+            return
+        self.hiddenEvents += 1
+        self.hiddenDirty.setdefault(diff.key, set()).update(diff.fields)
+
+    def handleMediaProps(self, appId: str):
+        if not self.hiddenMode:
+            asyncio.ensure_future(self.updateMediaInfo(appId))
+            return
+        # nothing is fetched for a window nobody sees
+        self.hiddenEvents += 1
+        self.hiddenProps.add(appId)
+
+    def applyHiddenChanges(self):
+        """bring the list up to date with everything that happened while hidden, as one delta"""
+        if not self.hiddenEvents:
+            return
+        sessions = self.media.mediaSessions
+        # a key removed while hidden may belong to a new session now, rebuild its row
+        removed = {k for k in self.hiddenRemoved if self.list_view.hasApp(k)}
+        added = [
+            k for k in sessions
+            if k in removed or (k in self.hiddenAdded and not self.list_view.hasApp(k))
+        ] if removed or self.hiddenAdded else []
+        self.updateApps(SessionsData(added=added, removed=list(removed)))
+        for k, fields in self.hiddenDirty.items():
+            if k in sessions:
+                self.refresh(k, fields)
+        for k in self.hiddenProps:
+            if k in sessions:
+                asyncio.ensure_future(self.updateMediaInfo(k))
+        log.debug(
+            f"Applied {self.hiddenEvents} events from while hidden: +{len(added)} -{len(removed)} sessions,"
+            f" {len(self.hiddenDirty)} sessions changed, {len(self.hiddenProps)} media updates"
+        )
+        self.hiddenEvents = 0
+        self.hiddenAdded.clear()
+        self.hiddenRemoved.clear()
+        self.hiddenDirty.clear()
+        self.hiddenProps.clear()
+
 
     def updateApps(self, apps: SessionsData):
+        tracer.stage("sessions", "*", "signal")
         for a in apps.removed:
             self.list_view.removeApp(a)
         for a in apps.added:
             self.list_view.addApp(a)
+        tracer.end("sessions", "*", "widget")
        
 
     async def getInitialData(self):
+        """Show placeholder rows right away, fill in text as it arrives, then artwork visible rows first"""
         added = [k for k in self.media.mediaSessions.keys()]
         self.updateApps(SessionsData(added=added, removed=[]))
-        await asyncio.gather(*[self.updateMediaInfo(k) for k in added])
-        for pi in self.media.playbackInfo.values():
-            self.updatePlaybackInfo(pi)
+        for k in added:
+            self.refresh(k, (PLAYBACK, TIMELINE))
         self.view.setCurrentIndex(1)
 
-    def updatePlaybackInfo(self, pi: PlaybackData):
-        self.list_view.updatePlaybackInfo(pi.app, pi)
+        fetched = await asyncio.gather(*[self.updateInitialMediaInfo(k) for k in added])
+        props = {m.app: m for m in fetched if m is not None}
+        # reads of hidden rows only start once the visible ones have their artwork
+        for group in self.list_view.appsByVisibility():
+            await asyncio.gather(*[self.updateInitialThumbnail(k, props[k]) for k in group if k in props])
+
+    async def updateInitialMediaInfo(self, appId: str) -> MediaData | None:
+        try:
+            m = await asyncio.wait_for(self.media.grabMediaProperties(appId, withThumbnail=False), SESSION_FETCH_TIMEOUT)
+        except asyncio.TimeoutError:
+            log.debug(f"Initial media info timed out for {appId}")
+            # the fetch keeps running, apply it whenever it lands
+            asyncio.ensure_future(self.updateMediaInfo(appId))
+            return None
+        if m is not None:
+            self.media.store.setMedia(appId, m)
+        return m
+
+    async def updateInitialThumbnail(self, appId: str, m: MediaData):
+        try:
+            m = await asyncio.wait_for(self.media.grabThumbnail(appId, m), SESSION_FETCH_TIMEOUT)
+        except asyncio.TimeoutError:
+            log.debug(f"Initial thumbnail timed out for {appId}")
+            return
+        self.media.store.setMedia(appId, m)
+
+    def refresh(self, appId: str, fields):
+        if PLAYBACK in fields:
+            tracer.stage("playback", appId, "signal")
+        self.list_view.refresh(appId, fields)
+        if PLAYBACK in fields:
+            tracer.stage("playback", appId, "widget")
+        if MEDIA in fields:
+            tracer.stage("props", appId, "widget")
 
     async def updateMediaInfo(self, appId: str):
-        props = await self.media.grabMediaProperties(appId)
+        tracer.stage("props", appId, "signal")
+        props = await self.media.grabMediaProperties(appId, withThumbnail=False)
+        tracer.stage("props", appId, "grab")
+        state = self.media.store.get(appId)
+        shown = state.media if state else None
+        if props and not props.thumbnail and shown and shown.thumbnail and (shown.title, shown.artist) == (props.title, props.artist):
+            # same track as on screen, its artwork has not changed
+            props = replace(props, thumbnail=shown.thumbnail, thumbnail_hash=shown.thumbnail_hash)
+        elif props:
+            props = await self.media.grabThumbnail(appId, props)
+            tracer.stage("props", appId, "thumbnail")
         log.debug(f"Updating media info {props.app if props is not None else None}")
         if not props:
             return
-        self.list_view.updateMediaInfo(appId, props)
+        self.media.store.setMedia(appId, props)
 
     def quit(self):
         if self.app:
@@ -179,16 +372,20 @@ class MainWindow(QMainWindow):
 
     def aboutToQuit(self):
         self.media.releaseAll()
+        artworkCache.shutdown()
 
 
 appTray = None
 async def amain(app: QApplication):
+    profiling.mark("qtasyncio.run")
     await core.setupQLoop()
     global appTray
     appTray = AppTray(app)
 
 def main():
+    profiling.mark("main")
     app = QApplication(sys.argv)
+    profiling.mark("qapplication")
     app.setQuitOnLastWindowClosed(False)
     QtAsyncio.run(amain(app), handle_sigint=True)
 
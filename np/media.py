@@ -1,172 +1,448 @@
-from dataclasses import dataclass
+import asyncio
+import time
+from dataclasses import dataclass, replace
+from enum import IntEnum, IntFlag
 from typing import List
 
 from PySide6.QtCore import QObject, Signal
-from winrt.windows.foundation import EventRegistrationToken
-from winrt.windows.media.control import (
-    GlobalSystemMediaTransportControlsSession as MediaSession,
-)
-from winrt.windows.media.control import (
-    GlobalSystemMediaTransportControlsSessionManager as MediaSessionManager,
-)
-from winrt.windows.media.control import (
-    GlobalSystemMediaTransportControlsSessionMediaProperties as MediaProperties,
-)
-from winrt.windows.media.control import (
-    MediaPropertiesChangedEventArgs,
-    SessionsChangedEventArgs,
-    PlaybackInfoChangedEventArgs,
-)
-
-from winrt.windows.storage.streams import IRandomAccessStreamReference, DataReader
 
+from np import ARTWORK_MAX_BYTES, MEDIA_BACKEND, profiling
+from np.artwork import downscaleArtwork
+from np.backends import ArtworkTooLarge, BackendSession, MediaBackend, ThumbnailSource, appOf, createBackend
+from np.cache import ThumbnailCache
+from np.commands import TOGGLE, CommandQueue
+from np.store import Store
+from np.tracing import tracer
 from np.utils import log
 
+# seconds to wait for a burst of property events to settle before refreshing
+PROPS_COALESCE_WINDOW = 0.15
+# upper bound on how long a continuous burst can delay a refresh
+PROPS_COALESCE_MAX_DELAY = 1.0
+# seconds an optimistic play/pause state is shown without the player confirming it
+OPTIMISTIC_TIMEOUT = 2.0
+# artwork above this size is downscaled on a worker thread before it is kept
+ARTWORK_DOWNSCALE_BYTES = 256 * 1024
 
-@dataclass
+
+class PlaybackStatus(IntEnum):
+    """same values as GlobalSystemMediaTransportControlsSessionPlaybackStatus"""
+    CLOSED = 0
+    OPENED = 1
+    CHANGING = 2
+    STOPPED = 3
+    PLAYING = 4
+    PAUSED = 5
+
+
+class Controls(IntFlag):
+    """the transport buttons a session currently accepts"""
+    PLAY_PAUSE = 1
+    NEXT = 2
+    PREVIOUS = 4
+
+
+@dataclass(slots=True, frozen=True)
 class MediaData:
     app: str
     title: str
     artist: str
-    thumbnail: bytes
+    thumbnail: bytes | bytearray
+    thumbnail_hash: str = ""
+    generation: int = 0
+
+@dataclass
+class ArtworkStats:
+    reads: int = 0
+    # larger than artworkMaxBytes, not read
+    clipped: int = 0
+    downscaled: int = 0
+    failed: int = 0
+    bytesRead: int = 0
+    bytesKept: int = 0
 
 @dataclass
 class SessionsData:
     added: List[str]
     removed: List[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlaybackData:
     app: str
-    playback_status: str
-    is_play_pause_toggle_enabled: bool
-    is_next_enabled: bool
-    is_previous_enabled: bool
+    playback_status: PlaybackStatus
+    controls: Controls
+    playback_rate: float = 1.0
+
+    @classmethod
+    def reuse(
+        cls, current: "PlaybackData | None", app: str, status: PlaybackStatus, controls: Controls, rate: float = 1.0
+    ) -> "PlaybackData":
+        """current if it already holds these values, so repeated events allocate no record"""
+        if (
+            current is not None
+            and current.playback_status == status
+            and current.controls == controls
+            and current.playback_rate == rate
+            and current.app == app
+        ):
+            return current
+        return cls(app, status, controls, rate)
+
+    @property
+    def playing(self) -> bool:
+        return self.playback_status == PlaybackStatus.PLAYING
+
+@dataclass(slots=True, frozen=True)
+class TimelineData:
+    app: str
+    # seconds
+    position: float
+    duration: float
+    # time.monotonic() at which position was valid
+    updated: float
+
+    @classmethod
+    def sampled(cls, app: str, position: float, duration: float, age: float = 0.0) -> "TimelineData":
+        """snapshot of a position that was valid age seconds ago"""
+        return cls(app=app, position=position, duration=duration, updated=time.monotonic() - age)
+
+    def positionAt(self, now: float, playing: bool, rate: float = 1.0) -> float:
+        """position interpolated from the snapshot, clamped to the track"""
+        if not playing:
+            return self.position
+        return max(0.0, min(self.duration, self.position + (now - self.updated) * rate))
 
 
 class Media(QObject):
     onUpdateMediaSessions = Signal(SessionsData)
-    onMediaPropsRefresh = Signal(MediaData)
-    onPlaybackInfoRefresh = Signal(PlaybackData)
+    onMediaPropsRefresh = Signal(str)
+    # session key, seconds from a play/pause click until the player confirmed it
+    onCommandRoundTrip = Signal(str, float)
 
-    def __init__(self):
+    def __init__(self, backend: MediaBackend | None = None):
         super().__init__()
-        self.eTokenForMediaData: dict[str, EventRegistrationToken] = {}
-        self.mediaSessions: dict[str, MediaSession] = {}
-        self.playbackInfo: dict[str, PlaybackData] = {}
-        self.eTokenForPlaybackData: dict[str, EventRegistrationToken] = {}
+        self.backend = backend or createBackend(MEDIA_BACKEND)
+        self.mediaSessions: dict[str, BackendSession] = {}
+        # playback and timeline are written here as they arrive, media once fetched by the window
+        self.store = Store(self)
+        self.thumbnailCache = ThumbnailCache()
+        self.artworkMaxBytes = ARTWORK_MAX_BYTES
+        self.artworkStats = ArtworkStats()
+        self.commands = CommandQueue(self._runCommand)
+        # session key -> (status shown ahead of the player, click time, rollback timer,
+        # what the player last reported, which the store only gets once confirmed)
+        self._optimistic: dict[str, tuple[PlaybackStatus, float, asyncio.TimerHandle, PlaybackData]] = {}
+        self.optimisticRollbacks = 0
+
+        self.coalesceWindow = PROPS_COALESCE_WINDOW
+        # per-app or per-session overrides of coalesceWindow, 0 disables coalescing
+        self.coalesceWindows: dict[str, float] = {}
+        self.coalescedEvents = 0
+        self._pendingPropsRefresh: dict[str, asyncio.TimerHandle] = {}
+        self._propsBurstStart: dict[str, float] = {}
+
+        # bumped on every (coalesced) property change, fetches carry the value they started with
+        self.propsGeneration: dict[str, int] = {}
+        self._propsInFlight: dict[str, tuple[int, asyncio.Future]] = {}
+        self._thumbnailsInFlight: dict[str, tuple[int, asyncio.Future]] = {}
+        # artwork not yet read, with the generation of the fetch that saw it
+        self._thumbnailRefs: dict[str, tuple[int, ThumbnailSource]] = {}
     
     async def start(self):
         log.debug("STARTING Media")
 
-        self.sessionManager: MediaSessionManager = await MediaSessionManager.request_async()
-        self.EtokenForSessionManager: EventRegistrationToken = self.sessionManager.add_sessions_changed(self.sessionsChangeHandler)
-        self.sessionsChangeHandler(self.sessionManager, None)
+        self.loop = asyncio.get_event_loop()
+
+        await self.backend.start(self.sessionsChangeHandler)
+        profiling.mark("media.request_async")
+        self._reconcileSessions()
         
         log.debug("STARTED Media")
 
-    async def read_stream_reference_to_bytes(self, stream_ref: IRandomAccessStreamReference) -> bytes:
-        stream = await stream_ref.open_read_async()
+    async def grabMediaProperties(self, appId: str, withThumbnail: bool = True) -> MediaData | None:
+        """
+        Single-flight: concurrent callers for the same app and generation share one fetch.
+        A fetch for an older generation is cancelled and its callers get None.
+        With withThumbnail=False, artwork is only included when it is already cached.
+        """
+        gen = self.propsGeneration.get(appId, 0)
+        task = self._singleFlight(self._propsInFlight, appId, gen, lambda: self._fetchMediaProperties(appId, gen))
+        m = await self._shared(task)
+        if m is None or not withThumbnail:
+            return m
+        return await self.grabThumbnail(appId, m)
+
+    async def grabThumbnail(self, appId: str, m: MediaData) -> MediaData:
+        """Returns m with its artwork loaded, or m itself if it has none or is outdated"""
+        ref = self._thumbnailRefs.get(appId)
+        if m.thumbnail or ref is None or ref[0] != m.generation:
+            return m
+        task = self._singleFlight(self._thumbnailsInFlight, appId, m.generation, lambda: self._fetchThumbnail(ref[1], m))
+        loaded = await self._shared(task)
+        return loaded if loaded is not None else m
 
-        reader = DataReader(stream)
-        size = stream.size
+    def _singleFlight(self, flights: dict[str, tuple[int, asyncio.Future]], appId: str, gen: int, fetch) -> asyncio.Future:
+        flight = flights.get(appId)
+        if flight is not None and flight[0] == gen:
+            return flight[1]
+        if flight is not None:
+            flight[1].cancel()
+        task = asyncio.ensure_future(fetch())
+        flights[appId] = (gen, task)
 
-        await reader.load_async(size)
+        def done(t: asyncio.Future):
+            current = flights.get(appId)
+            if current is not None and current[1] is t:
+                flights.pop(appId)
 
-        buffer = reader.read_buffer(size)
-        data = bytes(buffer)
+        task.add_done_callback(done)
+        return task
 
-        reader.close()
-        stream.close()
-        return data
+    async def _shared(self, task: asyncio.Future):
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return None
+            raise
 
-    async def grabMediaProperties(self, appId: str):
-        s = self.mediaSessions[appId]
-        props = await s.try_get_media_properties_async()
+    async def _fetchMediaProperties(self, appId: str, gen: int) -> MediaData | None:
+        s = self.mediaSessions.get(appId)
+        if s is None:
+            # released after the refresh was scheduled
+            return None
+        try:
+            props = await s.mediaProperties()
+        except OSError as e:
+            log.debug(f"Fetching media properties failed for {appId}: {e}")
+            return None
         if props:
-            thumbnail = b""
+            thumbnail, thumbnail_hash = b"", ""
             if props.thumbnail:
-                thumbnail = await self.read_stream_reference_to_bytes(props.thumbnail)
+                cached = self.thumbnailCache.get(appId, props.title, props.artist)
+                if cached is None:
+                    self._thumbnailRefs[appId] = (gen, props.thumbnail)
+                else:
+                    thumbnail_hash, thumbnail = cached
             m = MediaData(
-                app=s.source_app_user_model_id,
+                app=s.key,
                 title=props.title,
                 artist=props.artist,
                 thumbnail=thumbnail,
+                thumbnail_hash=thumbnail_hash,
+                generation=gen,
             )
             return m
 
-    async def prev(self, appId: str):
-        s = self.mediaSessions[appId]
-        await s.try_skip_previous_async()
+    async def _fetchThumbnail(self, source: ThumbnailSource, m: MediaData) -> MediaData:
+        stats = self.artworkStats
+        try:
+            data = await source.read(self.artworkMaxBytes)
+        except ArtworkTooLarge as e:
+            stats.clipped += 1
+            log.debug(f"Skipping thumbnail for {m.app}: {e}")
+            return m
+        except OSError as e:
+            stats.failed += 1
+            log.debug(f"Reading thumbnail failed for {m.app}: {e}")
+            return m
+        stats.reads += 1
+        stats.bytesRead += len(data)
+        if len(data) > ARTWORK_DOWNSCALE_BYTES:
+            # keep only the display sized copy, the original goes out of scope here
+            small = await self.loop.run_in_executor(None, downscaleArtwork, data)
+            if small is not None:
+                stats.downscaled += 1
+                data = small
+        stats.bytesKept += len(data)
+        thumbnail_hash, thumbnail = self.thumbnailCache.put(m.app, m.title, m.artist, data)
+        return replace(m, thumbnail=thumbnail, thumbnail_hash=thumbnail_hash)
+
+    def prev(self, appId: str):
+        self.commands.skip(appId, -1)
+
+    def pausePlay(self, appId: str):
+        self.commands.toggle(appId)
+        self._expectToggle(appId)
+
+    def next(self, appId: str):
+        self.commands.skip(appId, 1)
+
+    def _expectToggle(self, appId: str):
+        """show the state a toggle leads to right away, until the player confirms it"""
+        pending = self._optimistic.pop(appId, None)
+        if pending is not None:
+            pending[2].cancel()
+            p, shown = pending[3], pending[0]
+        else:
+            state = self.store.get(appId)
+            if state is None or state.playback is None:
+                return
+            p = state.playback
+            shown = p.playback_status
+        expected = PlaybackStatus.PAUSED if shown == PlaybackStatus.PLAYING else PlaybackStatus.PLAYING
+        if expected == p.playback_status:
+            # a second click undid the first before the player answered
+            self.store.setPlayback(appId, p)
+            return
+        rollback = self.loop.call_later(OPTIMISTIC_TIMEOUT, self._rollback, appId)
+        self._optimistic[appId] = (expected, time.perf_counter(), rollback, p)
+        self.store.setPlayback(appId, replace(p, playback_status=expected))
 
-    async def pausePlay(self, appId: str):
-        s = self.mediaSessions[appId]
-        await s.try_toggle_play_pause_async()
+    def _reconcile(self, p: PlaybackData):
+        pending = self._optimistic.get(p.app)
+        if pending is None:
+            self.store.setPlayback(p.app, p)
+            return
+        expected, clicked, rollback, reported = pending
+        if p.playback_status != expected:
+            if p is reported:
+                return
+            # the player has not caught up yet, keep showing where it is going
+            self._optimistic[p.app] = (expected, clicked, rollback, p)
+            self.store.setPlayback(p.app, replace(p, playback_status=expected))
+            return
+        rollback.cancel()
+        self._optimistic.pop(p.app)
+        rtt = time.perf_counter() - clicked
+        tracer.record("command.rtt", rtt * 1e6)
+        self.store.setPlayback(p.app, p)
+        self.onCommandRoundTrip.emit(p.app, rtt)
 
-    async def next(self, appId: str):
-        s = self.mediaSessions[appId]
-        await s.try_skip_next_async()
+    def _rollback(self, appId: str):
+        pending = self._optimistic.pop(appId, None)
+        if pending is None:
+            return
+        log.debug(f"{appId} did not confirm play/pause within {OPTIMISTIC_TIMEOUT}s")
+        self.optimisticRollbacks += 1
+        self.store.setPlayback(appId, pending[3])
 
-    def mediaPropsChangeHandler(self, s: MediaSession, args: MediaPropertiesChangedEventArgs | None):
+    async def _runCommand(self, appId: str, kind: str, direction: int):
+        s = self.mediaSessions.get(appId)
+        if s is None:
+            return
+        if kind == TOGGLE:
+            await s.togglePlayPause()
+        elif direction > 0:
+            await s.skipNext()
+        else:
+            await s.skipPrevious()
+
+    def mediaPropsChangeHandler(self, s: BackendSession):
         log.debug(":::::ON Media Properties Change:::::")
-        self.onMediaPropsRefresh.emit(s.source_app_user_model_id)
+        tracer.begin("props", s.key)
+        self.loop.call_soon_threadsafe(self._schedulePropsRefresh, s.key)
+
+    def _schedulePropsRefresh(self, appId: str):
+        """trailing edge, latest wins: every event restarts the app's window"""
+        now = time.monotonic()
+        pending = self._pendingPropsRefresh.pop(appId, None)
+        if pending is not None:
+            pending.cancel()
+            self.coalescedEvents += 1
+        start = self._propsBurstStart.setdefault(appId, now)
+
+        window = self.coalesceWindows.get(appId, self.coalesceWindows.get(appOf(appId), self.coalesceWindow))
+        delay = min(window, start + PROPS_COALESCE_MAX_DELAY - now)
+        if delay <= 0:
+            self._flushPropsRefresh(appId)
+            return
+        self._pendingPropsRefresh[appId] = self.loop.call_later(delay, self._flushPropsRefresh, appId)
+
+    def _flushPropsRefresh(self, appId: str):
+        self._pendingPropsRefresh.pop(appId, None)
+        self._propsBurstStart.pop(appId, None)
+        if appId in self.mediaSessions:
+            tracer.stage("props", appId, "coalesce")
+            self.propsGeneration[appId] = self.propsGeneration.get(appId, 0) + 1
+            self.onMediaPropsRefresh.emit(appId)
     
-    def playbackInfoChangeHandler(self, s: MediaSession, args: PlaybackInfoChangedEventArgs | None):
+    def playbackInfoChangeHandler(self, s: BackendSession):
         log.debug(":::::ON Playback Info Change:::::")
-        info = s.get_playback_info()
-        p = PlaybackData(
-            app=s.source_app_user_model_id,
-            playback_status=info.playback_status.name,
-            is_play_pause_toggle_enabled=info.controls.is_play_pause_toggle_enabled,
-            is_next_enabled=info.controls.is_next_enabled,
-            is_previous_enabled=info.controls.is_previous_enabled,
-        )
-        self.playbackInfo[s.source_app_user_model_id] = p
-        self.onPlaybackInfoRefresh.emit(p)
-
-    def timelinePropsChangeHandler(self, s: MediaSession, args: MediaPropertiesChangedEventArgs | None):
+        tracer.begin("playback", s.key)
+        p = s.playbackInfo()
+        tracer.stage("playback", s.key, "snapshot")
+        # the store and the optimistic state are only touched on the loop
+        self.loop.call_soon_threadsafe(self._applyPlayback, s, p)
+
+    def _applyPlayback(self, s: BackendSession, p: PlaybackData):
+        state = self.store.get(s.key)
+        if state is None or state.playback is p:
+            # released meanwhile, or the same record as last time and nothing changed
+            return
+        if s.key in self._optimistic:
+            self._reconcile(p)
+        else:
+            self.store.setPlayback(s.key, p)
+        # interpolation restarts from the position the player reports at the state change
+        self.store.setTimeline(s.key, s.timeline())
+
+    def timelinePropsChangeHandler(self, s: BackendSession):
         log.debug(":::::ON Timeline Properties Change:::::")
+        self.loop.call_soon_threadsafe(self.store.setTimeline, s.key, s.timeline())
 
-    def sessionsChangeHandler(self, sm: MediaSessionManager, args: SessionsChangedEventArgs | None):
-        
+    def sessionsChangeHandler(self):
         log.debug(":::::ON Sessions Change:::::")
+        # called on the backend's thread, sessions are added and released on the loop only
+        self.loop.call_soon_threadsafe(self._reconcileSessions)
+
+    def _reconcileSessions(self):
+        tracer.begin("sessions", "*")
+        sessionsDict = {session.key: session for session in self.backend.sessions()}
+        tracer.stage("sessions", "*", "enumerate")
+        # set differences of the key views, only changed sessions are touched below
+        removed = list(self.mediaSessions.keys() - sessionsDict.keys())
+        added = list(sessionsDict.keys() - self.mediaSessions.keys())
+        if len(added) > 1:
+            # new sessions show up in the order the backend lists them
+            position = {k: i for i, k in enumerate(sessionsDict)}
+            added.sort(key=position.__getitem__)
+        for k in removed:
         
-        sessions = sm.get_sessions()
-        sessionsDict = dict((session.source_app_user_model_id, session) for session in sessions)
-        currentSessions = [k for k, _ in self.eTokenForMediaData.items()]
-        added, removed = [], []
-        for k in currentSessions: 
-            if k not in sessionsDict:
-        
-                log.debug(f"Session removed - {k}")
+            log.debug(f"Session removed - {k}")
         
-                self.releaseSession(self.mediaSessions[k])
-                removed.append(k)
-        for k, v in sessionsDict.items():
-            if k not in self.eTokenForMediaData.keys():
+            self.releaseSession(self.mediaSessions[k])
+        for k in added:
+            v = sessionsDict[k]
         
-                log.debug(f"Session added - {k}")
+            log.debug(f"Session added - {k}")
         
-                self.mediaSessions[k] = v
-                self.mediaPropsChangeHandler(v, None)
-                self.playbackInfoChangeHandler(v, None)
-                self.eTokenForMediaData[k] = v.add_media_properties_changed(self.mediaPropsChangeHandler)
-                self.eTokenForPlaybackData[k] = v.add_playback_info_changed(self.playbackInfoChangeHandler)
-                added.append(k)
+            self.mediaSessions[k] = v
+            self.store.add(k)
+            self.mediaPropsChangeHandler(v)
+            # already on the loop, the session shows its state as soon as it is listed
+            self._applyPlayback(v, v.playbackInfo())
+            v.subscribe(self.mediaPropsChangeHandler, self.playbackInfoChangeHandler, self.timelinePropsChangeHandler)
+        tracer.stage("sessions", "*", "reconcile")
         
+        profiling.mark("media.first_sessions")
         self.onUpdateMediaSessions.emit(SessionsData(added=added, removed=removed))
 
     def releaseAll(self):
-        self.sessionManager.remove_sessions_changed(self.EtokenForSessionManager)
+        self.backend.stop()
         sessions = [v for _, v in self.mediaSessions.items()]
         for s in sessions:
             self.releaseSession(s)
 
-    def releaseSession(self, session: MediaSession):
-        id = session.source_app_user_model_id
-        self.mediaSessions[id].remove_playback_info_changed(self.eTokenForPlaybackData[id])
-        self.mediaSessions[id].remove_media_properties_changed(self.eTokenForMediaData[id])
-        self.eTokenForMediaData.pop(id)
+    def releaseSession(self, session: BackendSession):
+        id = session.key
+        session.unsubscribe()
         self.mediaSessions.pop(id)
-        self.playbackInfo.pop(id)
+        self.store.remove(id)
+        self.thumbnailCache.forget(id)
+        tracer.forget(id)
+        pending = self._pendingPropsRefresh.pop(id, None)
+        if pending is not None:
+            pending.cancel()
+        self._propsBurstStart.pop(id, None)
+        self.propsGeneration.pop(id, None)
+        self._thumbnailRefs.pop(id, None)
+        self.commands.forget(id)
+        optimistic = self._optimistic.pop(id, None)
+        if optimistic is not None:
+            optimistic[2].cancel()
+        for flights in (self._propsInFlight, self._thumbnailsInFlight):
+            flight = flights.pop(id, None)
+            if flight is not None:
+                flight[1].cancel()
 
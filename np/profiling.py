@@ -0,0 +1,105 @@
+"""
+Startup profiling, enabled with `np --profile-startup` or PROFILE_STARTUP=1.
+
+Records monotonic timestamps for named startup phases and the time spent
+importing each module, then prints and saves a breakdown once the first
+session list has been published.
+"""
+import json
+import pathlib
+import sys
+import time
+
+T0 = time.perf_counter()
+
+enabled = False
+marks: dict[str, float] = {}
+# module -> [inclusive seconds, self seconds]
+imports: dict[str, list[float]] = {}
+_reported = False
+# the meta path finder installed by enable()
+_timer = None
+
+
+def enable():
+    """Start timing imports, the finder is only defined here to keep importing this module cheap"""
+    global enabled, _timer
+    if enabled:
+        return
+    enabled = True
+    # inclusive seconds of the children of each module being imported
+    stack: list[float] = []
+
+    class TimedLoader:
+        def __init__(self, name: str, loader):
+            self._name = name
+            self._loader = loader
+
+        def __getattr__(self, attr):
+            return getattr(self._loader, attr)
+
+        def create_module(self, spec):
+            return self._loader.create_module(spec)
+
+        def exec_module(self, module):
+            stack.append(0.0)
+            t = time.perf_counter()
+            try:
+                self._loader.exec_module(module)
+            finally:
+                total = time.perf_counter() - t
+                children = stack.pop()
+                if stack:
+                    stack[-1] += total
+                imports[self._name] = [total, total - children]
+
+    class ImportTimer:
+        def find_spec(self, fullname, path, target=None):
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is None:
+                    continue
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = TimedLoader(fullname, spec.loader)
+                return spec
+            return None
+
+    _timer = ImportTimer()
+    sys.meta_path.insert(0, _timer)
+
+
+def mark(phase: str):
+    """Record the first time a phase is reached, no-op unless profiling is enabled"""
+    if enabled and phase not in marks:
+        marks[phase] = time.perf_counter() - T0
+
+
+def report(path: pathlib.Path | None = None, top: int = 15) -> dict | None:
+    global _reported
+    if not enabled or _reported:
+        return None
+    _reported = True
+    sys.meta_path[:] = [f for f in sys.meta_path if f is not _timer]
+
+    phases = sorted(marks.items(), key=lambda kv: kv[1])
+    slowest = sorted(imports.items(), key=lambda kv: kv[1][1], reverse=True)[:top]
+    result = {
+        "phases": [{"phase": k, "at_ms": v * 1000} for k, v in phases],
+        "imports": [{"module": k, "inclusive_ms": v[0] * 1000, "self_ms": v[1] * 1000} for k, v in slowest],
+    }
+
+    lines = ["Startup profile", f"{'phase':<32}{'at ms':>10}{'delta ms':>10}"]
+    prev = 0.0
+    for k, v in phases:
+        lines.append(f"{k:<32}{v * 1000:>10.1f}{(v - prev) * 1000:>10.1f}")
+        prev = v
+    lines.append(f"{'module':<48}{'self ms':>10}{'incl ms':>10}")
+    for k, v in slowest:
+        lines.append(f"{k:<48}{v[1] * 1000:>10.1f}{v[0] * 1000:>10.1f}")
+    print("\n".join(lines), file=sys.stderr)
+
+    if path is not None:
+        path.write_text(json.dumps(result, indent=2))
+    return result
@@ -0,0 +1,132 @@
+"""
+Session state shared by Media, the tray and the list.
+
+Every session is one frozen SessionState. A write replaces that record
+and bumps the store version; records nobody wrote to are shared between
+versions, and so are the MediaData records with their artwork bytes.
+Readers look records up with get() and subscribe to `changed` for one
+StoreDiff per write.
+"""
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QObject, Signal
+
+if TYPE_CHECKING:
+    from np.media import MediaData, PlaybackData, TimelineData
+
+MEDIA = "media"
+PLAYBACK = "playback"
+TIMELINE = "timeline"
+# StoreDiff.fields of single-field writes, shared instead of built per write
+_CHANGED = {name: frozenset((name,)) for name in (MEDIA, PLAYBACK, TIMELINE)}
+
+
+def mergeMediaData(current: "MediaData | None", m: "MediaData") -> "MediaData | None":
+    """
+    What should be stored after receiving m, or None to ignore it.
+    Older generations are dropped and a text-only update keeps the artwork
+    already loaded for the same generation.
+    """
+    if current is None:
+        return m
+    if current.generation > m.generation:
+        return None
+    if current.generation == m.generation and current.thumbnail and not m.thumbnail:
+        return replace(m, thumbnail=current.thumbnail, thumbnail_hash=current.thumbnail_hash)
+    return m
+
+
+@dataclass(slots=True, frozen=True)
+class SessionState:
+    key: str
+    media: "MediaData | None" = None
+    playback: "PlaybackData | None" = None
+    timeline: "TimelineData | None" = None
+
+
+@dataclass(slots=True, frozen=True)
+class StoreDiff:
+    version: int
+    key: str
+    # None for a session that was just added
+    old: SessionState | None
+    # None for a session that was just removed
+    new: SessionState | None
+    fields: frozenset[str] = field(default_factory=frozenset)
+
+
+class Store(QObject):
+    # StoreDiff, written and emitted on the event loop only, Media hands backend events over to it
+    changed = Signal(object)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self.version = 0
+        # sessions whose playback status is PLAYING, kept up to date on every write
+        self.playing = 0
+        self._sessions: dict[str, SessionState] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._sessions
+
+    def get(self, key: str) -> SessionState | None:
+        return self._sessions.get(key)
+
+    def add(self, key: str):
+        if key in self._sessions:
+            return
+        state = SessionState(key)
+        self._sessions[key] = state
+        self._commit(key, None, state, frozenset())
+
+    def remove(self, key: str):
+        old = self._sessions.pop(key, None)
+        if old is None:
+            return
+        self._count(old, None)
+        self._commit(key, old, None, frozenset())
+
+    # writes of the record already stored are dropped, backends hand out the
+    # same PlaybackData again for an event that changed nothing
+
+    def setPlayback(self, key: str, p: "PlaybackData"):
+        old = self._sessions.get(key)
+        if old is None or old.playback is p:
+            return
+        new = SessionState(key, old.media, p, old.timeline)
+        self._sessions[key] = new
+        self._count(old, new)
+        self._commit(key, old, new, _CHANGED[PLAYBACK])
+
+    def setTimeline(self, key: str, t: "TimelineData"):
+        old = self._sessions.get(key)
+        if old is None or old.timeline is t:
+            return
+        new = SessionState(key, old.media, old.playback, t)
+        self._sessions[key] = new
+        self._commit(key, old, new, _CHANGED[TIMELINE])
+
+    def setMedia(self, key: str, m: "MediaData"):
+        """merged with what is stored, see mergeMediaData"""
+        old = self._sessions.get(key)
+        if old is None:
+            return
+        merged = mergeMediaData(old.media, m)
+        if merged is None or merged is old.media:
+            return
+        new = SessionState(key, merged, old.playback, old.timeline)
+        self._sessions[key] = new
+        self._commit(key, old, new, _CHANGED[MEDIA])
+
+    def _count(self, old: SessionState | None, new: SessionState | None):
+        was = old is not None and old.playback is not None and old.playback.playing
+        now = new is not None and new.playback is not None and new.playback.playing
+        self.playing += now - was
+
+    def _commit(self, key: str, old: SessionState | None, new: SessionState | None, fields: frozenset[str]):
+        self.version += 1
+        self.changed.emit(StoreDiff(self.version, key, old, new, fields))
@@ -0,0 +1,126 @@
+"""
+Latency tracing for media events.
+
+Each backend callback starts a trace for (kind, key). Later stages stamp the
+same trace and the time since the previous stamp goes into a per-stage
+histogram, the time since the callback into a "total" histogram.
+A newer event for the same key replaces an unfinished trace.
+"""
+import json
+import pathlib
+import time
+
+# bucket i holds samples below 2**i microseconds
+BUCKETS = 24
+
+
+class Histogram:
+    def __init__(self):
+        self.buckets = [0] * BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, us: float):
+        self.buckets[min(BUCKETS - 1, max(0, int(us)).bit_length())] += 1
+        self.count += 1
+        self.total += us
+        self.min = min(self.min, us)
+        self.max = max(self.max, us)
+
+    def percentile(self, q: float) -> float:
+        """upper bound of the bucket holding the q-th percentile"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return min(float(2**i), self.max)
+        return self.max
+
+    def toDict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_us": self.total / self.count if self.count else 0.0,
+            "min_us": self.min if self.count else 0.0,
+            "p50_us": self.percentile(0.5),
+            "p95_us": self.percentile(0.95),
+            "p99_us": self.percentile(0.99),
+            "max_us": self.max,
+            "buckets": self.buckets,
+        }
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = True
+        # (kind, key) -> [start, last stamp] in perf_counter_ns
+        self._open: dict[tuple[str, str], list[int]] = {}
+        self.histograms: dict[str, Histogram] = {}
+
+    def begin(self, kind: str, key: str):
+        if self.enabled:
+            now = time.perf_counter_ns()
+            self._open[(kind, key)] = [now, now]
+
+    def stage(self, kind: str, key: str, stage: str):
+        if not self.enabled:
+            return
+        trace = self._open.get((kind, key))
+        if trace is None:
+            return
+        now = time.perf_counter_ns()
+        self._record(f"{kind}.{stage}", (now - trace[1]) / 1000)
+        trace[1] = now
+
+    def end(self, kind: str, key: str, stage: str):
+        """stamp the last stage and record the whole trace"""
+        if not self.enabled:
+            return
+        trace = self._open.pop((kind, key), None)
+        if trace is None:
+            return
+        now = time.perf_counter_ns()
+        self._record(f"{kind}.{stage}", (now - trace[1]) / 1000)
+        self._record(f"{kind}.total", (now - trace[0]) / 1000)
+
+    def forget(self, key: str):
+        """drop the unfinished traces of a session that is gone"""
+        # a copy, backend threads begin traces while this runs
+        for trace in [t for t in list(self._open) if t[1] == key]:
+            self._open.pop(trace, None)
+
+    def record(self, name: str, us: float):
+        """a sample measured outside of a trace"""
+        if self.enabled:
+            self._record(name, us)
+
+    def _record(self, name: str, us: float):
+        h = self.histograms.get(name)
+        if h is None:
+            h = self.histograms[name] = Histogram()
+        h.record(us)
+
+    def reset(self):
+        self._open.clear()
+        self.histograms.clear()
+
+    def toDict(self) -> dict:
+        return {name: h.toDict() for name, h in sorted(self.histograms.items())}
+
+    def dump(self, path: pathlib.Path):
+        path.write_text(json.dumps(self.toDict(), indent=2))
+
+    def summary(self) -> str:
+        lines = [f"{'stage':<28}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+        for name, h in sorted(self.histograms.items()):
+            lines.append(
+                f"{name:<28}{h.count:>8}{h.percentile(0.5) / 1000:>10.2f}{h.percentile(0.95) / 1000:>10.2f}{h.max / 1000:>10.2f}"
+            )
+        return "\n".join(lines)
+
+
+tracer = Tracer()
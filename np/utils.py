@@ -1,9 +1,10 @@
-from np import DEV
+from np import DEV, profiling
 import logging
 
 from PySide6.QtCore import QSettings
 
 settings = QSettings()
+profiling.mark("np.utils.settings")
 def _setupLogger(name, log_file = None, level=logging.ERROR):
     if DEV:
         level = logging.DEBUG
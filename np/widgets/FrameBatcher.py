@@ -0,0 +1,39 @@
+from typing import Callable
+
+from PySide6.QtCore import QObject, QTimer
+
+# one display frame at 60 Hz
+FRAME_INTERVAL_MS = 16
+
+
+class FrameBatcher(QObject):
+    """
+    Dirty fields per session, flushed at most once per frame.
+    The first mark after a flush starts the frame, everything marked
+    until it ends is handed to flush(dirty) together.
+    """
+
+    def __init__(self, flush: Callable[[dict[str, set]], None], parent: QObject | None = None, interval: int = FRAME_INTERVAL_MS):
+        super().__init__(parent)
+        self.flush = flush
+        self.dirty: dict[str, set] = {}
+        self.flushes = 0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.flushNow)
+
+    def mark(self, appId: str, field):
+        self.dirty.setdefault(appId, set()).add(field)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def discard(self, appId: str):
+        self.dirty.pop(appId, None)
+
+    def flushNow(self):
+        self.timer.stop()
+        dirty, self.dirty = self.dirty, {}
+        if dirty:
+            self.flushes += 1
+            self.flush(dirty)
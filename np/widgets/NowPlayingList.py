@@ -1,7 +1,7 @@
 import sys
-from typing import List
+import time
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QRect, Signal
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
@@ -10,8 +10,16 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from np.media import MediaData, PlaybackData
-from np.widgets.NowPlayingListItem import NowPlayingListItem
+from np.media import MediaData
+from np.store import MEDIA, PLAYBACK, TIMELINE, Store
+from np.tracing import tracer
+from np.widgets.FrameBatcher import FrameBatcher
+from np.widgets.NowPlayingListItem import PLACEHOLDER_TITLE, NowPlayingListItem
+from np.widgets.ProgressTicker import ProgressTicker
+
+# flushes touching this many sessions suspend painting while they run,
+# re-enabling repaints the whole view so it is not worth it for a few items
+BULK_FLUSH = 64
 
 
 class NowPlayingList(QScrollArea):
@@ -19,25 +27,40 @@ class NowPlayingList(QScrollArea):
     onPausePlay = Signal(str)
     onNext = Signal(str)
 
-    def __init__(self):
+    def __init__(self, store: Store | None = None):
         super().__init__()
         self.setWidgetResizable(True)
+        # what the items show, read when a frame applies the changes refresh() marked
+        self.store = store if store is not None else Store(self)
 
         self.view = QFrame(self)
         self.viewLayout = QVBoxLayout(self.view)
         self.setWidget(self.view)
-        self.viewApps: List[str] = []
-        self.viewWidgets: List[NowPlayingListItem] = []
-        self.playbackInfo: dict[str, PlaybackData] = {}
-        self.mediaInfo: dict[str, MediaData] = {}
+        # appId -> item, in display order (dicts keep insertion order)
+        self.items: dict[str, NowPlayingListItem] = {}
+
+        self.ticker = ProgressTicker(self)
+        self.ticker.tick.connect(self.updateProgress)
+        # appId -> names of the fields changed since the last frame
+        self.batcher = FrameBatcher(self.applyDirty, self)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.ticker.setVisible(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.ticker.setVisible(False)
+
+    def hasApp(self, appId: str) -> bool:
+        return appId in self.items
 
     def removeApp(self, appId: str):
-        idx = self.viewApps.index(appId)
-        self.viewApps.pop(idx)
-        w = self.viewWidgets.pop(idx)
+        w = self.items.pop(appId)
+        w.releaseArtwork()
         self.viewLayout.removeWidget(w)
-        self.mediaInfo.pop(appId)
-        self.playbackInfo.pop(appId)
+        self.ticker.setPlaying(appId, False)
+        self.batcher.discard(appId)
 
         w.deleteLater()
         # self.viewLayout.update()
@@ -46,49 +69,88 @@ class NowPlayingList(QScrollArea):
         # self.viewport().update()
 
     def addApp(self, appId: str):
-        self.viewApps.append(appId)
-
-        title = ""
+        title = PLACEHOLDER_TITLE
         artist = ""
         artwork = b""
-        m = self.mediaInfo.get(appId, None)
+        artwork_hash = ""
+        state = self.store.get(appId)
+        m = state.media if state else None
         if m:
             title = m.title
             artist = m.artist
             artwork = m.thumbnail
-        w = NowPlayingListItem(app_exe=appId, artwork=artwork, title=title, artist=artist)
+            artwork_hash = m.thumbnail_hash
+        w = NowPlayingListItem(app_exe=appId, artwork=artwork, title=title, artist=artist, artwork_hash=artwork_hash)
         w.next_button.clicked.connect(lambda: self.onNext.emit(appId))
         w.prev_button.clicked.connect(lambda: self.onPrev.emit(appId))
         w.play_button.clicked.connect(lambda: self.onPausePlay.emit(appId))
 
-        p = self.playbackInfo.get(appId, None)
-        if p:
-            w.next_button.setEnabled(p.is_next_enabled)
-            w.prev_button.setEnabled(p.is_previous_enabled)
-            w.play_button.setEnabled(p.is_play_pause_toggle_enabled)
-            w.play_button.setIcon(w.iconPlay if p.playback_status == "PAUSED" else w.iconPause)
+        if state and state.playback:
+            w.setPlayback(state.playback)
         
         self.viewLayout.addWidget(w)
-        self.viewWidgets.append(w)
-
-    def updatePlaybackInfo(self, appId: str, p: PlaybackData):
-        self.playbackInfo[appId] = p
-        for i, app in enumerate(self.viewApps):
-            if app == appId:
-                item = self.viewWidgets[i]
-                item.next_button.setEnabled(p.is_next_enabled)
-                item.prev_button.setEnabled(p.is_previous_enabled)
-                item.play_button.setEnabled(p.is_play_pause_toggle_enabled)
-                item.play_button.setIcon(item.iconPlay if p.playback_status == "PAUSED" else item.iconPause)
-
-    def updateMediaInfo(self, appId: str, m: MediaData):
-        self.mediaInfo[appId] = m
-        for i, app in enumerate(self.viewApps):
-            if app == appId:
-                item = self.viewWidgets[i]
-                item.title_label.setText(m.title)
-                item.artist_label.setText(m.artist)
-                item.artwork_label.setPixmap(item.qpixmap_from_bytes(m.thumbnail))
+        self.items[appId] = w
+        self.updateProgress(time.monotonic(), [appId])
+
+    def refresh(self, appId: str, fields):
+        """the store changed these fields of appId, the items catch up at the end of the frame"""
+        for name in fields:
+            self.batcher.mark(appId, name)
+        if PLAYBACK in fields:
+            state = self.store.get(appId)
+            playing = state is not None and state.playback is not None and state.playback.playing
+            self.ticker.setPlaying(appId, playing)
+
+    def setRoundTrip(self, appId: str, seconds: float):
+        item = self.items.get(appId)
+        if item is not None:
+            item.setRoundTrip(seconds)
+
+    def updateProgress(self, now: float, apps=None):
+        for appId in self.ticker.playing if apps is None else apps:
+            item = self.items.get(appId)
+            state = self.store.get(appId)
+            if item is None or state is None or state.timeline is None:
+                continue
+            t, p = state.timeline, state.playback
+            playing = p is not None and p.playing
+            item.setProgress(t.positionAt(now, playing, p.playback_rate if p else 1.0), t.duration)
+
+    def flush(self):
+        """apply pending updates now instead of at the end of the frame"""
+        self.batcher.flushNow()
+
+    def applyDirty(self, dirty: dict[str, set]):
+        """bring the items up to date with everything that changed during the last frame"""
+        bulk = len(dirty) >= BULK_FLUSH
+        if bulk:
+            self.view.setUpdatesEnabled(False)
+        progress = []
+        for appId, fields in dirty.items():
+            item = self.items.get(appId)
+            state = self.store.get(appId)
+            if item is None or state is None:
+                continue
+            if PLAYBACK in fields and state.playback is not None:
+                item.setPlayback(state.playback)
+                tracer.end("playback", appId, "frame")
+            if MEDIA in fields and state.media is not None:
+                item.setMedia(state.media)
+                tracer.end("props", appId, "frame")
+            if TIMELINE in fields or PLAYBACK in fields:
+                progress.append(appId)
+        if progress:
+            self.updateProgress(time.monotonic(), progress)
+        if bulk:
+            self.view.setUpdatesEnabled(True)
+
+    def appsByVisibility(self) -> tuple[list[str], list[str]]:
+        """appIds of the rows currently scrolled into view, and of the rest"""
+        viewport = QRect(0, self.verticalScrollBar().value(), self.viewport().width(), self.viewport().height())
+        visible, hidden = [], []
+        for appId, item in self.items.items():
+            (visible if item.geometry().intersects(viewport) else hidden).append(appId)
+        return visible, hidden
 
 if __name__ == "__main__":
     class _MainWindow(QWidget):
@@ -96,24 +158,15 @@ if __name__ == "__main__":
             super().__init__()
             self.setWindowTitle("Now Playing Example")
             self.list_widget = NowPlayingList()
-            self.list_widget.addApp("app1.exe")
-            self.list_widget.updateMediaInfo(
-                "app1.exe",
-                MediaData(app="app1.exe", title="Long Track Name Example That Should Ellipsize", artist="Artist One", thumbnail=b"")
-            )
-
-            self.list_widget.addApp("app2.exe")
-            self.list_widget.updateMediaInfo(
-                "app2.exe",
-                MediaData(app="app2.exe", title="Long Track Name Example That Should Ellipsize", artist="Artist One", thumbnail=b"")
-            )
-
-
-            self.list_widget.addApp("app3.exe")
-            self.list_widget.updateMediaInfo(
-                "app3.exe",
-                MediaData(app="app3.exe", title="Long Track Name Example That Should Ellipsize", artist="Artist One", thumbnail=b"")
-            )
+            store = self.list_widget.store
+            store.changed.connect(lambda d: self.list_widget.refresh(d.key, d.fields))
+            for appId in ("app1.exe", "app2.exe", "app3.exe"):
+                store.add(appId)
+                self.list_widget.addApp(appId)
+                store.setMedia(
+                    appId,
+                    MediaData(app=appId, title="Long Track Name Example That Should Ellipsize", artist="Artist One", thumbnail=b"")
+                )
             layout = QVBoxLayout(self)
             layout.addWidget(self.list_widget)
             self.setLayout(layout)
@@ -122,4 +175,4 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     w = _MainWindow()
     w.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
@@ -0,0 +1,139 @@
+import time
+
+from PySide6.QtCore import QEvent, QModelIndex, QPersistentModelIndex, QRect, QSize, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QMouseEvent, QPainter, Qt
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton, QStyleOptionViewItem
+
+from np.artwork import ARTWORK_SIZE, artworkCache
+from np.media import Controls, PlaybackStatus
+from np.widgets.NowPlayingListItem import PLACEHOLDER_TITLE, PROGRESS_STEPS, NowPlayingListItem, roundTripText
+from np.widgets.NowPlayingListModel import Roles
+
+MARGIN = 10
+BUTTON_SIZE = 40
+BUTTON_SPACING = 10
+ROW_HEIGHT = ARTWORK_SIZE + 2 * MARGIN
+TEXT_WIDTH = 400
+PROGRESS_HEIGHT = 4
+
+
+class NowPlayingListDelegate(QStyledItemDelegate):
+    """
+    Paints a row the way NowPlayingListItem lays it out, without any child widgets.
+    Clicks on the painted buttons are reported through onButton(appId, name).
+    """
+
+    onButton = Signal(str, str)
+
+    BUTTONS = ("prev", "play", "next")
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QSize:
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def buttonRects(self, rect: QRect) -> dict[str, QRect]:
+        x = rect.left() + MARGIN + ARTWORK_SIZE + 2 * MARGIN
+        y = rect.bottom() - MARGIN - 5 - BUTTON_SIZE
+        rects = {}
+        for name in self.BUTTONS:
+            rects[name] = QRect(x, y, BUTTON_SIZE, BUTTON_SIZE)
+            x += BUTTON_SIZE + BUTTON_SPACING
+        return rects
+
+    def progressRect(self, rect: QRect) -> QRect:
+        buttons = self.buttonRects(rect)["prev"]
+        return QRect(buttons.left(), buttons.top() - MARGIN - PROGRESS_HEIGHT, TEXT_WIDTH, PROGRESS_HEIGHT)
+
+    def buttonsEnabled(self, p) -> dict[str, bool]:
+        return {
+            "prev": Controls.PREVIOUS in p.controls if p else True,
+            "play": Controls.PLAY_PAUSE in p.controls if p else True,
+            "next": Controls.NEXT in p.controls if p else True,
+        }
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex):
+        appId = index.data(Roles.App)
+        m = index.data(Roles.Media)
+        p = index.data(Roles.Playback)
+        rect = option.rect
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+
+        painter.save()
+
+        artRect = QRect(rect.left() + MARGIN, rect.top() + MARGIN, ARTWORK_SIZE, ARTWORK_SIZE)
+        dpr = widget.devicePixelRatioF() if widget else 1.0
+        pixmap = None
+        if m is not None:
+            viewport = widget.viewport() if widget else None
+            dirty = QRect(rect)
+            pixmap = artworkCache.request(
+                f"row:{appId}", m.thumbnail, m.thumbnail_hash, dpr,
+                lambda _: viewport.update(dirty) if viewport else None,
+            )
+        if pixmap is None:
+            pixmap = artworkCache.pixmap(b"", "", dpr)
+        size = pixmap.deviceIndependentSize().toSize()
+        painter.drawPixmap(
+            artRect.left() + (ARTWORK_SIZE - size.width()) // 2,
+            artRect.top() + (ARTWORK_SIZE - size.height()) // 2,
+            pixmap,
+        )
+
+        x = artRect.right() + 2 * MARGIN
+        y = rect.top() + MARGIN + 5
+        font = QFont(option.font)
+        font.setPixelSize(14)
+        painter.setFont(font)
+        painter.setPen(option.palette.text().color())
+        fm = QFontMetrics(font)
+        title = fm.elidedText(m.title if m else PLACEHOLDER_TITLE, Qt.TextElideMode.ElideRight, TEXT_WIDTH)
+        painter.drawText(QRect(x, y, TEXT_WIDTH, fm.height()), Qt.AlignmentFlag.AlignLeft, title)
+        y += fm.height() + 2
+
+        font.setPixelSize(12)
+        painter.setFont(font)
+        painter.setPen(QColor(Qt.GlobalColor.gray))
+        fm = QFontMetrics(font)
+        for text in (m.artist if m else "", roundTripText(appId, index.data(Roles.RoundTrip))):
+            painter.drawText(QRect(x, y, TEXT_WIDTH, fm.height()), Qt.AlignmentFlag.AlignLeft, fm.elidedText(text, Qt.TextElideMode.ElideRight, TEXT_WIDTH))
+            y += fm.height() + 2
+
+        t = index.data(Roles.Timeline)
+        if t is not None and t.duration > 0:
+            bar = self.progressRect(rect)
+            painter.fillRect(bar, option.palette.mid())
+            playing = p is not None and p.playing
+            position = t.positionAt(time.monotonic(), playing, p.playback_rate if p else 1.0)
+            done = round(bar.width() * round(PROGRESS_STEPS * position / t.duration) / PROGRESS_STEPS)
+            painter.fillRect(QRect(bar.left(), bar.top(), done, bar.height()), option.palette.highlight())
+
+        enabled = self.buttonsEnabled(p)
+        icons = {
+            "prev": NowPlayingListItem.iconPrev,
+            "play": NowPlayingListItem.iconPlay if p and p.playback_status == PlaybackStatus.PAUSED else NowPlayingListItem.iconPause,
+            "next": NowPlayingListItem.iconNext,
+        }
+        for name, r in self.buttonRects(rect).items():
+            opt = QStyleOptionButton()
+            opt.rect = r
+            opt.icon = icons[name]
+            opt.iconSize = QSize(16, 16)
+            opt.state = QStyle.StateFlag.State_Raised
+            if enabled[name]:
+                opt.state |= QStyle.StateFlag.State_Enabled
+            style.drawControl(QStyle.ControlElement.CE_PushButton, opt, painter, widget)
+
+        painter.restore()
+
+    def editorEvent(self, event: QEvent, model, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> bool:
+        if event.type() != QEvent.Type.MouseButtonRelease or not isinstance(event, QMouseEvent):
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+        pos = event.position().toPoint()
+        enabled = self.buttonsEnabled(index.data(Roles.Playback))
+        for name, r in self.buttonRects(option.rect).items():
+            if r.contains(pos) and enabled[name]:
+                self.onButton.emit(index.data(Roles.App), name)
+                return True
+        return False
@@ -1,10 +1,11 @@
 import sys
 
-from PySide6.QtGui import QFontMetrics, QPixmap, Qt
+from PySide6.QtGui import QFontMetrics, Qt
 from PySide6.QtWidgets import (
     QApplication,
     QHBoxLayout,
     QLabel,
+    QProgressBar,
     QPushButton,
     QSizePolicy,
     QSlider,
@@ -14,6 +15,13 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QIcon
 
+from np.artwork import ARTWORK_SIZE, artworkCache
+from np.backends import appOf
+from np.media import Controls, MediaData, PlaybackData, PlaybackStatus
+
+PLACEHOLDER_TITLE = "Loading…"
+PROGRESS_STEPS = 1000
+
 
 class NowPlayingListItem(QWidget):
     iconPlay = QIcon.fromTheme(QIcon.ThemeIcon.MediaPlaybackStart)
@@ -21,18 +29,17 @@ class NowPlayingListItem(QWidget):
     iconNext = QIcon.fromTheme(QIcon.ThemeIcon.MediaSkipForward)
     iconPrev = QIcon.fromTheme(QIcon.ThemeIcon.MediaSkipBackward)
 
-    def __init__(self, app_exe, artwork=b"", title="", artist=""):
+    def __init__(self, app_exe, artwork=b"", title="", artist="", artwork_hash=""):
         super().__init__()
 
         # ==== Artwork (Left Column) ====
         self.artwork_label = QLabel()
-        self.artwork_label.setScaledContents(True)
-        pixmap = self.qpixmap_from_bytes(artwork)
-        if pixmap.isNull():
-            pixmap = QPixmap(120, 120)
-            pixmap.fill(Qt.GlobalColor.darkGray)
-        self.artwork_label.setPixmap(pixmap.scaled(120, 120, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-        self.artwork_label.setFixedSize(120, 120)
+        self.artwork_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.artwork_label.setFixedSize(ARTWORK_SIZE, ARTWORK_SIZE)
+        self.artworkKey = None
+        self.artworkTarget = f"item:{id(self)}"
+        self.artwork_label.setPixmap(artworkCache.pixmap(b"", "", self.devicePixelRatioF()))
+        self.setArtwork(artwork, artwork_hash)
 
         # ==== Right Column ====
         # Top Row: Title + Artist + Application
@@ -46,8 +53,9 @@ class NowPlayingListItem(QWidget):
         self.title_label.setText(elided_text)
         self.title_label.setStyleSheet("font-size: 14px;")
 
+        self.app_exe = app_exe
         self.app_exe_label = QLabel()
-        self.app_exe_label.setText(f"{app_exe}")
+        self.app_exe_label.setText(f"{appOf(app_exe)}")
         self.app_exe_label.setStyleSheet("color: gray; font-size: 12px;")
 
         text_layout = QVBoxLayout()
@@ -56,9 +64,15 @@ class NowPlayingListItem(QWidget):
         text_layout.addWidget(self.artist_label)
         text_layout.addWidget(self.app_exe_label)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, PROGRESS_STEPS)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedHeight(4)
+
         # Bottom Row: Control Buttons
         self.prev_button = QPushButton(self.iconPrev, "")
         self.play_button = QPushButton(self.iconPause, "")
+        self.showsPlay = False
         self.next_button = QPushButton(self.iconNext, "")        # self.vol_button = QSlider(Qt.Orientation.Horizontal)
 
         for b in [self.prev_button, self.play_button, self.next_button]:
@@ -74,6 +88,7 @@ class NowPlayingListItem(QWidget):
         # Stack text + controls vertically
         right_layout = QVBoxLayout()
         right_layout.addLayout(text_layout)
+        right_layout.addWidget(self.progress_bar)
         right_layout.addLayout(control_layout)
         right_layout.setContentsMargins(10, 5, 10, 5)
 
@@ -85,12 +100,55 @@ class NowPlayingListItem(QWidget):
         main_layout.addStretch()
         main_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-    def qpixmap_from_bytes(self, data: bytes) -> QPixmap:
-        pixmap = QPixmap()
-        pixmap.loadFromData(data)
-        return pixmap
-
-
+    def setPlayback(self, p: PlaybackData):
+        """only calls the setters whose value changed"""
+        for button, enabled in (
+            (self.next_button, Controls.NEXT in p.controls),
+            (self.prev_button, Controls.PREVIOUS in p.controls),
+            (self.play_button, Controls.PLAY_PAUSE in p.controls),
+        ):
+            if button.isEnabled() != enabled:
+                button.setEnabled(enabled)
+        paused = p.playback_status == PlaybackStatus.PAUSED
+        if paused != self.showsPlay:
+            self.showsPlay = paused
+            self.play_button.setIcon(self.iconPlay if paused else self.iconPause)
+
+    def setMedia(self, m: MediaData):
+        if self.title_label.text() != m.title:
+            self.title_label.setText(m.title)
+        if self.artist_label.text() != m.artist:
+            self.artist_label.setText(m.artist)
+        self.setArtwork(m.thumbnail, m.thumbnail_hash)
+
+    def setArtwork(self, data: bytes | bytearray, thumbnail_hash: str = ""):
+        dpr = self.devicePixelRatioF()
+        key = (thumbnail_hash, dpr) if thumbnail_hash or not data else None
+        if key is not None and key == self.artworkKey:
+            return
+        self.artworkKey = key
+        # until a new decode lands the previous artwork stays up
+        pixmap = artworkCache.request(self.artworkTarget, data, thumbnail_hash, dpr, self.artwork_label.setPixmap)
+        if pixmap is not None:
+            self.artwork_label.setPixmap(pixmap)
+
+    def releaseArtwork(self):
+        artworkCache.cancel(self.artworkTarget)
+
+    def setProgress(self, position: float, duration: float):
+        self.progress_bar.setValue(round(PROGRESS_STEPS * position / duration) if duration > 0 else 0)
+
+    def setRoundTrip(self, seconds: float):
+        self.app_exe_label.setText(roundTripText(self.app_exe, seconds))
+
+
+
+
+def roundTripText(appId: str, seconds: float | None) -> str:
+    """the app label, with the last play/pause round trip when there is one"""
+    if seconds is None:
+        return appOf(appId)
+    return f"{appOf(appId)}  ·  {seconds * 1000:.0f} ms"
 
 
 class _MainWindow(QWidget):
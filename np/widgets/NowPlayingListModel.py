@@ -0,0 +1,99 @@
+from enum import IntEnum
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QPersistentModelIndex, Qt
+
+from np.store import MEDIA, PLAYBACK, TIMELINE, Store
+from np.tracing import tracer
+from np.widgets.FrameBatcher import FrameBatcher
+
+
+class Roles(IntEnum):
+    App = Qt.ItemDataRole.UserRole + 1
+    Media = Qt.ItemDataRole.UserRole + 2
+    Playback = Qt.ItemDataRole.UserRole + 3
+    Timeline = Qt.ItemDataRole.UserRole + 4
+    RoundTrip = Qt.ItemDataRole.UserRole + 5
+
+
+# store field -> role whose data it changes
+FIELD_ROLES = {MEDIA: Roles.Media, PLAYBACK: Roles.Playback, TIMELINE: Roles.Timeline}
+
+
+class NowPlayingListModel(QAbstractListModel):
+    """One row per session, updates are signalled per row"""
+
+    def __init__(self, parent=None, store: Store | None = None):
+        super().__init__(parent)
+        self.store = store if store is not None else Store(self)
+        self.apps: list[str] = []
+        self.rows: dict[str, int] = {}
+        self.roundTrip: dict[str, float] = {}
+        # appId -> roles changed since the last frame
+        self.batcher = FrameBatcher(self._flushRows, self)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.apps)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.apps):
+            return None
+        appId = self.apps[index.row()]
+        if role == Roles.App:
+            return appId
+        if role == Roles.RoundTrip:
+            return self.roundTrip.get(appId)
+        state = self.store.get(appId)
+        if role == Roles.Media:
+            return state.media if state else None
+        if role == Roles.Playback:
+            return state.playback if state else None
+        if role == Roles.Timeline:
+            return state.timeline if state else None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return state.media.title if state and state.media else ""
+        return None
+
+    def addApp(self, appId: str):
+        row = len(self.apps)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.apps.append(appId)
+        self.rows[appId] = row
+        self.endInsertRows()
+
+    def removeApp(self, appId: str):
+        row = self.rows.pop(appId)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.apps.pop(row)
+        for a in self.apps[row:]:
+            self.rows[a] -= 1
+        self.roundTrip.pop(appId, None)
+        self.batcher.discard(appId)
+        self.endRemoveRows()
+
+    def refresh(self, appId: str, fields):
+        """the store changed these fields of appId"""
+        for name in fields:
+            self._rowChanged(appId, FIELD_ROLES[name])
+
+    def updateRoundTrip(self, appId: str, seconds: float):
+        self.roundTrip[appId] = seconds
+        self._rowChanged(appId, Roles.RoundTrip)
+
+    def _rowChanged(self, appId: str, role: Roles):
+        if appId in self.rows:
+            self.batcher.mark(appId, role)
+
+    def _flushRows(self, dirty: dict[str, set]):
+        """one dataChanged per changed row and frame"""
+        for appId, roles in dirty.items():
+            row = self.rows.get(appId)
+            if row is None:
+                continue
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, sorted(roles))
+            if Roles.Playback in roles:
+                tracer.end("playback", appId, "frame")
+            if Roles.Media in roles:
+                tracer.end("props", appId, "frame")
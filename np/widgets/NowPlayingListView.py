@@ -0,0 +1,146 @@
+import sys
+from typing import override
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QListView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from np.artwork import artworkCache
+from np.media import MediaData
+from np.store import PLAYBACK, Store
+from np.widgets.NowPlayingListDelegate import NowPlayingListDelegate
+from np.widgets.NowPlayingListModel import NowPlayingListModel, Roles
+from np.widgets.ProgressTicker import ProgressTicker
+
+# roles whose changes never resize a row, repainting it is enough
+REPAINT_ROLES = frozenset((Roles.Playback, Roles.Timeline, Roles.RoundTrip))
+
+
+class NowPlayingListView(QListView):
+    """
+    Virtualized drop-in for NowPlayingList: same signals, store and refresh(),
+    but rows are painted by a delegate and only visible rows cost anything.
+    """
+
+    onPrev = Signal(str)
+    onPausePlay = Signal(str)
+    onNext = Signal(str)
+
+    def __init__(self, store: Store | None = None):
+        super().__init__()
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+
+        self.listModel = NowPlayingListModel(self, store)
+        self.store = self.listModel.store
+        self.setModel(self.listModel)
+
+        self.delegate = NowPlayingListDelegate(self)
+        self.delegate.onButton.connect(self.handleButton)
+        self.setItemDelegate(self.delegate)
+
+        self.ticker = ProgressTicker(self)
+        self.ticker.tick.connect(self.updateProgress)
+
+    @override
+    def dataChanged(self, topLeft, bottomRight, roles=()):
+        if roles and REPAINT_ROLES.issuperset(roles):
+            # rows have a fixed size, QListView would still queue a relayout of every row
+            QAbstractItemView.dataChanged(self, topLeft, bottomRight, roles)
+            return
+        super().dataChanged(topLeft, bottomRight, roles)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.ticker.setVisible(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.ticker.setVisible(False)
+
+    def handleButton(self, appId: str, name: str):
+        if name == "prev":
+            self.onPrev.emit(appId)
+        elif name == "play":
+            self.onPausePlay.emit(appId)
+        elif name == "next":
+            self.onNext.emit(appId)
+
+    def hasApp(self, appId: str) -> bool:
+        return appId in self.listModel.rows
+
+    def removeApp(self, appId: str):
+        self.listModel.removeApp(appId)
+        self.ticker.setPlaying(appId, False)
+        artworkCache.cancel(f"row:{appId}")
+
+    def addApp(self, appId: str):
+        self.listModel.addApp(appId)
+
+    def refresh(self, appId: str, fields):
+        """the store changed these fields of appId"""
+        self.listModel.refresh(appId, fields)
+        if PLAYBACK in fields:
+            state = self.store.get(appId)
+            playing = state is not None and state.playback is not None and state.playback.playing
+            self.ticker.setPlaying(appId, playing)
+
+    def flush(self):
+        """apply pending updates now instead of at the end of the frame"""
+        self.listModel.batcher.flushNow()
+
+    def setRoundTrip(self, appId: str, seconds: float):
+        self.listModel.updateRoundTrip(appId, seconds)
+
+    def updateProgress(self, now: float):
+        """repaint just the progress bars of visible, playing rows"""
+        viewport = self.viewport().rect()
+        for appId in self.ticker.playing:
+            row = self.listModel.rows.get(appId)
+            if row is None:
+                continue
+            rect = self.visualRect(self.listModel.index(row))
+            if rect.intersects(viewport):
+                self.viewport().update(self.delegate.progressRect(rect))
+
+    def appsByVisibility(self) -> tuple[list[str], list[str]]:
+        """appIds of the rows currently scrolled into view, and of the rest"""
+        viewport = self.viewport().rect()
+        visible, hidden = [], []
+        for row, appId in enumerate(self.listModel.apps):
+            (visible if self.visualRect(self.listModel.index(row)).intersects(viewport) else hidden).append(appId)
+        return visible, hidden
+
+
+if __name__ == "__main__":
+    class _MainWindow(QWidget):
+        def __init__(self):
+            super().__init__()
+            self.setWindowTitle("Now Playing Example")
+            self.list_widget = NowPlayingListView()
+            store = self.list_widget.store
+            store.changed.connect(lambda d: self.list_widget.refresh(d.key, d.fields))
+            for i in range(500):
+                app = f"app{i}.exe"
+                store.add(app)
+                self.list_widget.addApp(app)
+                store.setMedia(
+                    app,
+                    MediaData(app=app, title="Long Track Name Example That Should Ellipsize", artist="Artist One", thumbnail=b"")
+                )
+            layout = QVBoxLayout(self)
+            layout.addWidget(self.list_widget)
+            self.setLayout(layout)
+            self.resize(640, 360)
+
+    app = QApplication(sys.argv)
+    w = _MainWindow()
+    w.show()
+    sys.exit(app.exec())
@@ -0,0 +1,42 @@
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+# progress bars are a few hundred pixels wide, twice a second is smooth enough
+PROGRESS_INTERVAL_MS = 500
+
+
+class ProgressTicker(QObject):
+    """
+    One timer shared by every session in a list.
+    It only runs while the list is visible and at least one session is playing.
+    """
+
+    tick = Signal(float)
+
+    def __init__(self, parent: QObject | None = None, interval: int = PROGRESS_INTERVAL_MS):
+        super().__init__(parent)
+        self.playing: set[str] = set()
+        self.visible = False
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(lambda: self.tick.emit(time.monotonic()))
+
+    def setPlaying(self, appId: str, playing: bool):
+        if playing:
+            self.playing.add(appId)
+        else:
+            self.playing.discard(appId)
+        self._sync()
+
+    def setVisible(self, visible: bool):
+        self.visible = visible
+        self._sync()
+
+    def _sync(self):
+        active = self.visible and bool(self.playing)
+        if active and not self.timer.isActive():
+            self.timer.start()
+            self.tick.emit(time.monotonic())
+        elif not active and self.timer.isActive():
+            self.timer.stop()
@@ -1,12 +1,25 @@
 import os
 import pathlib
 
+TRAY_SIZES = [16, 20, 24, 32, 48, 64]
+
+
+def generate_tray_icons():
+    from PIL import Image
+
+    pkg_dir = pathlib.Path(__file__).parent / ".."
+    icons_dir = pkg_dir / "resources" / "icons"
+    src = Image.open(icons_dir / "play.png").convert("RGBA")
+    for size in TRAY_SIZES:
+        src.resize((size, size), Image.Resampling.LANCZOS).save(icons_dir / f"play-{size}.png", optimize=True)
+
 
 def generate_icons():
     pkg_dir = pathlib.Path(__file__).parent / ".."
     resources_src = pkg_dir / "resources" / "icons.qrc"
-    resources_dst = pkg_dir / "np" / "icons.py"
-    os.system(f'pyside6-rcc "{resources_src}" -o "{resources_dst}"')
+    resources_dst = pkg_dir / "np" / "icons.rcc"
+    os.system(f'pyside6-rcc --binary "{resources_src}" -o "{resources_dst}"')
 
 if __name__ == "__main__":
-    generate_icons()
\ No newline at end of file
+    generate_tray_icons()
+    generate_icons()